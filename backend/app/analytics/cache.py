@@ -0,0 +1,75 @@
+import json
+import time
+import logging
+import threading
+from typing import Any, Callable
+from sqlmodel import Session
+from app.core.config import settings
+from app.core.database import engine
+from app.core.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+ANALYTICS_KEY_PREFIX = "cache:analytics:"
+REFRESH_LOCK_SECONDS = 60
+
+
+def store(key: str, data: Any) -> None:
+    # Kept past the fresh window so stale results can be served while a refresh runs
+    try:
+        redis_client.setex(
+            key,
+            settings.ANALYTICS_CACHE_MAX_STALE_SECONDS,
+            json.dumps({"computedAt": time.time(), "data": data}, default=str),
+        )
+    except Exception:
+        logger.exception(f"Analytics cache write failed for {key}")
+
+
+def _refresh(key: str, lock_key: str, compute: Callable[[Session], Any]) -> None:
+    try:
+        with Session(engine) as session:
+            store(key, compute(session))
+    except Exception:
+        logger.exception(f"Analytics refresh failed for {key}")
+    finally:
+        try:
+            redis_client.delete(lock_key)
+        except Exception:
+            logger.exception(f"Failed to release analytics refresh lock for {key}")
+
+
+def refresh_in_background(key: str, compute: Callable[[Session], Any]) -> None:
+    # One refresh per key across all app processes; everyone else keeps serving the stale copy
+    lock_key = f"{key}:refresh"
+    try:
+        if not redis_client.set(lock_key, "1", nx=True, ex=REFRESH_LOCK_SECONDS):
+            return
+    except Exception:
+        logger.exception(f"Failed to take analytics refresh lock for {key}")
+        return
+    threading.Thread(target=_refresh, args=(key, lock_key, compute), name="analytics-refresh", daemon=True).start()
+
+
+def get_cached_analytics(db: Session, name: str, compute: Callable[[Session], Any]) -> Any:
+    """
+    Stale-while-revalidate cache for analytics results. Fresh entries (younger than
+    ANALYTICS_CACHE_FRESH_SECONDS) are returned as is; older ones are returned immediately and
+    recomputed in the background. Only a cold miss, or Redis being down, computes inline.
+    """
+    key = f"{ANALYTICS_KEY_PREFIX}{name}"
+    try:
+        cached = redis_client.get(key)
+    except Exception:
+        logger.exception(f"Analytics cache read failed for {key}")
+        return compute(db)
+
+    if cached:
+        entry = json.loads(cached)
+        if time.time() - entry["computedAt"] >= settings.ANALYTICS_CACHE_FRESH_SECONDS:
+            refresh_in_background(key, compute)
+        return entry["data"]
+
+    data = compute(db)
+    store(key, data)
+    return data
@@ -0,0 +1,96 @@
+from itertools import chain
+from typing import Optional
+import numpy as np
+from sqlalchemy import text
+from sqlmodel import Session
+from app.analytics.cache import get_cached_analytics
+
+URGENCY_LEVELS = ["routine", "semi-urgent", "urgent"]
+STREAM_BATCH_SIZE = 50000
+
+# Urgencies come back as 0..2 codes and the clinician's final call (override, else the AI's) is
+# resolved in SQL, so every row is three numbers; idx_triage_calibration covers the scan
+CALIBRATION_ROWS = """
+    SELECT
+        LEAST(GREATEST("AIConfidence", 0), 1) AS confidence,
+        array_position(CAST(:levels AS TEXT[]), "AIUrgency"::text) - 1 AS predicted,
+        array_position(CAST(:levels AS TEXT[]), COALESCE("overrideUrgency", "AIUrgency")::text) - 1 AS final
+    FROM ent."TriageCase"
+    WHERE "AIConfidence" IS NOT NULL AND "AIUrgency" IS NOT NULL
+"""
+
+
+def load_calibration_arrays(db: Session, model_version: Optional[str]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Streams rows through a server-side cursor, one batch-sized float array at a time
+    statement = CALIBRATION_ROWS
+    params = {"levels": URGENCY_LEVELS}
+    if model_version is not None:
+        statement += ' AND "AIModelVersion" = :model_version'
+        params["model_version"] = model_version
+    result = db.execute(text(statement).execution_options(yield_per=STREAM_BATCH_SIZE), params)
+
+    chunks = [
+        np.fromiter(chain.from_iterable(rows), dtype=np.float64, count=len(rows) * 3).reshape(-1, 3)
+        for rows in result.partitions()
+    ]
+    if not chunks:
+        empty = np.empty(0)
+        return empty, empty.astype(np.int64), empty.astype(np.int64)
+    data = np.concatenate(chunks)
+    return data[:, 0], data[:, 1].astype(np.int64), data[:, 2].astype(np.int64)
+
+
+def compute_calibration(confidence: np.ndarray, predicted: np.ndarray, final: np.ndarray, bins: int) -> dict:
+    """
+    Treats a case as correctly triaged when the clinician kept the AI's urgency. Reliability bins
+    are equal-width over [0, 1]; ECE is the count-weighted gap between mean confidence and accuracy
+    per bin. Confusion matrix rows are the AI's urgency, columns the final urgency.
+    """
+    levels = len(URGENCY_LEVELS)
+    total = int(confidence.size)
+    correct = predicted == final
+
+    bin_index = np.minimum((confidence * bins).astype(np.int64), bins - 1)
+    counts = np.bincount(bin_index, minlength=bins)
+    confidence_sums = np.bincount(bin_index, weights=confidence, minlength=bins)
+    correct_counts = np.bincount(bin_index, weights=correct, minlength=bins)
+    populated = counts > 0
+    mean_confidence = np.divide(confidence_sums, counts, out=np.zeros(bins), where=populated)
+    accuracy = np.divide(correct_counts, counts, out=np.zeros(bins), where=populated)
+    gaps = np.abs(accuracy - mean_confidence)
+
+    confusion = np.bincount(predicted * levels + final, minlength=levels * levels).reshape(levels, levels)
+    edges = np.linspace(0, 1, bins + 1)
+
+    return {
+        "cases": total,
+        "override_rate": round(1 - float(correct.mean()), 4) if total else 0.0,
+        "expected_calibration_error": round(float((counts * gaps).sum() / total), 4) if total else 0.0,
+        "max_calibration_error": round(float(gaps[populated].max()), 4) if total else 0.0,
+        "reliability": [
+            {
+                "lower": round(float(edges[index]), 4),
+                "upper": round(float(edges[index + 1]), 4),
+                "count": int(counts[index]),
+                "mean_confidence": round(float(mean_confidence[index]), 4),
+                "accuracy": round(float(accuracy[index]), 4),
+                "override_rate": round(float(1 - accuracy[index]), 4) if populated[index] else 0.0,
+            }
+            for index in range(bins)
+        ],
+        "confusion_matrix": {
+            "labels": URGENCY_LEVELS,
+            "counts": confusion.tolist(),
+        },
+    }
+
+
+def get_ai_calibration(db: Session, model_version: Optional[str], bins: int) -> dict:
+    # Cached per model version and bin count; all versions together when model_version is None
+    def compute(session: Session) -> dict:
+        confidence, predicted, final = load_calibration_arrays(session, model_version)
+        return {"model_version": model_version, "bins": bins, **compute_calibration(confidence, predicted, final, bins)}
+
+    # the wildcard gets its own key so no version string (not even "" or "*") can share its entry
+    scope = "all" if model_version is None else f"version:{model_version}"
+    return get_cached_analytics(db, f"calibration:{bins}:{scope}", compute)
@@ -0,0 +1,174 @@
+import logging
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Optional
+from sqlalchemy import delete, func, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel import Session, select
+from app.models import AIDailyRollup, AIDailyTagCount, RollupWatermark
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_NAME = "ai_daily_rollup"
+# rows are stamped by the app before they commit; a day is final once this long has passed after it
+SETTLE_DELAY = timedelta(minutes=10)
+CHUNK_DAYS = 31
+
+# Days are UTC. Each day is recomputed from its raw rows as a whole, so distinct-case counts stay
+# exact; every range filter is on an indexed timestamp, so only the rows being rolled up are read.
+ROLLUP_DAYS = text("""
+    INSERT INTO ent."AIDailyRollup"
+        ("day", "cases", "urgencyOverrides", "summaryOverrides", "feedbackUp", "feedbackDown", "updatedAt")
+    SELECT day, SUM(cases), SUM(urgency), SUM(summary), SUM(up), SUM(down), NOW()
+    FROM (
+        SELECT ("dateCreated" AT TIME ZONE 'UTC')::date AS day,
+               COUNT(*) AS cases, 0 AS urgency, 0 AS summary, 0 AS up, 0 AS down
+        FROM ent."TriageCase"
+        WHERE "dateCreated" >= :start AND "dateCreated" < :end
+        GROUP BY 1
+        UNION ALL
+        SELECT ("changedAt" AT TIME ZONE 'UTC')::date,
+               0,
+               COUNT(DISTINCT "caseID") FILTER (WHERE "fieldName" = 'overrideUrgency'),
+               COUNT(DISTINCT "caseID") FILTER (
+                   WHERE "fieldName" = 'overrideSummary' AND "newValue" IS NOT NULL AND "newValue" <> ''
+               ),
+               0, 0
+        FROM ent."TriageCaseChangelog"
+        WHERE "fieldName" IN ('overrideUrgency', 'overrideSummary')
+          AND "changedAt" >= :start AND "changedAt" < :end
+        GROUP BY 1
+        UNION ALL
+        SELECT ("createdAt" AT TIME ZONE 'UTC')::date,
+               0, 0, 0,
+               COUNT(*) FILTER (WHERE rating = 'up'),
+               COUNT(*) FILTER (WHERE rating = 'down')
+        FROM ent."AIFeedback"
+        WHERE "createdAt" >= :start AND "createdAt" < :end
+        GROUP BY 1
+    ) per_source
+    GROUP BY day
+""")
+
+ROLLUP_TAGS = text("""
+    INSERT INTO ent."AIDailyTagCount" ("day", "tag", "count")
+    SELECT ("createdAt" AT TIME ZONE 'UTC')::date, tag, COUNT(*)
+    FROM ent."AIFeedback", unnest(tags) AS tag
+    WHERE rating = 'down' AND "createdAt" >= :start AND "createdAt" < :end
+    GROUP BY 1, 2
+""")
+
+EARLIEST_ROW = text("""
+    SELECT LEAST(
+        (SELECT MIN("dateCreated") FROM ent."TriageCase"),
+        (SELECT MIN("changedAt") FROM ent."TriageCaseChangelog"
+         WHERE "fieldName" IN ('overrideUrgency', 'overrideSummary')),
+        (SELECT MIN("createdAt") FROM ent."AIFeedback")
+    )
+""")
+
+
+def lock_rollup(db: Session) -> None:
+    # one rollup at a time; concurrent runs would race on the delete-and-insert
+    db.execute(text("SELECT pg_advisory_xact_lock(hashtext('ai-daily-rollup'))"))
+
+
+def day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+def rebuild_days(db: Session, first_day: date, end_day: date) -> None:
+    # Replace the rollups for [first_day, end_day); runs in the caller's transaction
+    start, end = day_start(first_day), day_start(end_day)
+    db.execute(delete(AIDailyRollup).where(AIDailyRollup.day >= first_day).where(AIDailyRollup.day < end_day))
+    db.execute(delete(AIDailyTagCount).where(AIDailyTagCount.day >= first_day).where(AIDailyTagCount.day < end_day))
+    db.execute(ROLLUP_DAYS, {"start": start, "end": end})
+    db.execute(ROLLUP_TAGS, {"start": start, "end": end})
+
+
+def set_watermark(db: Session, position: datetime) -> None:
+    statement = pg_insert(RollupWatermark).values(name=WATERMARK_NAME, position=position, updatedAt=datetime.now(timezone.utc))
+    db.execute(statement.on_conflict_do_update(
+        index_elements=["name"],
+        set_={"position": statement.excluded.position, "updatedAt": statement.excluded.updatedAt},
+    ))
+
+
+def run_rollup(db: Session, since: Optional[date] = None) -> dict:
+    """
+    Bring the daily rollups up to date. Starts at the watermark (or at `since`, to rebuild after a
+    correction, or at the earliest source row on the first run) and recomputes whole days up to and
+    including today, in CHUNK_DAYS transactions. The watermark then moves to the first day that
+    isn't final yet, so the next run re-reads only the open days.
+    """
+    lock_rollup(db)
+    now = datetime.now(timezone.utc)
+    if since is None:
+        watermark = db.get(RollupWatermark, WATERMARK_NAME)
+        if watermark is not None:
+            since = watermark.position.astimezone(timezone.utc).date()
+        else:
+            earliest = db.execute(EARLIEST_ROW).scalar_one()
+            if earliest is None:
+                db.rollback()
+                return {"days": 0, "watermark": None}
+            since = earliest.astimezone(timezone.utc).date()
+
+    end_day = now.date() + timedelta(days=1)
+    final_before = (now - SETTLE_DELAY).date()
+    first_day = since
+    while first_day < end_day:
+        if first_day != since:
+            lock_rollup(db)
+        chunk_end = min(first_day + timedelta(days=CHUNK_DAYS), end_day)
+        rebuild_days(db, first_day, chunk_end)
+        set_watermark(db, day_start(min(chunk_end, final_before)))
+        db.commit()
+        logger.info(f"AI daily rollup rebuilt {first_day} to {chunk_end - timedelta(days=1)}")
+        first_day = chunk_end
+
+    return {"days": (end_day - since).days, "watermark": day_start(final_before).isoformat()}
+
+
+def get_rollup_watermark(db: Session) -> Optional[datetime]:
+    watermark = db.get(RollupWatermark, WATERMARK_NAME)
+    return watermark.position if watermark else None
+
+
+def get_ai_timeseries(db: Session, start: date, end: date):
+    # Reads only the rollup tables: one row per day in [start, end], days without activity as zeros
+    rollups = {
+        rollup.day: rollup
+        for rollup in db.exec(
+            select(AIDailyRollup).where(AIDailyRollup.day >= start).where(AIDailyRollup.day <= end)
+        ).all()
+    }
+    total = func.sum(AIDailyTagCount.count)
+    tags = db.exec(
+        select(AIDailyTagCount.tag, total)
+        .where(AIDailyTagCount.day >= start)
+        .where(AIDailyTagCount.day <= end)
+        .group_by(AIDailyTagCount.tag)
+        .order_by(total.desc())
+    ).all()
+
+    days = []
+    day = start
+    while day <= end:
+        rollup = rollups.get(day)
+        days.append({
+            "day": day,
+            "cases": rollup.cases if rollup else 0,
+            "urgency_override": rollup.urgencyOverrides if rollup else 0,
+            "summary_override": rollup.summaryOverrides if rollup else 0,
+            "feedback_up": rollup.feedbackUp if rollup else 0,
+            "feedback_down": rollup.feedbackDown if rollup else 0,
+        })
+        day += timedelta(days=1)
+
+    return {
+        "start": start,
+        "end": end,
+        "days": days,
+        "tags": [{"tag": tag, "count": int(count)} for tag, count in tags],
+        "final_through": get_rollup_watermark(db),
+    }
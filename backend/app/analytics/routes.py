@@ -1,14 +1,22 @@
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel import Session
 from app.core.dependencies import get_db
 from app.auth.dependencies import get_current_user
 from app.analytics.service import get_ai_analytics
-from app.analytics.schemas import AIAnalyticsResponse
+from app.analytics.rollups import get_ai_timeseries
+from app.analytics.calibration import get_ai_calibration
+from app.analytics.schemas import AIAnalyticsResponse, AITimeseriesResponse, AICalibrationResponse
 from app.models import User
 
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
+DEFAULT_TIMESERIES_DAYS = 30
+MAX_TIMESERIES_DAYS = 3660
+MAX_CALIBRATION_BINS = 100
+
 
 @router.get("/ai", response_model=AIAnalyticsResponse)
 def ai_feedback_analytics(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
@@ -18,3 +26,43 @@ def ai_feedback_analytics(db: Session = Depends(get_db), current_user: User = De
         )
     return get_ai_analytics(db)
 
+
+@router.get("/ai/timeseries", response_model=AITimeseriesResponse)
+def ai_analytics_timeseries(
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    if not current_user.isAdmin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized"
+        )
+    # UTC days, both ends inclusive; defaults to the last 30 days
+    end = end or datetime.now(timezone.utc).date()
+    start = start or end - timedelta(days=DEFAULT_TIMESERIES_DAYS - 1)
+    if start > end:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="start must not be after end")
+    if (end - start).days >= MAX_TIMESERIES_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=f"At most {MAX_TIMESERIES_DAYS} days per request"
+        )
+    return get_ai_timeseries(db, start, end)
+
+
+@router.get("/ai/calibration", response_model=AICalibrationResponse)
+def ai_calibration(
+    model_version: Optional[str] = None,
+    bins: int = 10,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    if not current_user.isAdmin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized"
+        )
+    if not 1 <= bins <= MAX_CALIBRATION_BINS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=f"bins must be between 1 and {MAX_CALIBRATION_BINS}"
+        )
+    return get_ai_calibration(db, model_version, bins)
@@ -1,3 +1,4 @@
+from datetime import date, datetime
 from typing import List, Optional
 from pydantic import BaseModel
 
@@ -28,4 +29,43 @@ class AIAnalyticsResponse(BaseModel):
     cases: CaseCounts
     percentages: PercentageCounts
     ratings: FeedbackCounts
-    tags: List[TagCount]
\ No newline at end of file
+    tags: List[TagCount]
+
+class AIDailyPoint(BaseModel):
+    day: date
+    cases: int
+    urgency_override: int
+    summary_override: int
+    feedback_up: int
+    feedback_down: int
+
+class AITimeseriesResponse(BaseModel):
+    start: date
+    end: date
+    days: List[AIDailyPoint]
+    tags: List[TagCount]
+    # days before this are final; later days are refreshed on every rollup run
+    final_through: Optional[datetime] = None
+
+class ReliabilityBin(BaseModel):
+    lower: float
+    upper: float
+    count: int
+    mean_confidence: float
+    accuracy: float
+    override_rate: float
+
+class ConfusionMatrix(BaseModel):
+    # rows are the AI's urgency, columns the final (clinician) urgency
+    labels: List[str]
+    counts: List[List[int]]
+
+class AICalibrationResponse(BaseModel):
+    model_version: Optional[str] = None
+    bins: int
+    cases: int
+    override_rate: float
+    expected_calibration_error: float
+    max_calibration_error: float
+    reliability: List[ReliabilityBin]
+    confusion_matrix: ConfusionMatrix
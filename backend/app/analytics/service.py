@@ -1,88 +1,81 @@
-from sqlmodel import Session, select
-from sqlalchemy import func, text
-from app.models import TriageCaseChangelog, AIFeedback, TriageCase
+from sqlmodel import Session
+from sqlalchemy import text
+from app.analytics.cache import get_cached_analytics
+
+# One pass per source table: the case total comes from the trigger-maintained counters, the two
+# override counts share a single scan of the override rows (idx_casechangelog_field), and feedback
+# totals, ratings and cases with feedback share one scan of AIFeedback
+AI_ANALYTICS_QUERY = text("""
+    WITH case_totals AS (
+        SELECT COALESCE(SUM(count), 0) AS cases
+        FROM ent."TriageCaseStatusCount"
+    ),
+    overrides AS (
+        SELECT
+            COUNT(DISTINCT "caseID") FILTER (WHERE "fieldName" = 'overrideUrgency') AS urgency_override,
+            COUNT(DISTINCT "caseID") FILTER (
+                WHERE "fieldName" = 'overrideSummary' AND "newValue" IS NOT NULL AND "newValue" <> ''
+            ) AS summary_override
+        FROM ent."TriageCaseChangelog"
+        WHERE "fieldName" IN ('overrideUrgency', 'overrideSummary')
+    ),
+    feedback AS (
+        SELECT
+            COUNT(DISTINCT "caseID") AS with_feedback,
+            COUNT(*) FILTER (WHERE rating IS NOT NULL) AS total,
+            COUNT(*) FILTER (WHERE rating = 'up') AS up,
+            COUNT(*) FILTER (WHERE rating = 'down') AS down
+        FROM ent."AIFeedback"
+    ),
+    tags AS (
+        SELECT COALESCE(
+            jsonb_agg(jsonb_build_object('tag', tag, 'count', count) ORDER BY count DESC),
+            '[]'::jsonb
+        ) AS tags
+        FROM (
+            SELECT tag, COUNT(*) AS count
+            FROM ent."AIFeedback", unnest(tags) AS tag
+            WHERE rating = 'down'
+            GROUP BY tag
+        ) tag_counts
+    )
+    SELECT
+        case_totals.cases,
+        overrides.urgency_override,
+        overrides.summary_override,
+        feedback.with_feedback,
+        feedback.total AS feedback,
+        feedback.up,
+        feedback.down,
+        tags.tags
+    FROM case_totals, overrides, feedback, tags
+""")
 
 def calculate_percentage(part: int, total: int) -> float:
     return round((part / total) * 100, 2) if total > 0 else 0
 
-def get_total_case_count(db: Session) -> int:
-    statement = select(func.count()).select_from(TriageCase)
-    return db.exec(statement).one()
-
-def get_cases_with_urgency_override(db: Session) -> int:
-    statement = select(func.count(func.distinct(TriageCaseChangelog.caseID))).where(
-        TriageCaseChangelog.fieldName == "overrideUrgency"
-    )
-    return db.exec(statement).one()
-
-def get_cases_with_summary_override(db: Session) -> int:
-    statement = select(func.count(func.distinct(TriageCaseChangelog.caseID))).where(
-        TriageCaseChangelog.fieldName == "overrideSummary",
-        TriageCaseChangelog.newValue.is_not(None),
-        TriageCaseChangelog.newValue != "",
-    )
-    return db.exec(statement).one()
-
-def get_cases_with_feedback(db: Session) -> int:
-    statement = select(func.count(func.distinct(AIFeedback.caseID)))
-    return db.exec(statement).one()
-
-def get_total_feedback(db: Session) -> int:
-    statement = select(func.count()).select_from(AIFeedback).where(AIFeedback.rating.is_not(None))
-    return db.exec(statement).one()
-
-def get_feedback_counts(db: Session):
-    statement = (
-        select(AIFeedback.rating, func.count())
-        .group_by(AIFeedback.rating)
-    )
-
-    results = db.exec(statement).all()
-
-    counts = {"up": 0, "down": 0}
-    for rating, count in results:
-        counts[rating] = count
-
-    return counts
-
-
-def get_tag_counts(db: Session):
-    query = text("""
-        SELECT tag, COUNT(*) as count
-        FROM ent."AIFeedback",
-        unnest(tags) as tag
-        WHERE rating = 'down'
-        GROUP BY tag
-        ORDER BY count DESC
-    """)
-
-    result = db.exec(query).all()
-
-    return [{"tag": row[0], "count": row[1]} for row in result]
-
-def get_ai_analytics(db: Session):
-    total_cases = get_total_case_count(db)
-
-    urgency_cases = get_cases_with_urgency_override(db)
-    summary_cases = get_cases_with_summary_override(db)
-    feedback_cases = get_cases_with_feedback(db)
-    total_feedback = get_total_feedback(db)
+def compute_ai_analytics(db: Session):
+    row = db.exec(AI_ANALYTICS_QUERY).one()
+    total_cases = int(row.cases)
 
     return {
         "totals": {
             "cases": total_cases,
-            "feedback": total_feedback,
+            "feedback": row.feedback,
         },
         "cases": {
-            "urgency_override": urgency_cases,
-            "summary_override": summary_cases,
-            "with_feedback": feedback_cases,
+            "urgency_override": row.urgency_override,
+            "summary_override": row.summary_override,
+            "with_feedback": row.with_feedback,
         },
         "percentages": {
-            "urgency_override": calculate_percentage(urgency_cases, total_cases),
-            "summary_override": calculate_percentage(summary_cases, total_cases),
-            "with_feedback": calculate_percentage(feedback_cases, total_cases),
+            "urgency_override": calculate_percentage(row.urgency_override, total_cases),
+            "summary_override": calculate_percentage(row.summary_override, total_cases),
+            "with_feedback": calculate_percentage(row.with_feedback, total_cases),
         },
-        "ratings": get_feedback_counts(db),
-        "tags": get_tag_counts(db),
-    }
\ No newline at end of file
+        "ratings": {"up": row.up, "down": row.down},
+        "tags": row.tags,
+    }
+
+def get_ai_analytics(db: Session):
+    return get_cached_analytics(db, "ai", compute_ai_analytics)
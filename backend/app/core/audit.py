@@ -3,9 +3,11 @@ import hashlib
 import json
 from typing import Optional
 from datetime import datetime, timezone
-from uuid import UUID
+from uuid import UUID, uuid4
+from sqlalchemy import tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlmodel import Session, select
-from app.models import AuditLog
+from app.models import AuditLog, AuditChainHead, AuditChainAnchor
 
 logger = logging.getLogger(__name__)
 
@@ -41,25 +43,103 @@ class AuditService:
     def get_previous_hash(
         db: Session, resource_type: Optional[str], resource_id: Optional[str]
     ) -> Optional[str]:
-        #Retrieve the hash of the most recent audit log for the same resource to maintain a hash chain
+        #Retrieve the current chain head for the resource; a primary-key lookup on AuditChainHead
 
         if not resource_type or not resource_id:
             return None
 
+        key = (resource_type, UUID(resource_id) if isinstance(resource_id, str) else resource_id)
+        head = db.get(AuditChainHead, key)
+        if head is not None:
+            return head.hash
+        return AuditService.get_previous_hashes(db, {key}).get(key)
+
+    def get_previous_hashes(
+        db: Session, resources: set[tuple[str, UUID]]
+    ) -> dict[tuple[str, UUID], str]:
+        # Latest hash per (resourceType, resourceID) read from AuditLog itself, or from the archive
+        # anchor once those entries have been archived. Only used to seed a chain head for resources
+        # whose history predates AuditChainHead.
+        if not resources:
+            return {}
+
+        resource_ids = {resource_id for _, resource_id in resources}
         query = (
-            select(AuditLog.hash)
-            .where(
-                (AuditLog.resourceType == resource_type)
-                & (AuditLog.resourceID == UUID(resource_id) if isinstance(resource_id, str) else AuditLog.resourceID == resource_id)
+            select(AuditLog.resourceType, AuditLog.resourceID, AuditLog.hash)
+            .where(AuditLog.resourceID.in_(resource_ids))
+            .distinct(AuditLog.resourceType, AuditLog.resourceID)
+            .order_by(AuditLog.resourceType, AuditLog.resourceID, AuditLog.timestamp.desc())
+        )
+        anchors = select(AuditChainAnchor.resourceType, AuditChainAnchor.resourceID, AuditChainAnchor.hash).where(
+            AuditChainAnchor.resourceID.in_(resource_ids)
+        )
+        hashes = {
+            (resource_type, resource_id): hash_value
+            for resource_type, resource_id, hash_value in db.exec(anchors).all()
+            if (resource_type, resource_id) in resources
+        }
+        hashes.update({
+            (resource_type, resource_id): hash_value
+            for resource_type, resource_id, hash_value in db.exec(query).all()
+            if (resource_type, resource_id) in resources
+        })
+        return hashes
+
+    def lock_chain_heads(
+        db: Session, resources: set[tuple[str, UUID]]
+    ) -> dict[tuple[str, UUID], Optional[str]]:
+        """
+        Lock the chain head row of each resource (FOR UPDATE, in key order) and return its hash.
+        Concurrent writers to the same resource queue on the row lock until this transaction ends,
+        so each append sees the hash the previous one wrote. Missing heads are created first.
+        """
+        if not resources:
+            return {}
+
+        keys = sorted(resources)
+        locked_query = (
+            select(AuditChainHead.resourceType, AuditChainHead.resourceID, AuditChainHead.hash)
+            .where(tuple_(AuditChainHead.resourceType, AuditChainHead.resourceID).in_(keys))
+            .order_by(AuditChainHead.resourceType, AuditChainHead.resourceID)
+            .with_for_update()
+        )
+        heads = {(resource_type, resource_id): hash_value for resource_type, resource_id, hash_value in db.exec(locked_query).all()}
+
+        missing = [key for key in keys if key not in heads]
+        if missing:
+            seeds = AuditService.get_previous_hashes(db, set(missing))
+            db.execute(
+                pg_insert(AuditChainHead)
+                .values([
+                    {"resourceType": resource_type, "resourceID": resource_id, "hash": seeds.get((resource_type, resource_id))}
+                    for resource_type, resource_id in missing
+                ])
+                .on_conflict_do_nothing(index_elements=["resourceType", "resourceID"])
             )
-            .order_by(AuditLog.timestamp.desc())
-            .limit(1)
+            # a concurrent writer may have created (and advanced) some of these first; re-read under lock
+            heads = {(resource_type, resource_id): hash_value for resource_type, resource_id, hash_value in db.exec(locked_query).all()}
+
+        return heads
+
+    def advance_chain_heads(db: Session, logs: list[AuditLog]) -> None:
+        # Point each locked head at the last log appended for its resource
+        latest = {}
+        for log in logs:
+            if log.resourceType and log.resourceID:
+                latest[(log.resourceType, log.resourceID)] = log
+        if not latest:
+            return
+
+        now = datetime.now(timezone.utc)
+        db.execute(
+            update(AuditChainHead),
+            [
+                {"resourceType": resource_type, "resourceID": resource_id, "hash": log.hash, "logID": log.logID, "updatedAt": now}
+                for (resource_type, resource_id), log in latest.items()
+            ],
         )
-        result = db.exec(query).first()
-        return result if result else None
 
-    def create_log(
-        db: Session,
+    def build_log(
         *,
         action: str,
         status: str,
@@ -70,19 +150,11 @@ class AuditService:
         changeDetails: Optional[dict] = None,
         fields_modified: Optional[list[str]] = None,
         ip: Optional[str] = None,
+        previous_hash: Optional[str] = None,
+        timestamp: Optional[datetime] = None,
+        log_id: Optional[UUID] = None,
     ) -> AuditLog:
-        """
-        Args:
-            db: Database session
-            action: Action performed (e.g., LOGIN_SUCCESS, CREATE_USER, UPDATE_CASE)
-            status: Status of the action (SUCCESS, FAIL)
-            actor_id: UUID of the user who performed the action
-            actor_type: Role/type of actor
-            resource_type: Type of resource affected (USER, PATIENT, TRIAGE_CASE)
-            resource_id: UUID of the resource affected
-            fields_modified: List of field names that were modified
-            ip: IP address of the request origin
-        """
+        #Build an audit log entry chained onto previous_hash, without touching the database.
         # Build changeDetails JSONB
         if fields_modified and changeDetails is None:
             change_details = {
@@ -91,8 +163,9 @@ class AuditService:
             }
         else:
             change_details = changeDetails
-        # Get current timestamp
-        timestamp = datetime.now(timezone.utc)
+        # Entries queued for the background writer carry the time the action happened
+        if timestamp is None:
+            timestamp = datetime.now(timezone.utc)
 
         # Create new audit log
         new_log = AuditLog(
@@ -105,11 +178,11 @@ class AuditService:
             timestamp=timestamp,
             changeDetails=change_details,
             ipAddress=ip,
+            previousHash=previous_hash,
         )
-
-        # Get previous hash for chain
-        previous_hash = AuditService.get_previous_hash(db, resource_type, str(resource_id) if resource_id else None)
-        new_log.previousHash = previous_hash
+        # callers that may retry a write (read rollups) pass a deterministic ID
+        if log_id is not None:
+            new_log.logID = log_id
 
         # Compute hash for this entry
         new_log.hash = AuditService.compute_hash(
@@ -123,9 +196,75 @@ class AuditService:
             timestamp=timestamp.isoformat(),
             previous_hash=previous_hash,
         )
+        return new_log
+
+    def create_log(
+        db: Session,
+        *,
+        action: str,
+        status: str,
+        actor_id: Optional[UUID] = None,
+        actor_type: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        resource_id: Optional[UUID] = None,
+        changeDetails: Optional[dict] = None,
+        fields_modified: Optional[list[str]] = None,
+        ip: Optional[str] = None,
+    ) -> Optional[AuditLog]:
+        """
+        Record an audit entry. While the background AuditWriter is running the entry is queued and
+        written in a batch (returns None); otherwise it is inserted and committed synchronously.
+
+        Args:
+            db: Database session
+            action: Action performed (e.g., LOGIN_SUCCESS, CREATE_USER, UPDATE_CASE)
+            status: Status of the action (SUCCESS, FAIL)
+            actor_id: UUID of the user who performed the action
+            actor_type: Role/type of actor
+            resource_type: Type of resource affected (USER, PATIENT, TRIAGE_CASE)
+            resource_id: UUID of the resource affected
+            fields_modified: List of field names that were modified
+            ip: IP address of the request origin
+        """
+        from app.core.audit_writer import audit_writer
+
+        if audit_writer.is_running():
+            audit_writer.submit({
+                "action": action,
+                "status": status,
+                "actor_id": actor_id,
+                "actor_type": actor_type,
+                "resource_type": resource_type,
+                "resource_id": resource_id,
+                "changeDetails": changeDetails,
+                "fields_modified": fields_modified,
+                "ip": ip,
+                "timestamp": datetime.now(timezone.utc),
+                # fixed up front so a spooled entry keeps its ID and replaying it again is a no-op
+                "log_id": uuid4(),
+            })
+            return None
+
+        # Lock the resource's chain head so a concurrent append can't chain onto the same hash
+        resources = {(resource_type, resource_id)} if resource_type and resource_id else set()
+        heads = AuditService.lock_chain_heads(db, resources)
+
+        new_log = AuditService.build_log(
+            action=action,
+            status=status,
+            actor_id=actor_id,
+            actor_type=actor_type,
+            resource_type=resource_type,
+            resource_id=resource_id,
+            changeDetails=changeDetails,
+            fields_modified=fields_modified,
+            ip=ip,
+            previous_hash=heads.get((resource_type, resource_id)),
+        )
 
         # Insert into database
         db.add(new_log)
+        AuditService.advance_chain_heads(db, [new_log])
         db.commit()
         db.refresh(new_log)
 
@@ -134,3 +273,55 @@ class AuditService:
         )
 
         return new_log
+
+    def create_logs(db: Session, entries: list[dict], commit: bool = True, skip_existing: bool = False) -> list[AuditLog]:
+        """
+        Bulk form of create_log for batch operations.
+
+        Args:
+            db: Database session
+            entries: create_log keyword arguments, one dict per entry, in chain order
+            commit: Commit the batch; pass False to stage it in the caller's transaction (the chain
+                heads stay locked until that transaction ends)
+            skip_existing: Drop entries whose log_id is already stored, so a batch that may have been
+                written before (a replayed spool) is not chained in twice
+        """
+        if skip_existing:
+            keys = [(entry["log_id"], entry["timestamp"]) for entry in entries if entry.get("log_id") and entry.get("timestamp")]
+            if keys:
+                # (logID, timestamp) is the primary key; the timestamp lets Postgres prune partitions
+                existing = set(db.exec(
+                    select(AuditLog.logID).where(tuple_(AuditLog.logID, AuditLog.timestamp).in_(keys))
+                ).all())
+                # the same spooled line can also appear twice in one batch after an interrupted merge
+                unwritten = []
+                for entry in entries:
+                    if entry.get("log_id") in existing:
+                        continue
+                    if entry.get("log_id"):
+                        existing.add(entry["log_id"])
+                    unwritten.append(entry)
+                entries = unwritten
+
+        resources = {
+            (entry["resource_type"], entry["resource_id"])
+            for entry in entries
+            if entry.get("resource_type") and entry.get("resource_id")
+        }
+        heads = AuditService.lock_chain_heads(db, resources)
+
+        logs = []
+        for entry in entries:
+            key = (entry.get("resource_type"), entry.get("resource_id"))
+            new_log = AuditService.build_log(**entry, previous_hash=heads.get(key))
+            if key in resources:
+                heads[key] = new_log.hash
+            logs.append(new_log)
+
+        db.add_all(logs)
+        AuditService.advance_chain_heads(db, logs)
+        if commit:
+            db.commit()
+
+        logger.info(f"Audit logs created in bulk: count={len(logs)}")
+        return logs
@@ -0,0 +1,213 @@
+import json
+import time
+import uuid
+import hashlib
+import logging
+import threading
+from typing import Optional
+from datetime import datetime, timezone
+from sqlmodel import Session, select
+from app.core.config import settings
+from app.core.database import engine
+from app.core.redis import redis_client
+from app.core.audit import AuditService
+from app.models import AuditLog
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_KEY_PREFIX = "audit-rollup:"
+PENDING_BUCKETS_KEY = "audit-rollup:pending"
+# rollup data survives a day of flusher downtime
+ROLLUP_TTL_SECONDS = 24 * 60 * 60
+FLUSH_LOCK_SECONDS = 60
+# logIDs are derived from the rollup key, so a flush retried after a crash can't insert twice
+ROLLUP_NAMESPACE = uuid.UUID("6f1d3c52-3a0e-4d8b-9b3e-5c2f8a7e4b10")
+
+
+def rollup_enabled() -> bool:
+    return settings.AUDIT_READ_ROLLUP_SECONDS > 0
+
+
+def record_read(
+    db: Session,
+    *,
+    action: str,
+    actor_id: Optional[uuid.UUID],
+    actor_type: Optional[str],
+    resource_type: str,
+    params: dict,
+    returned_count: int,
+    ip: Optional[str],
+) -> None:
+    """
+    Account for a read (list) request. With rollups enabled the request is counted in Redis and
+    written later as one summarized AuditLog entry per actor, action and window; otherwise, or if
+    Redis is unavailable, a per-request entry is written as before.
+    """
+    if rollup_enabled():
+        try:
+            add_to_rollup(action, actor_id, actor_type, resource_type, params, returned_count, ip)
+            return
+        except Exception:
+            logger.exception(f"Failed to record {action} in read rollup, writing a per-request audit entry")
+
+    AuditService.create_log(
+        db,
+        action=action,
+        status="SUCCESS",
+        actor_id=actor_id,
+        actor_type=actor_type,
+        resource_type=resource_type,
+        resource_id=None,
+        fields_modified=None,
+        changeDetails={**params, "returned_count": returned_count},
+        ip=ip,
+    )
+
+
+def add_to_rollup(
+    action: str,
+    actor_id: Optional[uuid.UUID],
+    actor_type: Optional[str],
+    resource_type: str,
+    params: dict,
+    returned_count: int,
+    ip: Optional[str],
+) -> None:
+    bucket = int(time.time()) // settings.AUDIT_READ_ROLLUP_SECONDS
+    group = json.dumps([str(actor_id) if actor_id else None, actor_type, action, resource_type])
+    key = f"{ROLLUP_KEY_PREFIX}{bucket}:{hashlib.sha1(group.encode()).hexdigest()}"
+    members_key = f"{ROLLUP_KEY_PREFIX}{bucket}:keys"
+
+    # one round trip; distinct filter combinations and client IPs are counted as separate hash fields
+    pipe = redis_client.pipeline(transaction=False)
+    pipe.hsetnx(key, "group", group)
+    pipe.hincrby(key, "requests", 1)
+    pipe.hincrby(key, "returned", returned_count)
+    pipe.hincrby(key, f"params:{json.dumps(params, sort_keys=True, default=str)}", 1)
+    if ip:
+        pipe.hincrby(key, f"ip:{ip}", 1)
+    pipe.expire(key, ROLLUP_TTL_SECONDS)
+    pipe.sadd(members_key, key)
+    pipe.expire(members_key, ROLLUP_TTL_SECONDS)
+    pipe.zadd(PENDING_BUCKETS_KEY, {str(bucket): bucket})
+    pipe.execute()
+
+
+def rollup_entry(key: str, fields: dict[str, str], window_start: datetime, window_end: datetime) -> dict:
+    actor_id, actor_type, action, resource_type = json.loads(fields["group"])
+    params = [
+        {"params": json.loads(name[len("params:"):]), "count": int(count)}
+        for name, count in fields.items()
+        if name.startswith("params:")
+    ]
+    ips = {name[len("ip:"):]: int(count) for name, count in fields.items() if name.startswith("ip:")}
+    return {
+        "action": action,
+        "status": "SUCCESS",
+        "actor_id": uuid.UUID(actor_id) if actor_id else None,
+        "actor_type": actor_type,
+        "resource_type": resource_type,
+        "resource_id": None,
+        "changeDetails": {
+            "rollup": True,
+            "window_start": window_start.isoformat(),
+            "window_end": window_end.isoformat(),
+            "request_count": int(fields["requests"]),
+            "returned_count": int(fields["returned"]),
+            "params": sorted(params, key=lambda item: -item["count"]),
+            "ips": ips,
+        },
+        "ip": next(iter(ips)) if len(ips) == 1 else None,
+        "timestamp": window_end,
+        "log_id": uuid.uuid5(ROLLUP_NAMESPACE, key),
+    }
+
+
+def flush_read_rollups(db: Session) -> int:
+    """
+    Write one AuditLog entry per rollup group for every closed window. A window is flushed one
+    window after it closes, to leave room for requests still in flight and for clock skew between
+    app servers. Returns the number of entries written.
+    """
+    window = settings.AUDIT_READ_ROLLUP_SECONDS
+    closed_before = int(time.time()) // window - 1
+    written = 0
+    for raw_bucket in redis_client.zrangebyscore(PENDING_BUCKETS_KEY, "-inf", closed_before - 1):
+        bucket = int(raw_bucket)
+        lock_key = f"{ROLLUP_KEY_PREFIX}{bucket}:lock"
+        # every app process runs a flusher; one of them takes each window
+        if not redis_client.set(lock_key, "1", nx=True, ex=FLUSH_LOCK_SECONDS):
+            continue
+        try:
+            members_key = f"{ROLLUP_KEY_PREFIX}{bucket}:keys"
+            keys = [member.decode() for member in redis_client.smembers(members_key)]
+            window_start = datetime.fromtimestamp(bucket * window, timezone.utc)
+            window_end = datetime.fromtimestamp((bucket + 1) * window, timezone.utc)
+
+            entries = []
+            for key in keys:
+                fields = {name.decode(): value.decode() for name, value in redis_client.hgetall(key).items()}
+                if "group" in fields:
+                    entries.append(rollup_entry(key, fields, window_start, window_end))
+
+            if entries:
+                already_written = set(db.exec(
+                    select(AuditLog.logID)
+                    .where(AuditLog.timestamp == window_end)
+                    .where(AuditLog.logID.in_([entry["log_id"] for entry in entries]))
+                ).all())
+                entries = [entry for entry in entries if entry["log_id"] not in already_written]
+            if entries:
+                AuditService.create_logs(db, entries)
+                written += len(entries)
+
+            if keys:
+                redis_client.delete(*keys)
+            redis_client.delete(members_key)
+            redis_client.zrem(PENDING_BUCKETS_KEY, raw_bucket)
+        finally:
+            redis_client.delete(lock_key)
+    if written:
+        logger.info(f"Flushed {written} read rollup audit entries")
+    return written
+
+
+class ReadRollupFlusher:
+    # Background thread that periodically turns closed rollup windows into AuditLog entries
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_running():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="audit-rollup-flusher", daemon=True)
+        self._thread.start()
+        logger.info("Audit read rollup flusher started")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        # open windows stay in Redis and are flushed by the next process to start
+        if not self.is_running():
+            return
+        self._stop.set()
+        self._thread.join(timeout)
+        self._thread = None
+        logger.info("Audit read rollup flusher stopped")
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                with Session(engine) as session:
+                    flush_read_rollups(session)
+            except Exception:
+                logger.exception("Failed to flush audit read rollups")
+
+
+rollup_flusher = ReadRollupFlusher(interval=max(settings.AUDIT_READ_ROLLUP_SECONDS, 1))
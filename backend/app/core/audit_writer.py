@@ -0,0 +1,268 @@
+import os
+import json
+import queue
+import logging
+import threading
+from typing import Optional
+from uuid import UUID
+from datetime import datetime
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session
+from app.core.config import settings
+from app.core.database import engine
+from app.core.audit import AuditService
+
+logger = logging.getLogger(__name__)
+
+# per-process file suffixes, oldest entries first: an unfinished replay predates anything spooled after it
+ADOPT_ORDER = {"replay": 0, "adopting": 1, "": 2}
+
+
+class AuditWriter:
+    # Background writer that takes audit entries off the request path and inserts them in multi-row batches.
+    # Entries that cannot be queued or written (queue full, database unreachable) are appended to a
+    # local JSONL spool and replayed once the database accepts writes again, so none are lost. Entries the
+    # database rejects outright are dead-lettered to a .rejected file next to the spool.
+
+    def __init__(
+        self,
+        max_queue: int,
+        batch_size: int,
+        flush_interval: float,
+        spool_path: str,
+    ):
+        self.queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.spool_base = spool_path
+        self._spool_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_running():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+        logger.info("Audit writer started")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        # Drain whatever is queued before shutdown; anything left after the timeout is spooled
+        if not self.is_running():
+            return
+        self._stop.set()
+        self._thread.join(timeout)
+        leftover = self._drain(self.queue.qsize())
+        if leftover:
+            self._spool(leftover)
+        self._thread = None
+        logger.info("Audit writer stopped")
+
+    def submit(self, entry: dict) -> None:
+        try:
+            self.queue.put_nowait(entry)
+        except queue.Full:
+            logger.warning("Audit queue full, spooling entry to disk")
+            self._spool([entry])
+
+    def _run(self) -> None:
+        self._replay_safely(recover=True)
+        while not self._stop.is_set() or not self.queue.empty():
+            batch = self._collect()
+            if batch:
+                if self._flush(batch):
+                    self._replay_safely()
+
+    def _replay_safely(self, recover: bool = False) -> None:
+        # A failed replay leaves its file in place for the next attempt; it must never stop the writer
+        try:
+            if recover:
+                self._adopt_orphaned_spools()
+            self._replay_spool()
+        except Exception:
+            logger.exception("Audit spool replay failed, will retry after the next flush")
+
+    def _collect(self) -> list[dict]:
+        # Block for the first entry, then take whatever else arrives within flush_interval up to batch_size
+        try:
+            batch = [self.queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+        deadline = datetime.now().timestamp() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - datetime.now().timestamp()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _drain(self, limit: int) -> list[dict]:
+        entries = []
+        for _ in range(limit):
+            try:
+                entries.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return entries
+
+    def _flush(self, batch: list[dict]) -> bool:
+        # Returns False when the database was unavailable and the batch went to the spool
+        try:
+            with Session(engine) as session:
+                AuditService.create_logs(session, batch, skip_existing=True)
+            return True
+        except OperationalError:
+            logger.exception(f"Audit database unavailable, spooling {len(batch)} entries")
+            self._spool(batch)
+            return False
+        except Exception:
+            # one rejected row (e.g. failed resource validation) shouldn't take the rest of the batch with it
+            logger.warning(f"Audit batch of {len(batch)} rejected, retrying entries individually", exc_info=True)
+            for entry in batch:
+                try:
+                    with Session(engine) as session:
+                        AuditService.create_logs(session, [entry], skip_existing=True)
+                except OperationalError:
+                    self._spool([entry])
+                except Exception as e:
+                    logger.exception(f"Audit entry rejected: action={entry.get('action')}, resource={entry.get('resource_type')}:{entry.get('resource_id')}")
+                    self._reject(entry, e)
+            return True
+
+    @property
+    def spool_path(self) -> str:
+        # One spool per process, so workers sharing a directory never replay each other's files
+        return f"{self.spool_base}.{os.getpid()}"
+
+    @property
+    def replay_path(self) -> str:
+        return f"{self.spool_path}.replay"
+
+    @property
+    def rejected_path(self) -> str:
+        return f"{self.spool_path}.rejected"
+
+    def _spool(self, entries: list[dict]) -> None:
+        with self._spool_lock:
+            _append_lines(self.spool_path, [json.dumps(entry, default=str) for entry in entries])
+
+    def _reject(self, entry, error: Exception) -> None:
+        # Dead letter: entries the database refuses are kept for inspection instead of being retried forever
+        with self._spool_lock:
+            _append_lines(self.rejected_path, [json.dumps({"error": str(error), "entry": entry}, default=str)])
+
+    def _adopt_orphaned_spools(self) -> None:
+        # Spools (and unfinished replays) left by processes that have since exited are moved into this
+        # process's spool; a rename claims each file, so two workers starting together can't both take it
+        directory = os.path.dirname(self.spool_base) or "."
+        prefix = os.path.basename(self.spool_base) + "."
+        orphans = []
+        for name in os.listdir(directory):
+            pid, _, suffix = name[len(prefix):].partition(".")
+            if not name.startswith(prefix) or not pid.isdigit() or suffix not in ADOPT_ORDER:
+                continue
+            own = int(pid) == os.getpid()
+            # this process's own leftovers resume through _replay_spool, except an interrupted adoption
+            if (own and suffix != "adopting") or (not own and _process_alive(int(pid))):
+                continue
+            orphans.append((int(pid), ADOPT_ORDER[suffix], os.path.join(directory, name)))
+
+        for pid, _, path in sorted(orphans):
+            claimed = f"{self.spool_path}.adopting"
+            try:
+                os.rename(path, claimed)
+            except FileNotFoundError:
+                continue
+            with self._spool_lock:
+                _move_lines(claimed, self.spool_path)
+            logger.info(f"Adopted audit spool {path} from exited process {pid}")
+
+    def _replay_spool(self) -> None:
+        """
+        Replays the spool through a .replay file that is deleted only once every entry in it has been
+        written, re-spooled or dead-lettered. If a replay is interrupted (crash, error) its file is
+        resumed on the next call, with anything spooled in the meantime appended after it. Entries keep
+        the logID assigned at submit and flushes skip IDs already stored, so batches repeated after a
+        crash mid-replay are not written twice.
+        """
+        with self._spool_lock:
+            if os.path.exists(self.spool_path):
+                if os.path.exists(self.replay_path):
+                    _move_lines(self.spool_path, self.replay_path)
+                else:
+                    os.replace(self.spool_path, self.replay_path)
+            if not os.path.exists(self.replay_path):
+                return
+
+        entries = []
+        with open(self.replay_path) as spool:
+            for line in spool:
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(_restore_entry(json.loads(line)))
+                except ValueError as e:
+                    logger.error(f"Unreadable spooled audit entry, moving it to {self.rejected_path}")
+                    self._reject(line.rstrip("\n"), e)
+        logger.info(f"Replaying {len(entries)} spooled audit entries")
+
+        for start in range(0, len(entries), self.batch_size):
+            batch = entries[start:start + self.batch_size]
+            if not self._flush(batch):
+                # database went away again; the failed batch was re-spooled, keep the rest with it
+                self._spool(entries[start + self.batch_size:])
+                break
+
+        with self._spool_lock:
+            os.remove(self.replay_path)
+
+
+def _append_lines(path: str, lines: list[str]) -> None:
+    with open(path, "a") as spool:
+        for line in lines:
+            spool.write(line + "\n")
+        spool.flush()
+        os.fsync(spool.fileno())
+
+
+def _move_lines(source: str, destination: str) -> None:
+    # Append source to destination, then drop source; a crash in between repeats lines (skipped by logID) rather than losing them
+    with open(source) as spool:
+        lines = [line.rstrip("\n") for line in spool if line.strip()]
+    _append_lines(destination, lines)
+    os.remove(source)
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _restore_entry(entry: dict) -> dict:
+    # Undo the string coercion applied when the entry was spooled
+    for key in ("actor_id", "resource_id", "log_id"):
+        if entry.get(key):
+            entry[key] = UUID(entry[key])
+    if entry.get("timestamp"):
+        entry["timestamp"] = datetime.fromisoformat(entry["timestamp"])
+    return entry
+
+
+audit_writer = AuditWriter(
+    max_queue=settings.AUDIT_QUEUE_MAX,
+    batch_size=settings.AUDIT_BATCH_SIZE,
+    flush_interval=settings.AUDIT_FLUSH_INTERVAL_SECONDS,
+    spool_path=settings.AUDIT_SPOOL_PATH,
+)
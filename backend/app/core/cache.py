@@ -0,0 +1,128 @@
+import json
+import hashlib
+import logging
+from typing import Optional
+from uuid import UUID
+from sqlmodel import Session, select
+from app.core.redis import redis_client
+from app.models import TriageCase
+
+logger = logging.getLogger(__name__)
+
+CASE_CACHE_TTL_SECONDS = 60
+CASE_KEY_PREFIX = "cache:triage_case:"
+# bumped per case on every write, like the list version below; outlives any entry cached under it
+CASE_GENERATION_TTL_SECONDS = 86400
+CASE_LIST_KEY_PREFIX = "cache:triage_cases:"
+# bumped on every case write so cached list pages are orphaned rather than scanned for and deleted
+CASE_LIST_VERSION_KEY = "cache:triage_cases:version"
+CACHE_STATS_KEY = "cache:triage_cases:stats"
+
+
+def _record(kind: str, outcome: str) -> None:
+    try:
+        redis_client.hincrby(CACHE_STATS_KEY, f"{kind}:{outcome}", 1)
+    except Exception:
+        logger.debug("Failed to record cache stats")
+
+
+def _list_key(params: dict) -> str:
+    version = int(redis_client.get(CASE_LIST_VERSION_KEY) or 0)
+    digest = hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()[:32]
+    return f"{CASE_LIST_KEY_PREFIX}v{version}:{digest}"
+
+
+def _case_generation_key(case_id: UUID) -> str:
+    return f"{CASE_KEY_PREFIX}{case_id}:generation"
+
+
+def _case_key(case_id: UUID) -> str:
+    generation = int(redis_client.get(_case_generation_key(case_id)) or 0)
+    return f"{CASE_KEY_PREFIX}{case_id}:g{generation}"
+
+
+def get_cached_case(case_id: UUID) -> tuple[Optional[str], Optional[str]]:
+    """
+    Returns (key, cached TriageCasePublic JSON); the JSON is None on miss or Redis failure. Pass the
+    key back to cache_case so a case read before a concurrent write is stored under the pre-write
+    generation and never served afterwards.
+    """
+    try:
+        key = _case_key(case_id)
+        cached = redis_client.get(key)
+    except Exception:
+        logger.exception(f"Case cache read failed for {case_id}")
+        key, cached = None, None
+    _record("case", "hit" if cached else "miss")
+    return key, cached
+
+
+def cache_case(key: Optional[str], payload: str) -> None:
+    if key is None:
+        return
+    try:
+        redis_client.setex(key, CASE_CACHE_TTL_SECONDS, payload)
+    except Exception:
+        logger.exception(f"Case cache write failed for {key}")
+
+
+def get_cached_case_list(params: dict) -> tuple[Optional[str], Optional[str]]:
+    """
+    Returns (key, cached JSON). Pass the key back to cache_case_list so a page read before a
+    concurrent write is stored under the pre-write version and never served afterwards.
+    """
+    try:
+        key = _list_key(params)
+        cached = redis_client.get(key)
+    except Exception:
+        logger.exception("Case list cache read failed")
+        key, cached = None, None
+    _record("list", "hit" if cached else "miss")
+    return key, cached
+
+
+def cache_case_list(key: Optional[str], payload: str) -> None:
+    if key is None:
+        return
+    try:
+        redis_client.setex(key, CASE_CACHE_TTL_SECONDS, payload)
+    except Exception:
+        logger.exception("Case list cache write failed")
+
+
+def invalidate_cases(*case_ids: UUID) -> None:
+    # Orphan the given cases and every cached list page; call after the write commits
+    try:
+        pipeline = redis_client.pipeline()
+        for case_id in case_ids:
+            pipeline.incr(_case_generation_key(case_id))
+            pipeline.expire(_case_generation_key(case_id), CASE_GENERATION_TTL_SECONDS)
+        pipeline.incr(CASE_LIST_VERSION_KEY)
+        pipeline.execute()
+    except Exception:
+        logger.exception(f"Case cache invalidation failed for {case_ids}")
+
+
+def invalidate_patient_cases(db: Session, patient_id: UUID) -> None:
+    # Patient fields are embedded in every TriageCasePublic for that patient
+    try:
+        case_ids = db.exec(select(TriageCase.caseID).where(TriageCase.patientID == patient_id)).all()
+    except Exception:
+        logger.exception(f"Failed to look up cases to invalidate for patient {patient_id}")
+        return
+    invalidate_cases(*case_ids)
+
+
+def get_cache_stats() -> dict:
+    raw = {key.decode(): int(value) for key, value in redis_client.hgetall(CACHE_STATS_KEY).items()}
+    stats = {}
+    for kind in ("case", "list"):
+        hits = raw.get(f"{kind}:hit", 0)
+        misses = raw.get(f"{kind}:miss", 0)
+        total = hits + misses
+        stats[kind] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / total, 4) if total else 0.0,
+        }
+    return stats
@@ -1,3 +1,4 @@
+from typing import Optional
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
@@ -35,6 +36,26 @@ class Settings(BaseSettings):
     AWS_REGION: str
     S3_BUCKET_NAME: str
 
+    AUDIT_ASYNC_ENABLED: bool = True
+    AUDIT_QUEUE_MAX: int = 10000
+    AUDIT_BATCH_SIZE: int = 500
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = 0.5
+    # each process spools to {AUDIT_SPOOL_PATH}.{pid}; spools left by exited processes are adopted on startup
+    AUDIT_SPOOL_PATH: str = "audit_spool.jsonl"
+    # window for summarizing list/read audit events into one entry per actor and action; 0 logs every request
+    AUDIT_READ_ROLLUP_SECONDS: int = 60
+    AUDIT_VERIFY_WORKERS: int = 4
+    AUDIT_RETENTION_MONTHS: int = 12
+    AUDIT_PARTITIONS_AHEAD: int = 3
+    AUDIT_ARCHIVE_PREFIX: str = "audit-archive"
+    AUDIT_EXPORT_PREFIX: str = "audit-exports"
+    # PEM-encoded Ed25519 private key for Merkle checkpoint signatures; checkpoints are unsigned without it
+    AUDIT_SIGNING_KEY: Optional[str] = None
+
+    # analytics results are served from Redis for this long, then served stale while one process recomputes
+    ANALYTICS_CACHE_FRESH_SECONDS: int = 60
+    ANALYTICS_CACHE_MAX_STALE_SECONDS: int = 900
+
     @property
     def SQLALCHEMY_DATABASE_URL(self) -> str:
         return f"postgresql://{self.DB_USER}:{self.DB_PW}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
@@ -0,0 +1,61 @@
+import json
+import logging
+from typing import Optional
+from datetime import datetime, timezone
+from uuid import UUID
+from fastapi import Request
+from app.core.redis import redis_client, async_redis_client
+
+logger = logging.getLogger(__name__)
+
+CASE_EVENTS_CHANNEL = "triage-case-events"
+KEEPALIVE_SECONDS = 15
+
+
+def publish_case_event(
+    event: str,
+    case_id: Optional[UUID] = None,
+    *,
+    actor_id: Optional[UUID] = None,
+    status: Optional[str] = None,
+    urgency: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    case_ids: Optional[list[UUID]] = None,
+) -> None:
+    # Publish a small case delta to subscribers; failures are logged and never fail the mutation
+    payload = {
+        "event": event,
+        "caseID": str(case_id) if case_id else None,
+        "status": status,
+        "urgency": urgency,
+        "fields": fields,
+        "actorID": str(actor_id) if actor_id else None,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+    if case_ids is not None:
+        payload["caseIDs"] = [str(id) for id in case_ids]
+
+    try:
+        redis_client.publish(CASE_EVENTS_CHANNEL, json.dumps(payload))
+    except Exception:
+        logger.exception(f"Failed to publish case event: {event} {case_id}")
+
+
+async def stream_case_events(request: Request):
+    # Server-sent events relay from the Redis channel, with periodic keepalive comments
+    pubsub = async_redis_client.pubsub()
+    await pubsub.subscribe(CASE_EVENTS_CHANNEL)
+    try:
+        yield "retry: 5000\n\n"
+        while not await request.is_disconnected():
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=KEEPALIVE_SECONDS)
+            if message is None:
+                yield ": keepalive\n\n"
+                continue
+
+            data = message["data"].decode() if isinstance(message["data"], bytes) else message["data"]
+            event = json.loads(data).get("event", "message")
+            yield f"event: {event}\ndata: {data}\n\n"
+    finally:
+        await pubsub.unsubscribe(CASE_EVENTS_CHANNEL)
+        await pubsub.aclose()
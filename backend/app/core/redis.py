@@ -1,4 +1,8 @@
 import redis
+import redis.asyncio as aioredis
 from app.core.config import settings
 
 redis_client = redis.Redis.from_url(settings.REDIS_URL)
+
+# used by long-lived streaming endpoints so idle subscribers don't hold threadpool workers
+async_redis_client = aioredis.Redis.from_url(settings.REDIS_URL)
@@ -0,0 +1,117 @@
+import uuid
+import logging
+from typing import Any, Iterable, List, Optional, Type, TypeVar
+from fastapi import Request
+from sqlalchemy import inspect, update
+from sqlmodel import Session, SQLModel
+from app.core.audit import AuditService
+from app.core.audit_middleware import get_audit_meta
+from app.models import User
+from app.utils.changelog import log_changes, log_changes_bulk
+
+logger = logging.getLogger(__name__)
+
+ModelType = TypeVar("ModelType", bound=SQLModel)
+
+
+class UnitOfWork:
+    """
+    Stages a mutation, its changelog rows and its audit entries in the request's transaction and
+    commits them together, so the audit entry can't be lost when the change commits or outlive it
+    when the change rolls back. Entries staged here are written synchronously and deliberately skip
+    the background AuditWriter, which only guarantees eventual delivery; every create, update and
+    delete of a case or patient goes through here. Events that don't change a record (logins,
+    reads, exports) keep using AuditService.create_log and the writer.
+
+    Usage:
+        uow = UnitOfWork(db, current_user, request)
+        uow.log_changes(case, updates, TriageCaseChangelog, 'caseID', case.caseID)
+        case = uow.update(TriageCase, case.caseID, updates)
+        uow.audit("UPDATE_CASE", "TRIAGE_CASE", case.caseID, fields_modified=list(updates))
+        response = ...  # build from the returned rows before commit; commit expires them
+        uow.commit()
+    """
+
+    def __init__(self, db: Session, actor: User, request: Optional[Request] = None):
+        self.db = db
+        self.actor = actor
+        self.ip = (get_audit_meta(request) if request is not None else {"ip": None}).get("ip")
+        self.audit_entries: list[dict] = []
+
+    def log_changes(
+        self,
+        old_record: SQLModel,
+        new_values: dict[str, Any],
+        changelog_model: Type[SQLModel],
+        foreign_key_field: str,
+        record_id: uuid.UUID,
+        exclude_fields: List[str] = None,
+    ) -> int:
+        return log_changes(
+            session=self.db,
+            old_record=old_record,
+            new_values=new_values,
+            changelog_model=changelog_model,
+            foreign_key_field=foreign_key_field,
+            record_id=record_id,
+            user_id=self.actor.userID,
+            exclude_fields=exclude_fields,
+        )
+
+    def log_changes_bulk(
+        self,
+        changes: Iterable[tuple[Optional[SQLModel], dict[str, Any], uuid.UUID]],
+        changelog_model: Type[SQLModel],
+        foreign_key_field: str,
+        exclude_fields: List[str] = None,
+    ) -> int:
+        return log_changes_bulk(
+            session=self.db,
+            changes=changes,
+            changelog_model=changelog_model,
+            foreign_key_field=foreign_key_field,
+            user_id=self.actor.userID,
+            exclude_fields=exclude_fields,
+        )
+
+    def update(self, model: Type[ModelType], key: Any, values: dict[str, Any]) -> ModelType:
+        # UPDATE ... RETURNING: the row (including generated columns) comes back with the write,
+        # and any copy already in the session is refreshed from it instead of re-selected
+        primary_key = inspect(model).primary_key[0]
+        statement = update(model).where(primary_key == key).values(**values).returning(model)
+        return self.db.execute(statement).scalar_one()
+
+    def audit(
+        self,
+        action: str,
+        resource_type: str,
+        resource_id: Optional[uuid.UUID],
+        *,
+        fields_modified: Optional[list[str]] = None,
+        changeDetails: Optional[dict] = None,
+        status: str = "SUCCESS",
+    ) -> None:
+        self.audit_entries.append({
+            "action": action,
+            "status": status,
+            "actor_id": self.actor.userID,
+            "actor_type": self.actor.role,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "changeDetails": changeDetails,
+            "fields_modified": fields_modified,
+            "ip": self.ip,
+        })
+
+    def flush_audit(self) -> None:
+        # Insert the entries staged so far now, still uncommitted. Call before deleting the audited row:
+        # trg_validate_audit_resource rejects entries for resources that no longer exist.
+        if self.audit_entries:
+            # locks the affected chain heads until the transaction ends
+            AuditService.create_logs(self.db, self.audit_entries, commit=False)
+            self.db.flush()
+        self.audit_entries = []
+
+    def commit(self) -> None:
+        self.flush_audit()
+        self.db.commit()
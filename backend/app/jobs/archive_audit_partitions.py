@@ -0,0 +1,239 @@
+# Monthly AuditLog maintenance: python -m app.jobs.archive_audit_partitions [--dry-run]
+# Creates the upcoming monthly partitions, then moves every partition older than
+# AUDIT_RETENTION_MONTHS to object storage as gzip JSONL plus its hash-chain checkpoints.
+import os
+import re
+import gzip
+import json
+import hashlib
+import argparse
+import logging
+import tempfile
+from typing import Optional
+from datetime import date, datetime, timezone
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel import Session, select
+from app.core.config import settings
+from app.core.database import engine
+from app.core.s3 import s3_client, BUCKET_NAME
+from app.models import AuditArchive, AuditChainAnchor
+
+logger = logging.getLogger(__name__)
+
+STREAM_BATCH_SIZE = 10000
+PARTITION_NAME = re.compile(r"^AuditLog_(\d{4})_(\d{2})$")
+
+ATTACHED_PARTITIONS = text("""
+    SELECT child.relname
+    FROM pg_inherits i
+    JOIN pg_class parent ON parent.oid = i.inhparent
+    JOIN pg_class child ON child.oid = i.inhrelid
+    JOIN pg_namespace ns ON ns.oid = parent.relnamespace
+    WHERE ns.nspname = 'ent' AND parent.relname = 'AuditLog'
+""")
+
+ENSURE_PARTITION = text("SELECT ent.ensure_audit_partition(CAST(:month_start AS DATE))")
+
+
+def add_months(month_start: date, months: int) -> date:
+    index = month_start.year * 12 + month_start.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_range(partition_name: str) -> Optional[tuple[datetime, datetime]]:
+    match = PARTITION_NAME.match(partition_name)
+    if not match:
+        return None
+    start = date(int(match.group(1)), int(match.group(2)), 1)
+    end = add_months(start, 1)
+    return (
+        datetime(start.year, start.month, 1, tzinfo=timezone.utc),
+        datetime(end.year, end.month, 1, tzinfo=timezone.utc),
+    )
+
+
+def ensure_upcoming_partitions(session: Session, today: date) -> None:
+    # Keep AUDIT_PARTITIONS_AHEAD months ready so inserts never fall through to the default partition
+    current = today.replace(day=1)
+    for offset in range(settings.AUDIT_PARTITIONS_AHEAD + 1):
+        partition_name = session.execute(ENSURE_PARTITION, {"month_start": add_months(current, offset)}).scalar_one()
+        logger.info(f"Partition ready: {partition_name}")
+    session.commit()
+
+
+def detach_expired_partitions(session: Session, cutoff: datetime, dry_run: bool) -> None:
+    # Detaching first freezes the partition: nothing can write to it while it is exported
+    for (partition_name,) in session.execute(ATTACHED_PARTITIONS).all():
+        bounds = month_range(partition_name)
+        if bounds is None or bounds[1] > cutoff:
+            continue
+        if dry_run:
+            logger.info(f"Would archive {partition_name}")
+            continue
+
+        session.execute(text("SET LOCAL lock_timeout = '5s'"))
+        session.execute(text(f'ALTER TABLE ent."AuditLog" DETACH PARTITION ent."{partition_name}"'))
+        session.add(AuditArchive(partitionName=partition_name, rangeStart=bounds[0], rangeEnd=bounds[1]))
+        session.commit()
+        logger.info(f"Detached {partition_name}")
+
+
+def export_partition(session: Session, archive: AuditArchive, data_file, checkpoint_file) -> tuple[int, dict]:
+    """
+    Stream the detached partition to gzip JSONL ordered by chain, and write one checkpoint line per
+    chain with the hash of its last entry in this partition. Returns (row count, checkpoints).
+    """
+    rows = session.execute(
+        text(f'SELECT * FROM ent."{archive.partitionName}" ORDER BY "resourceType", "resourceID", "timestamp", "logID"')
+        .execution_options(yield_per=STREAM_BATCH_SIZE)
+    ).mappings()
+
+    row_count = 0
+    checkpoints = {}
+    with gzip.open(data_file, "wt") as data:
+        for row in rows:
+            record = dict(row)
+            # the exact string AuditService hashed, so the archive can be re-verified offline
+            record["timestamp"] = row["timestamp"].astimezone(timezone.utc).isoformat()
+            data.write(json.dumps(record, default=str) + "\n")
+            row_count += 1
+
+            if row["resourceType"] and row["resourceID"] and row["hash"]:
+                key = (row["resourceType"], row["resourceID"])
+                chain = checkpoints.setdefault(key, {"hashes": set(), "previous": set(), "entries": 0, "last": None})
+                chain["hashes"].add(row["hash"])
+                if row["previousHash"]:
+                    chain["previous"].add(row["previousHash"])
+                chain["entries"] += 1
+                chain["last"] = row["hash"]
+
+    tips = {}
+    with gzip.open(checkpoint_file, "wt") as checkpoint:
+        for (resource_type, resource_id), chain in checkpoints.items():
+            # the chain tip is the entry nothing else links to; normally that is the latest one
+            unreferenced = chain["hashes"] - chain["previous"]
+            tip = chain["last"]
+            if unreferenced and tip not in unreferenced:
+                tip = next(iter(unreferenced))
+            tips[(resource_type, resource_id)] = tip
+            checkpoint.write(json.dumps({
+                "resourceType": resource_type,
+                "resourceID": str(resource_id),
+                "hash": tip,
+                "entries": chain["entries"],
+            }) + "\n")
+    return row_count, tips
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def archive_partition(session: Session, archive: AuditArchive) -> None:
+    prefix = f"{settings.AUDIT_ARCHIVE_PREFIX}/{archive.rangeStart:%Y/%m}/{archive.partitionName}"
+    data_key = f"{prefix}.jsonl.gz"
+    checkpoint_key = f"{prefix}.checkpoints.jsonl.gz"
+    manifest_key = f"{prefix}.manifest.json"
+
+    with tempfile.TemporaryDirectory() as workdir:
+        data_path = os.path.join(workdir, "data.jsonl.gz")
+        checkpoint_path = os.path.join(workdir, "checkpoints.jsonl.gz")
+        row_count, tips = export_partition(session, archive, data_path, checkpoint_path)
+        sha256 = file_sha256(data_path)
+
+        s3_client.upload_file(data_path, BUCKET_NAME, data_key)
+        s3_client.upload_file(checkpoint_path, BUCKET_NAME, checkpoint_key)
+        uploaded = s3_client.head_object(Bucket=BUCKET_NAME, Key=data_key)
+        if uploaded["ContentLength"] != os.path.getsize(data_path):
+            raise RuntimeError(f"Upload of {data_key} is incomplete; keeping {archive.partitionName}")
+
+    s3_client.put_object(
+        Bucket=BUCKET_NAME,
+        Key=manifest_key,
+        Body=json.dumps({
+            "partition": archive.partitionName,
+            "rangeStart": archive.rangeStart.isoformat(),
+            "rangeEnd": archive.rangeEnd.isoformat(),
+            "rows": row_count,
+            "sha256": sha256,
+            "data": data_key,
+            "checkpoints": checkpoint_key,
+        }, indent=2).encode(),
+        ContentType="application/json",
+    )
+
+    # anchors, archive record and the drop commit together; a crash before this leaves the
+    # partition detached and the next run exports it again
+    if tips:
+        anchor_rows = [
+            {
+                "resourceType": resource_type,
+                "resourceID": resource_id,
+                "hash": tip,
+                "archiveID": archive.archiveID,
+                "rangeEnd": archive.rangeEnd,
+            }
+            for (resource_type, resource_id), tip in tips.items()
+        ]
+        for start in range(0, len(anchor_rows), STREAM_BATCH_SIZE):
+            statement = pg_insert(AuditChainAnchor).values(anchor_rows[start:start + STREAM_BATCH_SIZE])
+            session.execute(
+                statement.on_conflict_do_update(
+                    index_elements=["resourceType", "resourceID"],
+                    set_={"hash": statement.excluded.hash, "archiveID": statement.excluded.archiveID, "rangeEnd": statement.excluded.rangeEnd},
+                    where=AuditChainAnchor.rangeEnd < statement.excluded.rangeEnd,
+                )
+            )
+
+    archive.status = "archived"
+    archive.objectKey = data_key
+    archive.checkpointKey = checkpoint_key
+    archive.rowCount = row_count
+    archive.sha256 = sha256
+    archive.archivedAt = datetime.now(timezone.utc)
+    session.add(archive)
+    session.execute(text(f'DROP TABLE ent."{archive.partitionName}"'))
+    session.commit()
+    logger.info(f"Archived {archive.partitionName}: rows={row_count}, chains={len(tips)}, object={data_key}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Create upcoming AuditLog partitions and archive expired ones")
+    parser.add_argument("--dry-run", action="store_true", help="only report which partitions would be archived")
+    args = parser.parse_args()
+
+    today = datetime.now(timezone.utc).date()
+    cutoff_month = add_months(today.replace(day=1), -settings.AUDIT_RETENTION_MONTHS)
+    cutoff = datetime(cutoff_month.year, cutoff_month.month, 1, tzinfo=timezone.utc)
+
+    with Session(engine) as session:
+        if not args.dry_run:
+            ensure_upcoming_partitions(session, today)
+        detach_expired_partitions(session, cutoff, args.dry_run)
+        if args.dry_run:
+            return 0
+
+        pending = session.exec(
+            select(AuditArchive).where(AuditArchive.status == "detached").order_by(AuditArchive.rangeStart)
+        ).all()
+        failures = 0
+        for archive in pending:
+            try:
+                archive_partition(session, archive)
+            except Exception:
+                session.rollback()
+                failures += 1
+                logger.exception(f"Failed to archive {archive.partitionName}; it stays detached for the next run")
+
+    print(json.dumps({"archived": len(pending) - failures, "failed": failures}))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    raise SystemExit(main())
@@ -0,0 +1,64 @@
+# One-off backfill for TriageCase."previousUrgency" / "reviewedByEmail": python -m app.jobs.backfill_case_denorm
+import json
+import logging
+from sqlalchemy import text
+from sqlmodel import Session
+from app.core.database import engine
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 5000
+
+NEXT_BATCH = text("""
+    SELECT "caseID" FROM ent."TriageCase"
+    WHERE CAST(:after AS UUID) IS NULL OR "caseID" > CAST(:after AS UUID)
+    ORDER BY "caseID"
+    LIMIT :limit
+""")
+
+BACKFILL_REVIEWER_EMAIL = text("""
+    UPDATE ent."TriageCase" c
+    SET "reviewedByEmail" = u."email"
+    FROM ent."User" u
+    WHERE c."reviewedBy" = u."userID"
+      AND c."caseID" = ANY(:case_ids)
+      AND c."reviewedByEmail" IS DISTINCT FROM u."email"
+""")
+
+BACKFILL_PREVIOUS_URGENCY = text("""
+    UPDATE ent."TriageCase" c
+    SET "previousUrgency" = CASE WHEN c."overrideUrgency" IS NULL THEN NULL ELSE l."oldValue" END
+    FROM (
+        SELECT DISTINCT ON ("caseID") "caseID", "oldValue"
+        FROM ent."TriageCaseChangelog"
+        WHERE "fieldName" = 'overrideUrgency' AND "caseID" = ANY(:case_ids)
+        ORDER BY "caseID", "changedAt" DESC
+    ) l
+    WHERE c."caseID" = l."caseID"
+      AND c."previousUrgency" IS DISTINCT FROM (CASE WHEN c."overrideUrgency" IS NULL THEN NULL ELSE l."oldValue" END)
+""")
+
+
+def backfill() -> dict[str, int]:
+    # Walks TriageCase by caseID in short transactions so the backfill doesn't hold long row locks
+    totals = {"cases": 0, "reviewedByEmail": 0, "previousUrgency": 0}
+    after = None
+    while True:
+        with Session(engine) as session:
+            case_ids = session.exec(NEXT_BATCH, params={"after": after, "limit": BATCH_SIZE}).scalars().all()
+            if not case_ids:
+                break
+
+            totals["reviewedByEmail"] += session.exec(BACKFILL_REVIEWER_EMAIL, params={"case_ids": case_ids}).rowcount
+            totals["previousUrgency"] += session.exec(BACKFILL_PREVIOUS_URGENCY, params={"case_ids": case_ids}).rowcount
+            session.commit()
+
+        totals["cases"] += len(case_ids)
+        after = str(case_ids[-1])
+        logger.info(f"Backfilled through caseID {after} ({totals['cases']} cases scanned)")
+    return totals
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    print(json.dumps(backfill(), indent=2))
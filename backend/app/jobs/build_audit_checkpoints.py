@@ -0,0 +1,35 @@
+# Periodic job: python -m app.jobs.build_audit_checkpoints
+import json
+import argparse
+import logging
+from sqlmodel import Session
+from app.core.database import engine
+from app.utils.audit_merkle import build_checkpoint, queue_uncheckpointed
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build Merkle checkpoints over queued audit entries")
+    parser.add_argument(
+        "--backfill",
+        action="store_true",
+        help="first queue entries written before AuditMerklePending existed (run once after upgrading)",
+    )
+    args = parser.parse_args()
+
+    checkpoints = []
+    queued = 0
+    with Session(engine) as session:
+        if args.backfill:
+            queued = queue_uncheckpointed(session)
+        # one checkpoint per MERKLE_BATCH_SIZE entries until the backlog is covered
+        while (checkpoint := build_checkpoint(session)) is not None:
+            checkpoints.append({"sequence": checkpoint.sequence, "leafCount": checkpoint.leafCount, "rootHash": checkpoint.rootHash})
+    print(json.dumps({"queued": queued, "created": len(checkpoints), "checkpoints": checkpoints}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    raise SystemExit(main())
@@ -0,0 +1,20 @@
+# Periodic job: python -m app.jobs.reconcile_case_counts
+import json
+import logging
+from sqlmodel import Session
+from app.core.database import engine
+from app.utils.case_counts import reconcile_case_counts
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> int:
+    with Session(engine) as session:
+        drift = reconcile_case_counts(session)
+    print(json.dumps({"drifted_statuses": len(drift), "drift": drift}, indent=2))
+    return 1 if drift else 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    raise SystemExit(main())
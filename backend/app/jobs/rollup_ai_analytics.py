@@ -0,0 +1,28 @@
+# Periodic job: python -m app.jobs.rollup_ai_analytics [--since YYYY-MM-DD]
+# Recomputes the daily AI analytics rollups from the watermark (the first day that wasn't final at
+# the last run) through today. --since rebuilds from an earlier day, e.g. after a data correction.
+import json
+import argparse
+import logging
+from datetime import date
+from sqlmodel import Session
+from app.core.database import engine
+from app.analytics.rollups import run_rollup
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Update the daily AI analytics rollups")
+    parser.add_argument("--since", type=date.fromisoformat, help="rebuild from this UTC day instead of the watermark")
+    args = parser.parse_args()
+
+    with Session(engine) as session:
+        result = run_rollup(session, since=args.since)
+    print(json.dumps(result))
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    raise SystemExit(main())
@@ -1,5 +1,6 @@
 # app/main.py
 import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from sqlmodel import Session, text
@@ -15,6 +16,8 @@ from app.core.database import engine
 from app.core.config import settings
 from app.core.dependencies import get_db
 from app.core.audit_middleware import AuditMetadataMiddleware
+from app.core.audit_writer import audit_writer
+from app.core.audit_rollup import rollup_flusher, rollup_enabled
 
 logging.basicConfig(
     level=logging.DEBUG,
@@ -25,7 +28,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.AUDIT_ASYNC_ENABLED:
+        audit_writer.start()
+    if rollup_enabled():
+        rollup_flusher.start()
+    yield
+    rollup_flusher.stop()
+    audit_writer.stop()
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(AuditMetadataMiddleware)
 
@@ -35,6 +48,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 app.include_router(auth_routes)
@@ -7,17 +7,30 @@ from .models import (
   TriageCaseBase,
   TriageCase,
   TriageCaseCreate,
+  TriageCaseBulkCreate,
+  TriageCaseBulkItemResult,
+  TriageCasesBulkResult,
+  TriageCaseBulkUpdate,
+  TriageCasesBulkUpdateResult,
   TriageCaseUpdate,
   TriageCaseReview,
   TriageCasePublic,
   TriageCasesPublic,
+  TriageCaseSlimPublic,
+  TriageCasesSlimPublic,
   TriageCaseChangelog,
+  CaseTimelineEntry,
+  CaseTimelinePublic,
+  TriageCaseStatusCount,
   PatientPublic,
   PatientChangelog,
   AIFeedback,
   AIFeedbackBase,
   AIFeedbackCreate,
   AIFeedbackPublic,
+  AIDailyRollup,
+  AIDailyTagCount,
+  RollupWatermark,
   CaseFile,
   CaseFileCreate,
   CaseFilePublic,
@@ -28,4 +41,18 @@ from .auditLog import (
   AuditLogPublic,
   AuditLogsPublic,
   AuditLogBase,
+  AuditChainHead,
+  AuditVerificationRun,
+  AuditVerificationRunPublic,
+  AuditArchive,
+  AuditChainAnchor,
+  AuditLogExportCreate,
+  AuditLogExportStatus,
+  AuditMerkleCheckpoint,
+  AuditMerkleLeaf,
+  AuditMerklePending,
+  AuditMerkleNode,
+  AuditMerkleCheckpointPublic,
+  AuditMerkleProofStep,
+  AuditInclusionProof,
 )
@@ -22,7 +22,8 @@ class AuditLog(AuditLogBase, table=True):
     __table_args__ = {"schema": "ent"}
 
     logID: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    # partition key, so part of the primary key
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), primary_key=True)
     hash: Optional[str] = None
     previousHash: Optional[str] = None
     locked: bool = False
@@ -41,5 +42,164 @@ class AuditLogPublic(SQLModel):
 
 class AuditLogsPublic(SQLModel):
     logs: list[AuditLogPublic]
+    # total matching rows, estimated from the planner's statistics
     count: int
+    next_cursor: Optional[str] = None
 
+
+class AuditChainHead(SQLModel, table=True):
+    # Latest hash per audited resource; locked FOR UPDATE while appending so chains can't fork
+    __tablename__ = "AuditChainHead"
+    __table_args__ = {"schema": "ent"}
+
+    resourceType: str = Field(primary_key=True)
+    resourceID: uuid.UUID = Field(primary_key=True)
+    hash: Optional[str] = None
+    logID: Optional[uuid.UUID] = None
+    updatedAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class AuditVerificationRun(SQLModel, table=True):
+    # One hash-chain verification pass; the latest completed run is the checkpoint for incremental runs
+    __tablename__ = "AuditVerificationRun"
+    __table_args__ = {"schema": "ent"}
+
+    runID: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    mode: str
+    status: str = "running"
+    startedAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    finishedAt: Optional[datetime] = None
+    resourcesChecked: int = 0
+    rowsChecked: int = 0
+    brokenCount: int = 0
+    report: Optional[Any] = Field(default=None, sa_type=JSONB)
+
+class AuditVerificationRunPublic(SQLModel):
+    runID: uuid.UUID
+    mode: str
+    status: str
+    startedAt: datetime
+    finishedAt: Optional[datetime] = None
+    resourcesChecked: int
+    rowsChecked: int
+    brokenCount: int
+    report: Optional[Any] = None
+
+class AuditArchive(SQLModel, table=True):
+    # An AuditLog partition moved to object storage by app.jobs.archive_audit_partitions
+    __tablename__ = "AuditArchive"
+    __table_args__ = {"schema": "ent"}
+
+    archiveID: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    partitionName: str
+    rangeStart: datetime
+    rangeEnd: datetime
+    status: str = "detached"
+    objectKey: Optional[str] = None
+    checkpointKey: Optional[str] = None
+    rowCount: Optional[int] = None
+    sha256: Optional[str] = None
+    createdAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    archivedAt: Optional[datetime] = None
+
+class AuditChainAnchor(SQLModel, table=True):
+    # Hash of the last archived entry of a chain, standing in for the archived prefix during verification
+    __tablename__ = "AuditChainAnchor"
+    __table_args__ = {"schema": "ent"}
+
+    resourceType: str = Field(primary_key=True)
+    resourceID: uuid.UUID = Field(primary_key=True)
+    hash: str
+    archiveID: uuid.UUID
+    rangeEnd: datetime
+
+class AuditLogExportCreate(SQLModel):
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+    actorID: Optional[uuid.UUID] = None
+    resourceType: Optional[str] = None
+    resourceID: Optional[uuid.UUID] = None
+    action: Optional[str] = None
+    status: Optional[str] = None
+    ip: Optional[str] = None
+
+class AuditLogExportStatus(SQLModel):
+    exportID: uuid.UUID
+    status: str
+    filters: AuditLogExportCreate
+    requestedBy: Optional[uuid.UUID] = None
+    createdAt: datetime
+    completedAt: Optional[datetime] = None
+    rows: int = 0
+    bytes: int = 0
+    objectKey: Optional[str] = None
+    error: Optional[str] = None
+    downloadUrl: Optional[str] = None
+    expiresAt: Optional[datetime] = None
+
+class AuditMerkleCheckpoint(SQLModel, table=True):
+    # Signed Merkle root over a batch of audit entry hashes; each root also commits to the previous one
+    __tablename__ = "AuditMerkleCheckpoint"
+    __table_args__ = {"schema": "ent"}
+
+    checkpointID: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    sequence: int
+    leafCount: int
+    rootHash: str
+    previousRoot: Optional[str] = None
+    firstTimestamp: datetime
+    lastTimestamp: datetime
+    signature: Optional[str] = None
+    signatureAlgorithm: Optional[str] = None
+    createdAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class AuditMerkleLeaf(SQLModel, table=True):
+    __tablename__ = "AuditMerkleLeaf"
+    __table_args__ = {"schema": "ent"}
+
+    logID: uuid.UUID = Field(primary_key=True)
+    checkpointID: uuid.UUID
+    leafIndex: int
+
+class AuditMerklePending(SQLModel, table=True):
+    # Hashed entries not yet in a checkpoint tree, queued by trigger on AuditLog insert
+    __tablename__ = "AuditMerklePending"
+    __table_args__ = {"schema": "ent"}
+
+    logID: uuid.UUID = Field(primary_key=True)
+    timestamp: datetime
+    hash: str
+
+class AuditMerkleNode(SQLModel, table=True):
+    # Every node of every checkpoint tree (level 0 = leaves), so proofs are point lookups
+    __tablename__ = "AuditMerkleNode"
+    __table_args__ = {"schema": "ent"}
+
+    checkpointID: uuid.UUID = Field(primary_key=True)
+    level: int = Field(primary_key=True)
+    nodeIndex: int = Field(primary_key=True)
+    hash: str
+
+class AuditMerkleCheckpointPublic(SQLModel):
+    checkpointID: uuid.UUID
+    sequence: int
+    leafCount: int
+    rootHash: str
+    previousRoot: Optional[str] = None
+    firstTimestamp: datetime
+    lastTimestamp: datetime
+    signature: Optional[str] = None
+    signatureAlgorithm: Optional[str] = None
+    # the exact bytes (UTF-8) that were signed
+    signedPayload: str
+
+class AuditMerkleProofStep(SQLModel):
+    position: str
+    hash: str
+
+class AuditInclusionProof(SQLModel):
+    logID: uuid.UUID
+    entryHash: Optional[str] = None
+    leafHash: str
+    leafIndex: int
+    proof: list[AuditMerkleProofStep]
+    checkpoint: AuditMerkleCheckpointPublic
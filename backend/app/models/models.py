@@ -1,5 +1,5 @@
 from sqlmodel import SQLModel, Field
-from sqlalchemy import Column
+from sqlalchemy import Column, Computed, SmallInteger
 from typing import Optional, Any
 from datetime import datetime, date, timezone
 import uuid
@@ -110,6 +110,16 @@ class PatientChangelog(SQLModel, table=True):
     newValue: Optional[str] = None
 
 # ============= TRIAGE CASE MODELS =============
+# mirrors the generated "effectiveUrgencyRank" column in db/schema.sql
+EFFECTIVE_URGENCY_RANK_SQL = """
+CASE COALESCE("overrideUrgency", "AIUrgency")
+    WHEN 'urgent' THEN 3
+    WHEN 'semi-urgent' THEN 2
+    WHEN 'routine' THEN 1
+    ELSE 0
+END
+"""
+
 class TriageCaseBase(SQLModel):
     transcript: Optional[str] = None
     AIConfidence: Optional[float] = None
@@ -119,6 +129,7 @@ class TriageCaseBase(SQLModel):
     clinicianNotes: Optional[str] = None
     overrideSummary: Optional[str] = None
     overrideUrgency: Optional[str] = None
+    AIModelVersion: Optional[str] = None
     flags: Optional[Any] = Field(sa_type=JSONB)
     activeAppointmentID: Optional[uuid.UUID] = None
 
@@ -134,6 +145,15 @@ class TriageCase(TriageCaseBase, table=True):
     reviewTimestamp: Optional[datetime] = None
     reviewedBy: Optional[uuid.UUID] = None
     scheduledDate: Optional[datetime] = None
+    leasedBy: Optional[uuid.UUID] = None
+    leaseExpiresAt: Optional[datetime] = None
+    # denormalized at write time by update_case / review_case
+    previousUrgency: Optional[str] = None
+    reviewedByEmail: Optional[str] = None
+    effectiveUrgencyRank: Optional[int] = Field(
+        default=None,
+        sa_column=Column(SmallInteger, Computed(EFFECTIVE_URGENCY_RANK_SQL, persisted=True))
+    )
 
 class TriageCaseCreate(SQLModel):
     patientID: uuid.UUID
@@ -141,8 +161,33 @@ class TriageCaseCreate(SQLModel):
     AIConfidence: Optional[float] = None
     AISummary: Optional[str] = None
     AIUrgency: Optional[str] = None
+    AIModelVersion: Optional[str] = None
     flags: Optional[Any] = Field(sa_type=JSONB)
 
+class TriageCaseBulkCreate(SQLModel):
+    # items are validated individually against TriageCaseCreate so one bad item doesn't reject the batch
+    cases: list[dict[str, Any]]
+
+class TriageCaseBulkItemResult(SQLModel):
+    index: int
+    status: str
+    caseID: Optional[uuid.UUID] = None
+    detail: Optional[str] = None
+
+class TriageCasesBulkResult(SQLModel):
+    results: list[TriageCaseBulkItemResult]
+    created: int
+    failed: int
+
+class TriageCaseBulkUpdate(SQLModel):
+    # the same change applied to every listed case, e.g. re-prioritising part of the queue
+    caseIDs: list[uuid.UUID]
+    status: Optional[str] = None
+    overrideUrgency: Optional[str] = None
+
+class TriageCasesBulkUpdateResult(SQLModel):
+    updated: list[uuid.UUID]
+    missing: list[uuid.UUID]
 
 class TriageCaseUpdate(SQLModel):
     transcript: Optional[str] = None
@@ -175,10 +220,62 @@ class TriageCasePublic(TriageCaseBase, PatientBase):
     reviewedByEmail: Optional[str] = None
     scheduledDate: Optional[datetime] = None
     previousUrgency: Optional[str] = None
+    leasedBy: Optional[uuid.UUID] = None
+    leaseExpiresAt: Optional[datetime] = None
 
 class TriageCasesPublic(SQLModel):
     cases: list[TriageCasePublic] 
     count: int
+    next_cursor: Optional[str] = None
+
+class TriageCaseSlimPublic(SQLModel):
+    # projection returned when list endpoints are called with fields=; only requested fields are populated
+    caseID: uuid.UUID
+    dateCreated: datetime
+    patientID: Optional[uuid.UUID] = None
+    status: Optional[str] = None
+    transcript: Optional[str] = None
+    AIConfidence: Optional[float] = None
+    AISummary: Optional[str] = None
+    AIUrgency: Optional[str] = None
+    clinicianNotes: Optional[str] = None
+    overrideSummary: Optional[str] = None
+    overrideUrgency: Optional[str] = None
+    AIModelVersion: Optional[str] = None
+    flags: Optional[Any] = None
+    activeAppointmentID: Optional[uuid.UUID] = None
+    createdBy: Optional[uuid.UUID] = None
+    reviewReason: Optional[str] = None
+    reviewTimestamp: Optional[datetime] = None
+    reviewedBy: Optional[uuid.UUID] = None
+    scheduledDate: Optional[datetime] = None
+    leasedBy: Optional[uuid.UUID] = None
+    leaseExpiresAt: Optional[datetime] = None
+    # denormalized at write time by update_case / review_case
+    previousUrgency: Optional[str] = None
+    reviewedByEmail: Optional[str] = None
+    effectiveUrgencyRank: Optional[int] = None
+    firstName: Optional[str] = None
+    lastName: Optional[str] = None
+    DOB: Optional[date] = None
+    contactInfo: Optional[str] = None
+    insuranceInfo: Optional[str] = None
+    returningPatient: Optional[bool] = None
+    languagePreference: Optional[str] = None
+    verified: Optional[bool] = None
+
+class TriageCasesSlimPublic(SQLModel):
+    cases: list[TriageCaseSlimPublic]
+    count: int
+    next_cursor: Optional[str] = None
+
+class TriageCaseStatusCount(SQLModel, table=True):
+    __tablename__ = "TriageCaseStatusCount"
+    __table_args__ = {"schema": "ent"}
+
+    status: str = Field(primary_key=True)
+    count: int = 0
+    updatedAt: datetime = Field(default_factory=datetime.now)
 
 class TriageCaseChangelog(SQLModel, table=True):
     __tablename__ = "TriageCaseChangelog"
@@ -192,6 +289,19 @@ class TriageCaseChangelog(SQLModel, table=True):
     oldValue: Optional[str] = None
     newValue: Optional[str] = None
 
+class CaseTimelineEntry(SQLModel):
+    # one event from a case's changelogs, appointments, AI feedback or audit log
+    source: str
+    id: str
+    timestamp: datetime
+    actorID: Optional[uuid.UUID] = None
+    actorEmail: Optional[str] = None
+    details: dict[str, Any] = {}
+
+class CaseTimelinePublic(SQLModel):
+    entries: list[CaseTimelineEntry]
+    next_cursor: Optional[str] = None
+
 # ============= CASE FILE MODEL =============
 class CaseFile(SQLModel, table=True):
     __tablename__ = "TriageCaseFile"
@@ -263,4 +373,33 @@ class AIFeedbackPublic(AIFeedbackBase):
     createdBy: Optional[uuid.UUID]
 
     createdAt: datetime
-    updatedAt: datetime
\ No newline at end of file
+    updatedAt: datetime
+
+# ============= ANALYTICS ROLLUP MODELS =============
+class AIDailyRollup(SQLModel, table=True):
+    __tablename__ = "AIDailyRollup"
+    __table_args__ = {"schema": "ent"}
+
+    day: date = Field(primary_key=True)
+    cases: int = 0
+    urgencyOverrides: int = 0
+    summaryOverrides: int = 0
+    feedbackUp: int = 0
+    feedbackDown: int = 0
+    updatedAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class AIDailyTagCount(SQLModel, table=True):
+    __tablename__ = "AIDailyTagCount"
+    __table_args__ = {"schema": "ent"}
+
+    day: date = Field(primary_key=True)
+    tag: str = Field(primary_key=True)
+    count: int = 0
+
+class RollupWatermark(SQLModel, table=True):
+    __tablename__ = "RollupWatermark"
+    __table_args__ = {"schema": "ent"}
+
+    name: str = Field(primary_key=True)
+    position: datetime
+    updatedAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
\ No newline at end of file
@@ -1,17 +1,29 @@
 import uuid
 import logging
-from typing import Any
+from typing import Any, Optional
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, Depends, status
-from sqlmodel import Session, func, select
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Query, status
+from sqlalchemy import tuple_
+from sqlmodel import Session, select
+from app.core.config import settings
 from app.core.dependencies import get_db
 from app.auth.dependencies import get_current_user
 from app.models import (
     AuditLog,
     AuditLogPublic,
     AuditLogsPublic,
+    AuditLogExportCreate,
+    AuditLogExportStatus,
+    AuditInclusionProof,
+    AuditVerificationRun,
+    AuditVerificationRunPublic,
     User,
 )
+from app.utils.audit_chain import VerificationInProgress, start_run, execute_run
+from app.utils.audit_export import create_export, export_filters, get_export, run_export
+from app.utils.audit_filters import audit_log_filters
+from app.utils.audit_merkle import inclusion_proof, public_key_pem
+from app.utils.pagination import encode_cursor, decode_cursor, clamp_limit, estimated_count
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/audit-logs", tags=["audit-logs"])
@@ -19,24 +31,49 @@ router = APIRouter(prefix="/audit-logs", tags=["audit-logs"])
 @router.get("/", response_model=AuditLogsPublic)
 def get_audit_logs(
     limit: int = 100,
+    cursor: Optional[str] = None,
+    actorID: Optional[uuid.UUID] = None,
+    resourceType: Optional[str] = None,
+    resourceID: Optional[uuid.UUID] = None,
+    action: Optional[str] = None,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    ip: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ) -> Any:
-    logger.info(f"GET /audit-logs/ - limit: {limit}, user: {current_user.email}")
+    logger.info(
+        f"GET /audit-logs/ - limit: {limit}, actor: {actorID}, resource: {resourceType}:{resourceID}, "
+        f"action: {action}, status: {status_filter}, ip: {ip}, since: {since}, until: {until}, user: {current_user.email}"
+    )
     # Only allow access to audit logs if the user is an admin
     if not current_user.isAdmin:
         logger.warning(f"Unauthorized access attempt to audit logs by user: {current_user.email}")
         raise HTTPException(status_code=403, detail="Access denied")
-    
-    count_statement = select(func.count()).select_from(AuditLog)
-    count = db.exec(count_statement).scalar_one()
-
-    statement = (
-        select(AuditLog)
-        .order_by(AuditLog.timestamp.desc())
-        .limit(limit)
-    )
-    results = db.exec(statement).all()
+
+    limit = clamp_limit(limit)
+    after = decode_cursor(cursor, datetime, uuid.UUID)
+
+    filters = audit_log_filters(actorID, resourceType, resourceID, action, status_filter, ip, since, until)
+
+    try:
+        # planner estimate rather than an exact COUNT(*), which would scan every matching partition
+        count = estimated_count(db, select(AuditLog.logID).where(*filters))
+
+        statement = select(AuditLog).where(*filters)
+        if after:
+            statement = statement.where(tuple_(AuditLog.timestamp, AuditLog.logID) < after)
+        statement = statement.order_by(AuditLog.timestamp.desc(), AuditLog.logID.desc()).limit(limit + 1)
+        results = db.exec(statement).all()
+    except Exception as e:
+        logger.exception(f"GET /audit-logs/ - Error: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve audit logs")
+
+    next_cursor = None
+    if len(results) > limit:
+        results = results[:limit]
+        next_cursor = encode_cursor(results[-1].timestamp, results[-1].logID)
 
     logs = [
         AuditLogPublic(
@@ -53,8 +90,8 @@ def get_audit_logs(
         )
         for log in results
     ]
-    logger.info(f"GET /audit-logs/ - returned {count} logs")
-    return AuditLogsPublic(logs=logs, count=count)
+    logger.info(f"GET /audit-logs/ - returned {len(logs)} logs")
+    return AuditLogsPublic(logs=logs, count=count, next_cursor=next_cursor)
 
 @router.post("/", response_model=AuditLogPublic, status_code=status.HTTP_201_CREATED)
 def create_audit_log(
@@ -78,3 +115,129 @@ def create_audit_log(
         status=log.status,
         ipAddress=log.ipAddress
     )
+
+@router.post("/verify", response_model=AuditVerificationRunPublic, status_code=status.HTTP_202_ACCEPTED)
+def verify_audit_chain(
+    background_tasks: BackgroundTasks,
+    full: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+) -> Any:
+    logger.info(f"POST /audit-logs/verify - full: {full}, user: {current_user.email}")
+    if not current_user.isAdmin:
+        logger.warning(f"Unauthorized audit verification attempt by user: {current_user.email}")
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    try:
+        run = start_run(db, "full" if full else "incremental")
+    except VerificationInProgress as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except Exception as e:
+        logger.exception(f"POST /audit-logs/verify - Error: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to start audit verification")
+
+    # runs after the response is sent; the report lands on the run row
+    background_tasks.add_task(execute_run, run.runID, settings.AUDIT_VERIFY_WORKERS)
+    logger.info(f"POST /audit-logs/verify - started run {run.runID} ({run.mode})")
+    return run
+
+@router.get("/verify", response_model=AuditVerificationRunPublic)
+def get_latest_verification(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+) -> Any:
+    logger.info(f"GET /audit-logs/verify - user: {current_user.email}")
+    if not current_user.isAdmin:
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    statement = select(AuditVerificationRun).order_by(AuditVerificationRun.startedAt.desc()).limit(1)
+    run = db.exec(statement).first()
+    if not run:
+        raise HTTPException(status_code=404, detail="No audit verification has been run")
+    return run
+
+@router.get("/verify/{run_id}", response_model=AuditVerificationRunPublic)
+def get_verification(
+    run_id: uuid.UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+) -> Any:
+    logger.info(f"GET /audit-logs/verify/{run_id} - user: {current_user.email}")
+    if not current_user.isAdmin:
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    run = db.get(AuditVerificationRun, run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Verification run not found")
+    return run
+
+@router.post("/export", response_model=AuditLogExportStatus, status_code=status.HTTP_202_ACCEPTED)
+def export_audit_logs(
+    filters: AuditLogExportCreate,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user)
+) -> Any:
+    logger.info(f"POST /audit-logs/export - filters: {filters.model_dump(exclude_none=True)}, user: {current_user.email}")
+    if not current_user.isAdmin:
+        logger.warning(f"Unauthorized audit export attempt by user: {current_user.email}")
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    # reject bad filters now rather than in the background job
+    export_filters(filters)
+    try:
+        job = create_export(filters, current_user.userID)
+    except Exception as e:
+        logger.exception(f"POST /audit-logs/export - Error: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to start audit export")
+
+    background_tasks.add_task(run_export, job.exportID)
+    logger.info(f"POST /audit-logs/export - queued export {job.exportID}")
+    return job
+
+@router.get("/export/{export_id}", response_model=AuditLogExportStatus)
+def get_audit_export(
+    export_id: uuid.UUID,
+    current_user: User = Depends(get_current_user)
+) -> Any:
+    logger.info(f"GET /audit-logs/export/{export_id} - user: {current_user.email}")
+    if not current_user.isAdmin:
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    try:
+        job = get_export(export_id)
+    except Exception as e:
+        logger.exception(f"GET /audit-logs/export/{export_id} - Error: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to retrieve audit export")
+    if not job:
+        raise HTTPException(status_code=404, detail="Export not found")
+    return job
+
+@router.get("/checkpoints/public-key")
+def get_checkpoint_public_key(current_user: User = Depends(get_current_user)) -> Any:
+    logger.info(f"GET /audit-logs/checkpoints/public-key - user: {current_user.email}")
+    if not current_user.isAdmin:
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    public_key = public_key_pem()
+    if public_key is None:
+        raise HTTPException(status_code=404, detail="Checkpoint signing is not configured")
+    return {"algorithm": "Ed25519", "publicKey": public_key}
+
+@router.get("/{log_id}/proof", response_model=AuditInclusionProof)
+def get_inclusion_proof(
+    log_id: uuid.UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+) -> Any:
+    logger.info(f"GET /audit-logs/{log_id}/proof - user: {current_user.email}")
+    if not current_user.isAdmin:
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    try:
+        proof = inclusion_proof(db, log_id)
+    except Exception as e:
+        logger.exception(f"GET /audit-logs/{log_id}/proof - Error: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to build inclusion proof")
+    if proof is None:
+        raise HTTPException(status_code=404, detail="Audit log entry is not in a checkpoint yet")
+    return proof
@@ -12,6 +12,7 @@ from app.core.dependencies import get_db
 from app.auth.dependencies import get_current_user
 from app.core.audit import AuditService
 from app.core.audit_middleware import get_audit_meta
+from app.core.cache import invalidate_cases
 from app.utils.changelog import log_changes
 from app.models import User, TriageCase, TriageCaseChangelog, Patient
 from app.core.gcal import calendar_service
@@ -558,6 +559,7 @@ def create_appointment(
         db.add(case)
         db.commit()
         db.refresh(appointment)
+        invalidate_cases(case.caseID)
 
         event_body = {
             "summary": f"Appointment: {patient_name}",
@@ -721,6 +723,7 @@ def reschedule_appointment(
 
         db.commit()
         db.refresh(new_appt)
+        invalidate_cases(appointment.caseID)
 
         try:
             calendar_service.events().delete(
@@ -852,6 +855,7 @@ def cancel_appointment(
             db.add(case)
 
         db.commit()
+        invalidate_cases(appointment.caseID)
 
         try:
             calendar_service.events().delete(
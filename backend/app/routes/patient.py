@@ -1,8 +1,8 @@
 import uuid
 import logging
-from typing import Any
-from fastapi import APIRouter, HTTPException, Depends, Request, status
-from sqlmodel import Session, select
+from typing import Any, Optional
+from fastapi import APIRouter, HTTPException, Depends, Request, Response, status
+from sqlmodel import Session
 from app.core.dependencies import get_db
 from app.auth.dependencies import get_current_user
 from app.models import (
@@ -12,9 +12,10 @@ from app.models import (
     PatientChangelog,
     User,
 )
-from app.utils.changelog import log_changes
-from app.core.audit import AuditService
-from app.core.audit_middleware import get_audit_meta
+from app.core.unit_of_work import UnitOfWork
+from app.utils.changelog import changelog_page
+from app.utils.pagination import MAX_PAGE_SIZE, clamp_limit
+from app.core.cache import invalidate_patient_cases
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/patients", tags=["patients"])
@@ -61,37 +62,16 @@ def update_patient(
         if not update_data:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No fields to update")
         
-        log_changes(
-            session=db,
-            old_record=patient,
-            new_values=update_data,
-            changelog_model=PatientChangelog,
-            foreign_key_field='patientID',
-            record_id=patient_id,
-            user_id=current_user.userID
-        )
+        uow = UnitOfWork(db, current_user, request)
+        uow.log_changes(patient, update_data, PatientChangelog, 'patientID', patient_id)
+        patient = uow.update(Patient, patient_id, update_data)
+        uow.audit("UPDATE_PATIENT", "PATIENT", patient_id, fields_modified=list(update_data.keys()))
         
-        patient.sqlmodel_update(update_data)
-        db.add(patient)
-        db.commit()
-        db.refresh(patient)
-        try:
-            audit_meta = get_audit_meta(request) if request is not None else {"ip": None}
-            modified_fields = list(update_data.keys())
-            AuditService.create_log(
-                db,
-                action="UPDATE_PATIENT",
-                status="SUCCESS",
-                actor_id=current_user.userID,
-                actor_type=current_user.role,
-                resource_type="PATIENT",
-                resource_id=patient.patientID,
-                fields_modified=modified_fields,
-                ip=audit_meta.get("ip"),
-            )
-        except Exception:
-            logger.exception("Failed to write audit log for patient info update")
-        return patient
+        # built from the RETURNING row; commit expires it
+        patient_public = PatientPublic.model_validate(patient)
+        uow.commit()
+        invalidate_patient_cases(db, patient_id)
+        return patient_public
     except HTTPException:
         db.rollback()
         raise
@@ -103,39 +83,24 @@ def update_patient(
 @router.get("/{patient_id}/changelog")
 def get_patient_changelog(
     patient_id: uuid.UUID,
+    response: Response,
+    limit: int = MAX_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    field: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ) -> Any:
-    logger.info(f"GET /patients/{patient_id}/changelog - user: {current_user.email}")
+    logger.info(f"GET /patients/{patient_id}/changelog - user: {current_user.email}, limit: {limit}, cursor: {cursor}, field: {field}")
     
     try:
         patient = db.get(Patient, patient_id)
         if not patient:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Patient not found")
         
-        statement = (
-            select(
-                PatientChangelog,
-                User.email.label('changedByEmail')
-            )
-            .join(User, PatientChangelog.changedBy == User.userID)
-            .where(PatientChangelog.patientID == patient_id)
-            .order_by(PatientChangelog.changedAt.desc())
-        )
-        
-        results = db.exec(statement).all()
-        
-        return [
-            {
-                "id": str(changelog.id),
-                "changedAt": changelog.changedAt.isoformat(),
-                "fieldName": changelog.fieldName,
-                "oldValue": changelog.oldValue,
-                "newValue": changelog.newValue,
-                "changedByEmail": changed_by_email
-            }
-            for changelog, changed_by_email in results
-        ]
+        entries, next_cursor = changelog_page(db, PatientChangelog, 'patientID', patient_id, clamp_limit(limit), cursor, field)
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+        return entries
     except HTTPException:
         raise
     except Exception as e:
@@ -1,22 +1,38 @@
 import re
+import io
+import csv
+import json
 import uuid
 from uuid import uuid4
 import logging
-from typing import Any
-from datetime import datetime
-from fastapi import APIRouter, HTTPException, Depends, Request, status
-from sqlmodel import Session, func, select
+from typing import Any, Optional
+from datetime import datetime, timedelta, timezone
+from fastapi import APIRouter, HTTPException, Depends, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy import case as sql_case, func, insert, or_, tuple_, update as sql_update
+from sqlmodel import Session, select
+from app.core.database import engine
 from app.core.dependencies import get_db
 from app.auth.dependencies import get_current_user
 from app.models import (
     TriageCase,
     TriageCaseCreate,
+    TriageCaseBulkCreate,
+    TriageCaseBulkItemResult,
+    TriageCasesBulkResult,
+    TriageCaseBulkUpdate,
+    TriageCasesBulkUpdateResult,
     TriageCasePublic,
     TriageCasesPublic,
+    TriageCaseSlimPublic,
+    TriageCasesSlimPublic,
+    PatientBase,
     TriageCaseUpdate,
     TriageCaseReview,
     TriageCaseChangelog,
     PatientChangelog,
+    CaseTimelinePublic,
     Message,
     User,
     Patient,
@@ -24,40 +40,50 @@ from app.models import (
     CaseFileCreate,
     CaseFilesPublic,
 )
-from app.utils.changelog import log_changes
+from app.utils.case_counts import get_case_count
+from app.utils.case_timeline import case_timeline
+from app.utils.changelog import changelog_page
+from app.utils.pagination import MAX_PAGE_SIZE, encode_cursor, decode_cursor, clamp_limit
 from app.utils.s3_helpers import generate_presigned_upload_url, generate_presigned_download_url
 from app.core.audit_middleware import get_audit_meta
 from app.core.audit import AuditService
+from app.core.audit_rollup import record_read
+from app.core.unit_of_work import UnitOfWork
+from app.core.events import publish_case_event, stream_case_events
+from app.core.cache import (
+    get_cached_case,
+    cache_case,
+    get_cached_case_list,
+    cache_case_list,
+    invalidate_cases,
+    invalidate_patient_cases,
+    get_cache_stats,
+)
 from app.core.s3 import s3_client, BUCKET_NAME
 
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/triage-cases", tags=["triage-cases"])
 
-def build_case_public(case: TriageCase, db: Session) -> TriageCasePublic:
-    patient = db.get(Patient, case.patientID)
-    if not patient:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Patient not found")
-    
-    reviewed_by_email = None
-    if case.reviewedBy:
-        reviewer = db.get(User, case.reviewedBy)
-        if reviewer:
-            reviewed_by_email = reviewer.email
-            
-    previous_urgency = None
-    if case.overrideUrgency:
-        statement = (
-            select(TriageCaseChangelog)
-            .where(TriageCaseChangelog.caseID == case.caseID)
-            .where(TriageCaseChangelog.fieldName == 'overrideUrgency')
-            .order_by(TriageCaseChangelog.changedAt.desc())
-            .limit(1)
-        )
-        last_change = db.exec(statement).first()
-        if last_change:
-            previous_urgency = last_change.oldValue
-            
+DEFAULT_LEASE_SECONDS = 600
+MAX_LEASE_SECONDS = 3600
+MAX_LEASE_COUNT = 50
+MAX_BULK_CASES = 5000
+EXPORT_BATCH_SIZE = 1000
+EXPORT_COLUMNS = [
+    "caseID", "patientID", "dateCreated", "createdBy", "status",
+    "transcript", "AISummary", "AIUrgency", "AIConfidence",
+    "overrideSummary", "overrideUrgency", "clinicianNotes", "flags",
+    "reviewReason", "reviewTimestamp", "reviewedBy", "scheduledDate",
+]
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+# columns selectable through the fields= projection on list endpoints
+CASE_FIELD_COLUMNS = {name: getattr(TriageCase, name) for name in TriageCase.model_fields}
+PATIENT_FIELD_COLUMNS = {name: getattr(Patient, name) for name in PatientBase.model_fields}
+
+def to_case_public(case: TriageCase, patient: Patient) -> TriageCasePublic:
+    # previousUrgency and reviewedByEmail are denormalized onto the case row at write time
     return TriageCasePublic(
         **case.model_dump(),
         firstName=patient.firstName,
@@ -68,104 +94,404 @@ def build_case_public(case: TriageCase, db: Session) -> TriageCasePublic:
         returningPatient=patient.returningPatient,
         languagePreference=patient.languagePreference,
         verified=patient.verified,
-        reviewedByEmail=reviewed_by_email,
-        previousUrgency=previous_urgency,
     )
 
-@router.get("/", response_model=TriageCasesPublic)
+def build_cases_public(cases: list[TriageCase], db: Session) -> list[TriageCasePublic]:
+    # Hydrate a page of cases with a single IN query for their patients
+    if not cases:
+        return []
+
+    patient_ids = {case.patientID for case in cases}
+    patients = {
+        patient.patientID: patient
+        for patient in db.exec(select(Patient).where(Patient.patientID.in_(patient_ids))).all()
+    }
+
+    cases_public = []
+    for case in cases:
+        patient = patients.get(case.patientID)
+        if not patient:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Patient not found")
+        cases_public.append(to_case_public(case, patient))
+    return cases_public
+
+def build_case_public(case: TriageCase, db: Session) -> TriageCasePublic:
+    return build_cases_public([case], db)[0]
+
+def derive_previous_urgency(case: TriageCase, new_urgency: Optional[str]) -> Optional[str]:
+    # Same value log_changes records as oldValue for an overrideUrgency change (AIUrgency when never overridden)
+    if new_urgency is None:
+        return None
+    old_urgency = case.overrideUrgency or case.AIUrgency
+    if old_urgency == new_urgency:
+        return case.previousUrgency
+    return str(old_urgency) if old_urgency is not None else None
+
+def paginate_cases(statement, limit: int, cursor: Optional[str], db: Session) -> tuple[list, Optional[str]]:
+    # Keyset pagination over (dateCreated, caseID), newest first; backed by idx_triage_created / idx_triage_status_created
+    after = decode_cursor(cursor, datetime, uuid.UUID)
+    if after:
+        statement = statement.where(tuple_(TriageCase.dateCreated, TriageCase.caseID) < after)
+    statement = statement.order_by(TriageCase.dateCreated.desc(), TriageCase.caseID.desc()).limit(limit + 1)
+    cases = db.exec(statement).all()
+
+    next_cursor = None
+    if len(cases) > limit:
+        cases = cases[:limit]
+        next_cursor = encode_cursor(cases[-1].dateCreated, cases[-1].caseID)
+    return cases, next_cursor
+
+def select_case_fields(fields: str):
+    # Build a column-level SELECT for a comma-separated field list; caseID and dateCreated are always included for the cursor
+    requested = ["caseID", "dateCreated"]
+    for name in (field.strip() for field in fields.split(",")):
+        if name and name not in requested:
+            requested.append(name)
+
+    unknown = [name for name in requested if name not in CASE_FIELD_COLUMNS and name not in PATIENT_FIELD_COLUMNS]
+    if unknown:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unknown fields: {', '.join(unknown)}")
+
+    columns = [CASE_FIELD_COLUMNS.get(name, PATIENT_FIELD_COLUMNS.get(name)) for name in requested]
+    statement = select(*columns).select_from(TriageCase)
+    if any(name in PATIENT_FIELD_COLUMNS and name not in CASE_FIELD_COLUMNS for name in requested):
+        statement = statement.join(Patient, Patient.patientID == TriageCase.patientID)
+    return statement
+
+def fetch_cases_page(
+    db: Session,
+    limit: int,
+    cursor: Optional[str],
+    fields: Optional[str],
+    case_status: Optional[str] = None,
+) -> tuple[list, Optional[str]]:
+    # Full pages are hydrated through build_cases_public; projected pages skip the ORM and large text columns
+    if fields is None:
+        statement = select(TriageCase)
+    else:
+        statement = select_case_fields(fields)
+    if case_status is not None:
+        statement = statement.where(TriageCase.status == case_status)
+
+    rows, next_cursor = paginate_cases(statement, limit, cursor, db)
+    if fields is None:
+        return build_cases_public(rows, db), next_cursor
+    return [TriageCaseSlimPublic(**row._mapping) for row in rows], next_cursor
+
+def load_cases_page(
+    db: Session,
+    limit: int,
+    cursor: Optional[str],
+    fields: Optional[str],
+    case_status: Optional[str] = None,
+) -> TriageCasesPublic | TriageCasesSlimPublic:
+    # Serve list pages from the Redis cache; writes bump the list version via invalidate_cases
+    page_model = TriageCasesPublic if fields is None else TriageCasesSlimPublic
+    cache_key, cached = get_cached_case_list(
+        {"status": case_status, "limit": limit, "cursor": cursor, "fields": fields}
+    )
+    if cached:
+        return page_model.model_validate_json(cached)
+
+    count = get_case_count(db, case_status)
+    cases_public, next_cursor = fetch_cases_page(db, limit, cursor, fields, case_status)
+    page = page_model(cases=cases_public, count=count, next_cursor=next_cursor)
+    cache_case_list(cache_key, page.model_dump_json(exclude_unset=True))
+    return page
+
+@router.get(
+    "/",
+    response_model=TriageCasesPublic | TriageCasesSlimPublic,
+    response_model_exclude_unset=True,
+)
 def get_all_cases(
     limit: int = 100,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
     request: Request = None
 ) -> Any:
     logger.info(f"GET /triage-cases/ - limit: {limit}, user: {current_user.email}")
+    limit = clamp_limit(limit)
     
     try:
-        count_statement = select(func.count()).select_from(TriageCase)
-        count = db.exec(count_statement).one()
-        
-        statement = select(TriageCase).limit(limit)
-        cases = db.exec(statement).all()
-        
-        cases_public = [build_case_public(case, db) for case in cases]
+        page = load_cases_page(db, limit, cursor, fields)
     
         try:
             audit_meta = get_audit_meta(request) if request is not None else {"ip": None}
-            AuditService.create_log(
+            record_read(
                 db,
                 action="LIST_CASES",
-                status="SUCCESS",
                 actor_id=current_user.userID,
                 actor_type=current_user.role,
                 resource_type="TRIAGE_CASE",
-                resource_id=None,
-                fields_modified=None,
-                changeDetails={"limit": limit, "returned_count": len(cases_public)},
+                params={"limit": limit, "paged": cursor is not None, "fields": fields},
+                returned_count=len(page.cases),
                 ip=audit_meta.get("ip"),
             )
         except Exception:
             logger.exception("Failed to write audit log for listing triage cases")
     
-        logger.info(f"GET /triage-cases/ - returned {count} cases")
-        return TriageCasesPublic(cases=cases_public, count=count)
+        logger.info(f"GET /triage-cases/ - returned {page.count} cases")
+        return page
     except HTTPException:
         raise
     except Exception as e:
         logger.exception(f"GET /triage-cases/ - Error: {str(e)}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to retrieve triage cases")
 
-@router.get("/status/{status}", response_model=TriageCasesPublic)
+@router.get(
+    "/status/{status}",
+    response_model=TriageCasesPublic | TriageCasesSlimPublic,
+    response_model_exclude_unset=True,
+)
 def get_cases_by_status(
     status: str,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
     request: Request = None
 ) -> Any:
     logger.info(f"GET /triage-cases/status/{status} - limit: {limit}, user: {current_user.email}")
+    limit = clamp_limit(limit)
     
     try:
-        count_statement = (
-            select(func.count())
-            .select_from(TriageCase)
-            .where(TriageCase.status == status)
-        )
-        count = db.exec(count_statement).one()
-        
-        statement = (
-            select(TriageCase)
-            .where(TriageCase.status == status)
-            .limit(limit)
-        )
-        cases = db.exec(statement).all()
-        
-        cases_public = [build_case_public(case, db) for case in cases]
+        page = load_cases_page(db, limit, cursor, fields, case_status=status)
     
         # Log list access at collection level
         try:
             audit_meta = get_audit_meta(request) if request is not None else {"ip": None}
-            AuditService.create_log(
+            record_read(
                 db,
                 action="LIST_CASES",
-                status="SUCCESS",
                 actor_id=current_user.userID,
                 actor_type=current_user.role,
                 resource_type="TRIAGE_CASE",
-                resource_id=None,
-                fields_modified=None,
-                changeDetails={"status_filter": status, "limit": limit, "returned_count": len(cases_public)},
+                params={"status_filter": status, "limit": limit, "paged": cursor is not None, "fields": fields},
+                returned_count=len(page.cases),
                 ip=audit_meta.get("ip"),
             )
         except Exception:
             logger.exception("Failed to write audit log for listing cases by status")
-        return TriageCasesPublic(cases=cases_public, count=count)
+        return page
     except HTTPException:
         raise
     except Exception as e:
         logger.exception(f"GET /triage-cases/status/{status} - Error: {str(e)}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to retrieve triage cases by status")
 
+@router.post("/queue/next", response_model=TriageCasesPublic)
+def lease_next_cases(
+    count: int = 1,
+    lease_seconds: int = DEFAULT_LEASE_SECONDS,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    request: Request = None
+) -> Any:
+    logger.info(f"POST /triage-cases/queue/next - count: {count}, lease_seconds: {lease_seconds}, user: {current_user.email}")
+
+    if count < 1 or count > MAX_LEASE_COUNT:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Count must be between 1 and {MAX_LEASE_COUNT}")
+    if lease_seconds < 1 or lease_seconds > MAX_LEASE_SECONDS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Lease must be between 1 and {MAX_LEASE_SECONDS} seconds")
+
+    try:
+        now = datetime.now(timezone.utc)
+        # Walks idx_triage_queue in priority order; SKIP LOCKED lets concurrent reviewers claim disjoint cases
+        statement = (
+            select(TriageCase)
+            .where(TriageCase.status == "unreviewed")
+            .where(or_(
+                TriageCase.leaseExpiresAt.is_(None),
+                TriageCase.leaseExpiresAt < now,
+                TriageCase.leasedBy == current_user.userID,
+            ))
+            .order_by(
+                TriageCase.effectiveUrgencyRank.desc(),
+                TriageCase.AIConfidence.desc().nulls_last(),
+                TriageCase.dateCreated.asc(),
+            )
+            .limit(count)
+            .with_for_update(skip_locked=True)
+        )
+        cases = db.exec(statement).all()
+
+        lease_expires_at = now + timedelta(seconds=lease_seconds)
+        uow = UnitOfWork(db, current_user, request)
+        for case in cases:
+            case.leasedBy = current_user.userID
+            case.leaseExpiresAt = lease_expires_at
+            db.add(case)
+        uow.audit(
+            "LEASE_CASES",
+            "TRIAGE_CASE",
+            None,
+            changeDetails={
+                "requested_count": count,
+                "lease_seconds": lease_seconds,
+                "case_ids": [str(case.caseID) for case in cases],
+            },
+        )
+        uow.commit()
+        invalidate_cases(*[case.caseID for case in cases])
+
+        cases_public = build_cases_public(cases, db)
+
+        return TriageCasesPublic(cases=cases_public, count=len(cases_public))
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.exception(f"POST /triage-cases/queue/next - Error: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to lease triage cases")
+
+@router.delete("/queue/{id}")
+def release_case_lease(
+    id: uuid.UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    request: Request = None
+) -> Message:
+    logger.info(f"DELETE /triage-cases/queue/{id} - user: {current_user.email}")
+
+    try:
+        case = db.get(TriageCase, id)
+        if not case:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Triage case not found")
+        if case.leasedBy != current_user.userID:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Triage case is not leased by current user")
+
+        uow = UnitOfWork(db, current_user, request)
+        uow.update(TriageCase, id, {"leasedBy": None, "leaseExpiresAt": None})
+        uow.audit("RELEASE_LEASE", "TRIAGE_CASE", id, fields_modified=["leasedBy", "leaseExpiresAt"])
+        uow.commit()
+        invalidate_cases(id)
+        return Message(message="Triage case lease released")
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.exception(f"DELETE /triage-cases/queue/{id} - Error: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to release triage case lease")
+
+def stream_cases_export(statement, export_format: str):
+    # Runs in its own session so the server-side cursor outlives the request dependency
+    with Session(engine) as session:
+        rows = session.exec(statement.execution_options(yield_per=EXPORT_BATCH_SIZE))
+
+        if export_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(EXPORT_COLUMNS)
+            for batch in rows.partitions():
+                for row in batch:
+                    writer.writerow([
+                        json.dumps(value) if isinstance(value, (dict, list)) else "" if value is None else value
+                        for value in row
+                    ])
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+            yield buffer.getvalue()
+        else:
+            for batch in rows.partitions():
+                yield "".join(
+                    json.dumps(dict(zip(EXPORT_COLUMNS, row)), default=str) + "\n"
+                    for row in batch
+                )
+
+@router.get("/export")
+def export_cases(
+    format: str = "ndjson",
+    case_status: Optional[str] = None,
+    urgency: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    request: Request = None
+) -> StreamingResponse:
+    logger.info(
+        f"GET /triage-cases/export - format: {format}, status: {case_status}, urgency: {urgency}, "
+        f"from: {date_from}, to: {date_to}, user: {current_user.email}"
+    )
+
+    if format not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Format must be 'ndjson' or 'csv'")
+
+    statement = select(*[getattr(TriageCase, column) for column in EXPORT_COLUMNS])
+    if case_status:
+        statement = statement.where(TriageCase.status == case_status)
+    if urgency:
+        statement = statement.where(func.coalesce(TriageCase.overrideUrgency, TriageCase.AIUrgency) == urgency)
+    if date_from:
+        statement = statement.where(TriageCase.dateCreated >= date_from)
+    if date_to:
+        statement = statement.where(TriageCase.dateCreated < date_to)
+    statement = statement.order_by(TriageCase.dateCreated, TriageCase.caseID)
+
+    try:
+        audit_meta = get_audit_meta(request) if request is not None else {"ip": None}
+        AuditService.create_log(
+            db,
+            action="EXPORT_CASES",
+            status="SUCCESS",
+            actor_id=current_user.userID,
+            actor_type=current_user.role,
+            resource_type="TRIAGE_CASE",
+            resource_id=None,
+            fields_modified=None,
+            changeDetails={
+                "format": format,
+                "status_filter": case_status,
+                "urgency_filter": urgency,
+                "date_from": date_from.isoformat() if date_from else None,
+                "date_to": date_to.isoformat() if date_to else None,
+            },
+            ip=audit_meta.get("ip"),
+        )
+    except Exception:
+        logger.exception("Failed to write audit log for exporting triage cases")
+
+    filename = f"triage-cases-{datetime.now().strftime('%Y%m%d%H%M%S')}.{format}"
+    return StreamingResponse(
+        stream_cases_export(statement, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+@router.get("/events")
+async def case_events(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+) -> StreamingResponse:
+    # Push channel for case created/updated/reviewed/deleted deltas so dashboards don't poll list endpoints
+    logger.info(f"GET /triage-cases/events - user: {current_user.email}")
+    # the stream can stay open for hours; hand the auth lookup's connection back to the pool now
+    db.close()
+    return StreamingResponse(
+        stream_case_events(request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@router.get("/cache/stats")
+def case_cache_stats(current_user: User = Depends(get_current_user)) -> Any:
+    logger.info(f"GET /triage-cases/cache/stats - user: {current_user.email}")
+    if not current_user.isAdmin:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+    try:
+        return get_cache_stats()
+    except Exception as e:
+        logger.exception(f"GET /triage-cases/cache/stats - Error: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to retrieve cache stats")
+
 @router.get("/{id}", response_model=TriageCasePublic)
 def get_specific_case(
     id: uuid.UUID,
@@ -176,12 +502,23 @@ def get_specific_case(
     logger.info(f"GET /triage-cases/{id} - user: {current_user.email}")
     
     try:
-        case = db.get(TriageCase, id)
-        if not case:
+        cache_key, cached = get_cached_case(id)
+        if cached:
+            return TriageCasePublic.model_validate_json(cached)
+
+        statement = (
+            select(TriageCase, Patient)
+            .join(Patient, Patient.patientID == TriageCase.patientID)
+            .where(TriageCase.caseID == id)
+        )
+        row = db.exec(statement).first()
+        if not row:
             logger.warning(f"GET /triage-cases/{id} - case not found")
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Triage case not found")
 
-        return build_case_public(case, db)
+        case_public = to_case_public(*row)
+        cache_case(cache_key, case_public.model_dump_json())
+        return case_public
     except HTTPException:
         raise
     except Exception as e:
@@ -199,30 +536,28 @@ def create_new_case(
     
     try:
         case = TriageCase.model_validate(new_case)
+        patient = db.get(Patient, case.patientID)
+        if not patient:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Patient not found")
 
+        uow = UnitOfWork(db, current_user, request)
         db.add(case)
-        db.commit()
-        db.refresh(case)
-        
-        # Log case creation
-        try:
-            from app.core.audit_middleware import get_audit_meta
-            audit_meta = get_audit_meta(request) if request is not None else {"ip": None}
-            fields_created = list(new_case.model_dump().keys())
-            AuditService.create_log(
-                db,
-                action="CREATE_CASE",
-                status="SUCCESS",
-                actor_id=current_user.userID,
-                actor_type=current_user.role,
-                resource_type="TRIAGE_CASE",
-                resource_id=case.caseID,
-                fields_modified=fields_created,
-                ip=audit_meta.get("ip"),
-            )
-        except Exception:
-            logger.exception("Failed to write audit log for case creation") 
-        return build_case_public(case, db)
+        # INSERT ... RETURNING fills in server-generated columns without a refresh
+        db.flush()
+        uow.audit("CREATE_CASE", "TRIAGE_CASE", case.caseID, fields_modified=list(new_case.model_dump().keys()))
+
+        case_public = to_case_public(case, patient)
+        uow.commit()
+        invalidate_cases()
+
+        publish_case_event(
+            "created",
+            case_public.caseID,
+            actor_id=current_user.userID,
+            status=case_public.status,
+            urgency=case_public.overrideUrgency or case_public.AIUrgency,
+        )
+        return case_public
     except HTTPException:
         db.rollback()
         raise
@@ -231,6 +566,155 @@ def create_new_case(
         logger.exception(f"POST /triage-cases/ - Error: {str(e)}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to create triage case")
 
+@router.post("/bulk", response_model=TriageCasesBulkResult)
+def create_cases_bulk(
+    payload: TriageCaseBulkCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    request: Request = None
+) -> Any:
+    logger.info(f"POST /triage-cases/bulk - user: {current_user.email}, items: {len(payload.cases)}")
+
+    if not payload.cases:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No cases to create")
+    if len(payload.cases) > MAX_BULK_CASES:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"At most {MAX_BULK_CASES} cases per request")
+
+    try:
+        results: list[TriageCaseBulkItemResult] = []
+        validated: list[tuple[int, TriageCaseCreate]] = []
+        for index, item in enumerate(payload.cases):
+            try:
+                validated.append((index, TriageCaseCreate.model_validate(item)))
+            except ValidationError as e:
+                errors = "; ".join(f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in e.errors())
+                results.append(TriageCaseBulkItemResult(index=index, status="failed", detail=errors))
+
+        patient_ids = {new_case.patientID for _, new_case in validated}
+        existing_patients = set()
+        if patient_ids:
+            existing_patients = set(
+                db.exec(select(Patient.patientID).where(Patient.patientID.in_(patient_ids))).all()
+            )
+
+        rows = []
+        audit_entries = []
+        audit_meta = get_audit_meta(request) if request is not None else {"ip": None}
+        for index, new_case in validated:
+            if new_case.patientID not in existing_patients:
+                results.append(TriageCaseBulkItemResult(index=index, status="failed", detail="Patient not found"))
+                continue
+
+            case = TriageCase.model_validate(new_case)
+            rows.append(case.model_dump(exclude={"effectiveUrgencyRank"}))
+            audit_entries.append({
+                "action": "CREATE_CASE",
+                "status": "SUCCESS",
+                "actor_id": current_user.userID,
+                "actor_type": current_user.role,
+                "resource_type": "TRIAGE_CASE",
+                "resource_id": case.caseID,
+                "fields_modified": list(new_case.model_dump().keys()),
+                "ip": audit_meta.get("ip"),
+            })
+            results.append(TriageCaseBulkItemResult(index=index, status="created", caseID=case.caseID))
+
+        # cases and their audit entries commit together; executemany is sent as multi-row INSERTs
+        if rows:
+            db.execute(insert(TriageCase), rows)
+            AuditService.create_logs(db, audit_entries, commit=False)
+            db.commit()
+            invalidate_cases()
+
+            publish_case_event(
+                "bulk_created",
+                actor_id=current_user.userID,
+                case_ids=[row["caseID"] for row in rows],
+            )
+
+        results.sort(key=lambda result: result.index)
+        created = len(rows)
+        logger.info(f"POST /triage-cases/bulk - created {created}, failed {len(results) - created}")
+        return TriageCasesBulkResult(results=results, created=created, failed=len(results) - created)
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.exception(f"POST /triage-cases/bulk - Error: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to create triage cases")
+
+@router.patch("/bulk", response_model=TriageCasesBulkUpdateResult)
+def update_cases_bulk(
+    payload: TriageCaseBulkUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    request: Request = None
+) -> Any:
+    logger.info(f"PATCH /triage-cases/bulk - user: {current_user.email}, items: {len(payload.caseIDs)}")
+
+    updates = payload.model_dump(exclude_unset=True, exclude={"caseIDs"})
+    if not updates:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No fields to update")
+    if updates.get("status") and updates["status"].lower() == "reviewed":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Triage case cannot be reviewed through generic update"
+        )
+    case_ids = list(dict.fromkeys(payload.caseIDs))
+    if not case_ids:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No cases to update")
+    if len(case_ids) > MAX_BULK_CASES:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"At most {MAX_BULK_CASES} cases per request")
+
+    try:
+        uow = UnitOfWork(db, current_user, request)
+        # only the touched columns (plus AIUrgency, the fallback old value for overrideUrgency) are read,
+        # locked so the diff matches what the UPDATE below overwrites
+        current = db.exec(
+            select(TriageCase.caseID, TriageCase.AIUrgency, *[getattr(TriageCase, field) for field in updates])
+            .where(TriageCase.caseID.in_(case_ids))
+            .with_for_update()
+        ).all()
+        found = [row.caseID for row in current]
+        found_set = set(found)
+        missing = [case_id for case_id in case_ids if case_id not in found_set]
+
+        if found:
+            uow.log_changes_bulk(
+                [(row, updates, row.caseID) for row in current], TriageCaseChangelog, 'caseID'
+            )
+            values = dict(updates)
+            if 'overrideUrgency' in updates:
+                # derive_previous_urgency per row; SET expressions see the pre-update values
+                old_urgency = func.coalesce(TriageCase.overrideUrgency, TriageCase.AIUrgency)
+                values['previousUrgency'] = (
+                    None if updates['overrideUrgency'] is None
+                    else sql_case((old_urgency == updates['overrideUrgency'], TriageCase.previousUrgency), else_=old_urgency)
+                )
+            db.execute(sql_update(TriageCase).where(TriageCase.caseID.in_(found)).values(**values))
+            for case_id in found:
+                uow.audit("UPDATE_CASE", "TRIAGE_CASE", case_id, fields_modified=list(updates))
+            uow.commit()
+            invalidate_cases(*found)
+
+            publish_case_event(
+                "bulk_updated",
+                actor_id=current_user.userID,
+                case_ids=found,
+                fields=list(updates),
+            )
+
+        logger.info(f"PATCH /triage-cases/bulk - updated {len(found)}, missing {len(missing)}")
+        return TriageCasesBulkUpdateResult(updated=found, missing=missing)
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.exception(f"PATCH /triage-cases/bulk - Error: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to update triage cases")
+
 @router.patch("/{id}", response_model=TriageCasePublic)
 def update_case(
     id: uuid.UUID,
@@ -248,9 +732,14 @@ def update_case(
                 detail="Triage case cannot be reviewed through generic update"
             )
         
-        case = db.get(TriageCase, id)
-        if not case:
+        row = db.exec(
+            select(TriageCase, Patient)
+            .join(Patient, Patient.patientID == TriageCase.patientID)
+            .where(TriageCase.caseID == id)
+        ).first()
+        if not row:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Triage case not found")
+        case, patient = row
         
         update_data = update.model_dump(exclude_unset=True)
         
@@ -261,61 +750,40 @@ def update_case(
         patient_updates = {k: v for k, v in update_data.items() if k in patient_field_names}
         case_updates = {k: v for k, v in update_data.items() if k not in patient_field_names}
         
+        uow = UnitOfWork(db, current_user, request)
         if patient_updates:
-            patient = db.get(Patient, case.patientID)
-            if not patient:
-                logger.warning(f"PATCH /triage-cases/{id} - patient not found")
-                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Patient not found")
-            
-            log_changes(
-                session=db,
-                old_record=patient,
-                new_values=patient_updates,
-                changelog_model=PatientChangelog,
-                foreign_key_field='patientID',
-                record_id=case.patientID,
-                user_id=current_user.userID
-            )
-            
-            patient.sqlmodel_update(patient_updates)
-            db.add(patient)
+            uow.log_changes(patient, patient_updates, PatientChangelog, 'patientID', case.patientID)
+            patient = uow.update(Patient, case.patientID, patient_updates)
         
         if case_updates:
-            log_changes(
-                session=db,
-                old_record=case,
-                new_values=case_updates,
-                changelog_model=TriageCaseChangelog,
-                foreign_key_field='caseID',
-                record_id=id,
-                user_id=current_user.userID
+            uow.log_changes(case, case_updates, TriageCaseChangelog, 'caseID', id)
+            if 'overrideUrgency' in case_updates:
+                case_updates = {**case_updates, 'previousUrgency': derive_previous_urgency(case, case_updates['overrideUrgency'])}
+            case = uow.update(TriageCase, id, case_updates)
+            uow.audit(
+                "UPDATE_CASE",
+                "TRIAGE_CASE",
+                id,
+                fields_modified=[field for field in case_updates if field != 'previousUrgency'],
             )
-            
-            case.sqlmodel_update(case_updates)
-            db.add(case)
-            
-        db.commit()
-        db.refresh(case)
-
-        if case_updates:
-            try:
-                audit_meta = get_audit_meta(request) if request is not None else {"ip": None}
-                modified_fields = list(case_updates.keys())
-                AuditService.create_log(
-                    db,
-                    action="UPDATE_CASE",
-                    status="SUCCESS",
-                    actor_id=current_user.userID,
-                    actor_type=current_user.role,
-                    resource_type="TRIAGE_CASE",
-                    resource_id=case.caseID,
-                    fields_modified=modified_fields,
-                    ip=audit_meta.get("ip"),
-                )
-            except Exception:
-                logger.exception("Failed to write audit log for case update")            
         
-        return build_case_public(case, db)
+        # built from the RETURNING rows; commit expires them
+        case_public = to_case_public(case, patient)
+        uow.commit()
+        if patient_updates:
+            invalidate_patient_cases(db, case_public.patientID)
+        else:
+            invalidate_cases(id)
+        
+        publish_case_event(
+            "updated",
+            id,
+            actor_id=current_user.userID,
+            status=case_public.status,
+            urgency=case_public.overrideUrgency or case_public.AIUrgency,
+            fields=list(update_data.keys()),
+        )
+        return case_public
     except HTTPException:
         db.rollback()
         raise
@@ -340,26 +808,14 @@ def delete_case(
             logger.warning(f"DELETE /triage-cases/{id} - case not found")
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Triage case not found")
         
+        uow = UnitOfWork(db, current_user, request)
+        uow.audit("DELETE_CASE", "TRIAGE_CASE", id)
+        uow.flush_audit()
         db.delete(case)
-        db.commit()
-        
-        # Log case deletion
-        try:
-            audit_meta = get_audit_meta(request) if request is not None else {"ip": None}
-            AuditService.create_log(
-                db,
-                action="DELETE_CASE",
-                status="SUCCESS",
-                actor_id=current_user.userID,
-                actor_type=current_user.role,
-                resource_type="TRIAGE_CASE",
-                resource_id=id,
-                fields_modified=None,
-                ip=audit_meta.get("ip"),
-            )
-        except Exception:
-            logger.exception("Failed to write audit log for case deletion")
-    
+        uow.commit()
+        invalidate_cases(id)
+
+        publish_case_event("deleted", id, actor_id=current_user.userID)
         logger.info(f"DELETE /triage-cases/{id} - deleted successfully")
         return Message(message="Triage case deleted successfully")
     except HTTPException:
@@ -385,9 +841,14 @@ def review_case(
         if not update.reviewReason or not update.reviewReason.strip():
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Review reason is required and cannot be empty")
         
-        case = db.get(TriageCase, id)
-        if not case:
+        row = db.exec(
+            select(TriageCase, Patient)
+            .join(Patient, Patient.patientID == TriageCase.patientID)
+            .where(TriageCase.caseID == id)
+        ).first()
+        if not row:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Triage case not found")
+        case, patient = row
         
         if case.status == "reviewed":
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Case is already reviewed")
@@ -399,45 +860,28 @@ def review_case(
             'reviewTimestamp': datetime.now()
         }
         
-        log_changes(
-            session=db,
-            old_record=case,
-            new_values=review_updates,
-            changelog_model=TriageCaseChangelog,
-            foreign_key_field='caseID',
-            record_id=id,
-            user_id=current_user.userID,
-            exclude_fields=['reviewedBy'],
-        )
+        uow = UnitOfWork(db, current_user, request)
+        uow.log_changes(case, review_updates, TriageCaseChangelog, 'caseID', id, exclude_fields=['reviewedBy'])
+        case = uow.update(TriageCase, id, {
+            **review_updates,
+            'reviewedByEmail': current_user.email,
+            'leasedBy': None,
+            'leaseExpiresAt': None,
+        })
+        uow.audit("REVIEW_CASE", "TRIAGE_CASE", id, fields_modified=["status", "reviewReason", "reviewedBy", "reviewTimestamp"])
         
-        case.status = review_updates["status"]
-        case.reviewReason = review_updates["reviewReason"]
-        case.reviewedBy = review_updates["reviewedBy"]
-        case.reviewTimestamp = review_updates["reviewTimestamp"]
-
-        db.add(case)
-        db.commit()
-        db.refresh(case)
-        
-        # Log case review
-        try:
-            audit_meta = get_audit_meta(request) if request is not None else {"ip": None}
-            fields_modified = ["status", "reviewReason", "reviewedBy", "reviewTimestamp"]
-            AuditService.create_log(
-                db,
-                action="REVIEW_CASE",
-                status="SUCCESS",
-                actor_id=current_user.userID,
-                actor_type=current_user.role,
-                resource_type="TRIAGE_CASE",
-                resource_id=case.caseID,
-                fields_modified=fields_modified,
-                ip=audit_meta.get("ip"),
-            )
-        except Exception:
-            logger.exception("Failed to write audit log for case review")
+        case_public = to_case_public(case, patient)
+        uow.commit()
+        invalidate_cases(id)
     
-        return build_case_public(case, db)
+        publish_case_event(
+            "reviewed",
+            id,
+            actor_id=current_user.userID,
+            status=case_public.status,
+            urgency=case_public.overrideUrgency or case_public.AIUrgency,
+        )
+        return case_public
     except HTTPException:
         db.rollback()
         raise
@@ -449,45 +893,52 @@ def review_case(
 @router.get("/{id}/changelog")
 def get_case_changelog(
     id: uuid.UUID,
+    response: Response,
+    limit: int = MAX_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    field: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ) -> Any:
-    logger.info(f"GET /triage-cases/{id}/changelog - user: {current_user.email}")
+    logger.info(f"GET /triage-cases/{id}/changelog - user: {current_user.email}, limit: {limit}, cursor: {cursor}, field: {field}")
     
     try:
-        case = db.get(TriageCase, id)
-        if not case:
+        if not db.exec(select(TriageCase.caseID).where(TriageCase.caseID == id)).first():
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Triage case not found")
         
-        statement = (
-            select(
-                TriageCaseChangelog,
-                User.email.label('changedByEmail')
-            )
-            .join(User, TriageCaseChangelog.changedBy == User.userID)
-            .where(TriageCaseChangelog.caseID == id)
-            .order_by(TriageCaseChangelog.changedAt.desc())
-        )
-        
-        results = db.exec(statement).all()
-        
-        return [
-            {
-                "id": str(changelog.id),
-                "changedAt": changelog.changedAt.isoformat(),
-                "fieldName": changelog.fieldName,
-                "oldValue": changelog.oldValue,
-                "newValue": changelog.newValue,
-                "changedByEmail": changed_by_email
-            }
-            for changelog, changed_by_email in results
-        ]
+        entries, next_cursor = changelog_page(db, TriageCaseChangelog, 'caseID', id, clamp_limit(limit), cursor, field)
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+        return entries
     except HTTPException:
         raise
     except Exception as e:
         logger.exception(f"GET /triage-cases/{id}/changelog - Error: {str(e)}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to retrieve case changelog")
 
+@router.get("/{id}/timeline", response_model=CaseTimelinePublic)
+def get_case_timeline(
+    id: uuid.UUID,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+) -> Any:
+    logger.info(f"GET /triage-cases/{id}/timeline - user: {current_user.email}, limit: {limit}, cursor: {cursor}")
+    
+    try:
+        limit = clamp_limit(limit)
+        patient_id = db.exec(select(TriageCase.patientID).where(TriageCase.caseID == id)).first()
+        if not patient_id:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Triage case not found")
+        
+        return case_timeline(db, id, patient_id, limit, cursor)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"GET /triage-cases/{id}/timeline - Error: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to retrieve case timeline")
+
 # ================= CASE FILES ENDPOINTS =================
 # get upload url
 @router.get("/{id}/upload-url")
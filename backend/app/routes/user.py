@@ -2,13 +2,16 @@ from datetime import datetime
 import logging
 
 from fastapi import APIRouter, HTTPException, Depends, status, Request
+from sqlalchemy import update
 from sqlmodel import Session, select
 
 from app.core.config import settings
 from app.core.dependencies import get_db
 from app.auth.dependencies import get_current_user
-from app.models.models import User, UserPublic, UserCreate, UserUpdate, UsersList
+from app.models.models import User, UserPublic, UserCreate, UserUpdate, UsersList, TriageCase
+from app.core.cache import invalidate_cases
 from app.core.audit import AuditService
+from app.core.audit_rollup import record_read
 from app.core.audit_middleware import get_audit_meta
 from app.core.security import EmailTokenType
 from app.auth.helpers.mailer import send_token_email
@@ -60,16 +63,14 @@ def list_users(
 
 	try:
 		audit_meta = get_audit_meta(request) if request is not None else {"ip": None}
-		AuditService.create_log(
+		record_read(
 			db,
 			action="LIST_USERS",
-			status="SUCCESS",
 			actor_id=current_user.userID,
 			actor_type=current_user.role,
 			resource_type="USER",
-			resource_id=None,
-			fields_modified=None,
-			changeDetails={"limit": limit, "returned_count": len(results)},
+			params={"limit": limit, "offset": offset},
+			returned_count=len(results),
 			ip=audit_meta.get("ip"),
 		)
 	except Exception:
@@ -203,6 +204,13 @@ def update_user(user_id: str, payload: UserUpdate, db: Session = Depends(get_db)
 	if payload.email is not None:
 		user.email = payload.email
 		modified_fields.append("email")
+		# keep the reviewer email denormalized on triage cases in step
+		reviewed_case_ids = db.execute(
+			update(TriageCase)
+			.where(TriageCase.reviewedBy == user.userID)
+			.values(reviewedByEmail=payload.email)
+			.returning(TriageCase.caseID)
+		).scalars().all()
 	if payload.role is not None:
 		user.role = payload.role.lower()
 		modified_fields.append("role")
@@ -219,6 +227,8 @@ def update_user(user_id: str, payload: UserUpdate, db: Session = Depends(get_db)
 	db.add(user)
 	db.commit()
 	db.refresh(user)
+	if payload.email is not None:
+		invalidate_cases(*reviewed_case_ids)
 
 	if modified_fields:
 		try:
@@ -0,0 +1,343 @@
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, Optional
+from uuid import UUID
+from sqlmodel import Session, select
+from app.core.audit import AuditService
+from app.core.database import engine
+from app.models import AuditLog, AuditChainHead, AuditChainAnchor, AuditVerificationRun
+
+logger = logging.getLogger(__name__)
+
+STREAM_BATCH_SIZE = 10000
+PARTITIONS_PER_WORKER = 4
+INCREMENTAL_CHUNK_SIZE = 5000
+MAX_REPORTED_BREAKS = 1000
+# heads advanced by transactions that committed after the previous run's snapshot are re-checked
+INCREMENTAL_OVERLAP = timedelta(minutes=5)
+STALE_RUN_AFTER = timedelta(hours=6)
+UUID_SPACE = 1 << 128
+
+CHAIN_COLUMNS = (
+    AuditLog.logID,
+    AuditLog.actorID,
+    AuditLog.actorType,
+    AuditLog.resourceType,
+    AuditLog.resourceID,
+    AuditLog.action,
+    AuditLog.status,
+    AuditLog.timestamp,
+    AuditLog.hash,
+    AuditLog.previousHash,
+)
+
+
+class VerificationInProgress(Exception):
+    pass
+
+
+def recompute_hash(row) -> str:
+    # Same inputs as AuditService.build_log; timestamps come back in the session time zone
+    return AuditService.compute_hash(
+        log_id=str(row.logID),
+        actor_id=str(row.actorID) if row.actorID else None,
+        actor_type=row.actorType,
+        resource_type=row.resourceType,
+        resource_id=str(row.resourceID) if row.resourceID else None,
+        action=row.action,
+        status=row.status,
+        timestamp=row.timestamp.astimezone(timezone.utc).isoformat(),
+        previous_hash=row.previousHash,
+    )
+
+
+class PartitionResult:
+    # Counters and (capped) break list for one worker task; merged by the coordinator
+
+    def __init__(self):
+        self.rows = 0
+        self.resources = 0
+        self.broken_count = 0
+        self.broken: list[dict] = []
+
+    def record(self, resource_type: Optional[str], resource_id: Optional[UUID], log_id: Optional[UUID], problem: str) -> None:
+        self.broken_count += 1
+        if len(self.broken) < MAX_REPORTED_BREAKS:
+            self.broken.append({
+                "resourceType": resource_type,
+                "resourceID": str(resource_id) if resource_id else None,
+                "logID": str(log_id) if log_id else None,
+                "problem": problem,
+            })
+
+    def to_dict(self) -> dict:
+        return {
+            "rows": self.rows,
+            "resources": self.resources,
+            "broken_count": self.broken_count,
+            "broken": self.broken,
+        }
+
+
+def check_chain(
+    resource_type: str,
+    resource_id: UUID,
+    rows: list,
+    head_hash: Optional[str],
+    result: PartitionResult,
+    anchor_hash: Optional[str] = None,
+) -> None:
+    """
+    Verify one resource's chain by linkage rather than timestamp order: every hash must recompute,
+    exactly one entry starts the chain, every previousHash points at an entry in the chain, no two
+    entries claim the same predecessor, and the unreferenced tip matches AuditChainHead.
+    Once part of a chain has been archived, its AuditChainAnchor hash takes the place of the genesis entry.
+    """
+    result.resources += 1
+    hashes = set()
+    successors = {}
+    genesis = []
+    for row in rows:
+        if row.hash is None:
+            result.record(resource_type, resource_id, row.logID, "missing_hash")
+            continue
+        if recompute_hash(row) != row.hash:
+            result.record(resource_type, resource_id, row.logID, "hash_mismatch")
+        hashes.add(row.hash)
+        if row.previousHash is None:
+            genesis.append(row)
+        elif row.previousHash in successors:
+            result.record(resource_type, resource_id, row.logID, "fork")
+        else:
+            successors[row.previousHash] = row
+
+    if not hashes:
+        return
+    if anchor_hash is None and not genesis:
+        result.record(resource_type, resource_id, None, "missing_genesis")
+    for extra in genesis[0 if anchor_hash is not None else 1:]:
+        result.record(resource_type, resource_id, extra.logID, "multiple_genesis")
+    for previous_hash, row in successors.items():
+        if previous_hash not in hashes and previous_hash != anchor_hash:
+            result.record(resource_type, resource_id, row.logID, "dangling_link")
+
+    tips = hashes - successors.keys()
+    if head_hash is not None and head_hash not in tips:
+        result.record(resource_type, resource_id, None, "head_mismatch")
+
+
+def check_unscoped(row, result: PartitionResult) -> None:
+    # Entries without a full (resourceType, resourceID) are never chained
+    if row.hash is None:
+        result.record(row.resourceType, row.resourceID, row.logID, "missing_hash")
+    elif recompute_hash(row) != row.hash:
+        result.record(row.resourceType, row.resourceID, row.logID, "hash_mismatch")
+    elif row.previousHash is not None:
+        result.record(row.resourceType, row.resourceID, row.logID, "dangling_link")
+
+
+def stream(session: Session, statement) -> Iterator:
+    # Server-side cursor: rows arrive in STREAM_BATCH_SIZE chunks instead of being buffered client-side
+    return iter(session.execute(statement.execution_options(yield_per=STREAM_BATCH_SIZE)))
+
+
+class OrderedLookup:
+    # Walks a (resourceType, resourceID, hash) stream ordered by resourceID alongside the log stream;
+    # both sides sort UUIDs by their bytes (Postgres) / integer value (Python), which agree
+
+    def __init__(self, rows: Iterator):
+        self.rows = rows
+        self.pending = next(rows, None)
+
+    def hashes_for(self, resource_id: UUID) -> dict[str, str]:
+        found = {}
+        while self.pending is not None and self.pending.resourceID <= resource_id:
+            if self.pending.resourceID == resource_id:
+                found[self.pending.resourceType] = self.pending.hash
+            self.pending = next(self.rows, None)
+        return found
+
+
+def verify_partition(
+    lower: Optional[UUID] = None,
+    upper: Optional[UUID] = None,
+    resource_keys: Optional[list[tuple[str, UUID]]] = None,
+    include_unscoped: bool = False,
+) -> dict:
+    """
+    Worker entry point. Verifies every chain whose resourceID falls in [lower, upper), or only the
+    given (resourceType, resourceID) keys. Log rows, chain heads and archive anchors are all streamed
+    in resourceID order and merged, so memory stays bounded by the largest single chain.
+    """
+    result = PartitionResult()
+    keys = set(resource_keys) if resource_keys is not None else None
+    resource_ids = sorted({resource_id for _, resource_id in keys}) if keys is not None else None
+
+    def restrict(statement, resource_column):
+        if resource_ids is not None:
+            return statement.where(resource_column.in_(resource_ids))
+        statement = statement.where(resource_column.is_not(None))
+        if lower is not None:
+            statement = statement.where(resource_column >= lower)
+        if upper is not None:
+            statement = statement.where(resource_column < upper)
+        return statement
+
+    log_statement = restrict(select(*CHAIN_COLUMNS).order_by(AuditLog.resourceID), AuditLog.resourceID)
+    side_statements = [
+        restrict(select(model.resourceType, model.resourceID, model.hash).order_by(model.resourceID), model.resourceID)
+        for model in (AuditChainHead, AuditChainAnchor)
+    ]
+
+    with Session(engine) as session:
+        heads, anchors = (OrderedLookup(stream(session, statement)) for statement in side_statements)
+
+        def finish(resource_id: UUID, chains: dict[Optional[str], list]) -> None:
+            head_hashes = heads.hashes_for(resource_id)
+            anchor_hashes = anchors.hashes_for(resource_id)
+            for resource_type, rows in chains.items():
+                if resource_type is None:
+                    for row in rows:
+                        check_unscoped(row, result)
+                elif keys is None or (resource_type, resource_id) in keys:
+                    check_chain(
+                        resource_type,
+                        resource_id,
+                        rows,
+                        head_hashes.get(resource_type),
+                        result,
+                        anchor_hashes.get(resource_type),
+                    )
+
+        current_id = None
+        chains: dict[Optional[str], list] = {}
+        for row in stream(session, log_statement):
+            result.rows += 1
+            if row.resourceID != current_id:
+                if chains:
+                    finish(current_id, chains)
+                current_id = row.resourceID
+                chains = {}
+            chains.setdefault(row.resourceType, []).append(row)
+        if chains:
+            finish(current_id, chains)
+
+        if include_unscoped:
+            for row in stream(session, select(*CHAIN_COLUMNS).where(AuditLog.resourceID.is_(None))):
+                result.rows += 1
+                check_unscoped(row, result)
+
+    return result.to_dict()
+
+
+def partition_bounds(partitions: int) -> list[tuple[Optional[UUID], Optional[UUID]]]:
+    # Equal slices of the UUID space; resource IDs are uuid4 so rows spread evenly
+    step = UUID_SPACE // partitions
+    return [
+        (
+            UUID(int=index * step) if index else None,
+            UUID(int=(index + 1) * step) if index < partitions - 1 else None,
+        )
+        for index in range(partitions)
+    ]
+
+
+def last_completed_run(db: Session) -> Optional[AuditVerificationRun]:
+    statement = (
+        select(AuditVerificationRun)
+        .where(AuditVerificationRun.status.in_(["passed", "failed"]))
+        .order_by(AuditVerificationRun.startedAt.desc())
+        .limit(1)
+    )
+    return db.exec(statement).first()
+
+
+def start_run(db: Session, mode: str = "incremental") -> AuditVerificationRun:
+    # Record a new run, refusing while another one is still in progress
+    running = db.exec(
+        select(AuditVerificationRun)
+        .where(AuditVerificationRun.status == "running")
+        .where(AuditVerificationRun.startedAt > datetime.now(timezone.utc) - STALE_RUN_AFTER)
+    ).first()
+    if running:
+        raise VerificationInProgress(f"Audit chain verification {running.runID} is already running")
+
+    # nothing to be incremental against yet
+    if mode == "incremental" and last_completed_run(db) is None:
+        mode = "full"
+
+    run = AuditVerificationRun(mode=mode)
+    db.add(run)
+    db.commit()
+    db.refresh(run)
+    return run
+
+
+def build_tasks(db: Session, run: AuditVerificationRun, workers: int) -> list[dict]:
+    if run.mode == "full":
+        bounds = partition_bounds(workers * PARTITIONS_PER_WORKER)
+        return [
+            {"lower": lower, "upper": upper, "include_unscoped": index == 0}
+            for index, (lower, upper) in enumerate(bounds)
+        ]
+
+    checkpoint = last_completed_run(db)
+    changed = db.exec(
+        select(AuditChainHead.resourceType, AuditChainHead.resourceID)
+        .where(AuditChainHead.updatedAt > checkpoint.startedAt - INCREMENTAL_OVERLAP)
+        .order_by(AuditChainHead.resourceID)
+    ).all()
+    keys = [(resource_type, resource_id) for resource_type, resource_id in changed]
+    return [
+        {"resource_keys": keys[start:start + INCREMENTAL_CHUNK_SIZE]}
+        for start in range(0, len(keys), INCREMENTAL_CHUNK_SIZE)
+    ]
+
+
+def execute_run(run_id: UUID, workers: int) -> AuditVerificationRun:
+    """
+    Fan the run's partitions out over a process pool and store the merged report on the run row.
+    Workers are spawned rather than forked so none of them inherits this process's pooled connections.
+    """
+    with Session(engine) as db:
+        run = db.get(AuditVerificationRun, run_id)
+        try:
+            tasks = build_tasks(db, run, workers)
+            totals = PartitionResult()
+            if tasks:
+                context = multiprocessing.get_context("spawn")
+                with ProcessPoolExecutor(max_workers=min(workers, len(tasks)), mp_context=context) as executor:
+                    futures = [executor.submit(verify_partition, **task) for task in tasks]
+                    for future in as_completed(futures):
+                        partial = future.result()
+                        totals.rows += partial["rows"]
+                        totals.resources += partial["resources"]
+                        totals.broken_count += partial["broken_count"]
+                        totals.broken.extend(partial["broken"][:MAX_REPORTED_BREAKS - len(totals.broken)])
+
+            run.status = "failed" if totals.broken_count else "passed"
+            run.rowsChecked = totals.rows
+            run.resourcesChecked = totals.resources
+            run.brokenCount = totals.broken_count
+            run.report = {
+                "tasks": len(tasks),
+                "workers": workers,
+                "broken": totals.broken,
+                "truncated": totals.broken_count > len(totals.broken),
+            }
+        except Exception as e:
+            logger.exception(f"Audit chain verification {run_id} failed")
+            run.status = "error"
+            run.report = {"error": str(e)}
+        run.finishedAt = datetime.now(timezone.utc)
+        db.add(run)
+        db.commit()
+        db.refresh(run)
+
+    logger.info(
+        f"Audit chain verification {run_id}: status={run.status}, mode={run.mode}, "
+        f"resources={run.resourcesChecked}, rows={run.rowsChecked}, broken={run.brokenCount}"
+    )
+    return run
@@ -0,0 +1,172 @@
+import gzip
+import json
+import uuid
+import logging
+from typing import Optional
+from datetime import datetime, timezone
+from sqlalchemy import tuple_
+from sqlmodel import Session, select
+from app.core.config import settings
+from app.core.database import engine
+from app.core.redis import redis_client
+from app.core.s3 import s3_client, BUCKET_NAME
+from app.models import AuditLog, AuditLogExportCreate, AuditLogExportStatus
+from app.utils.audit_filters import audit_log_filters
+from app.utils.s3_helpers import generate_presigned_download_url
+
+logger = logging.getLogger(__name__)
+
+EXPORT_BATCH_SIZE = 5000
+# S3 needs every part but the last to be at least 5 MiB
+PART_SIZE = 8 * 1024 * 1024
+EXPORT_KEY_PREFIX = "audit-export:"
+EXPORT_STATUS_TTL_SECONDS = 7 * 24 * 60 * 60
+DOWNLOAD_URL_EXPIRATION = 60 * 60
+
+
+class MultipartUploadWriter:
+    # File-like sink for GzipFile: buffers compressed output and ships it as S3 multipart parts,
+    # so at most one part is held in memory whatever the export size
+
+    def __init__(self, key: str):
+        self.key = key
+        self.upload_id = s3_client.create_multipart_upload(
+            Bucket=BUCKET_NAME, Key=key, ContentType="application/gzip"
+        )["UploadId"]
+        self.parts: list[dict] = []
+        self.buffer = bytearray()
+        self.bytes_written = 0
+
+    def write(self, data: bytes) -> int:
+        self.buffer.extend(data)
+        if len(self.buffer) >= PART_SIZE:
+            self._upload_part()
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def _upload_part(self) -> None:
+        part_number = len(self.parts) + 1
+        response = s3_client.upload_part(
+            Bucket=BUCKET_NAME,
+            Key=self.key,
+            UploadId=self.upload_id,
+            PartNumber=part_number,
+            Body=bytes(self.buffer),
+        )
+        self.parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+        self.bytes_written += len(self.buffer)
+        self.buffer.clear()
+
+    def complete(self) -> None:
+        if self.buffer or not self.parts:
+            self._upload_part()
+        s3_client.complete_multipart_upload(
+            Bucket=BUCKET_NAME,
+            Key=self.key,
+            UploadId=self.upload_id,
+            MultipartUpload={"Parts": self.parts},
+        )
+
+    def abort(self) -> None:
+        s3_client.abort_multipart_upload(Bucket=BUCKET_NAME, Key=self.key, UploadId=self.upload_id)
+
+
+def save_export(job: AuditLogExportStatus) -> None:
+    redis_client.setex(f"{EXPORT_KEY_PREFIX}{job.exportID}", EXPORT_STATUS_TTL_SECONDS, job.model_dump_json())
+
+
+def load_export(export_id: uuid.UUID) -> Optional[AuditLogExportStatus]:
+    payload = redis_client.get(f"{EXPORT_KEY_PREFIX}{export_id}")
+    return AuditLogExportStatus.model_validate_json(payload) if payload else None
+
+
+def create_export(filters: AuditLogExportCreate, requested_by: Optional[uuid.UUID]) -> AuditLogExportStatus:
+    job = AuditLogExportStatus(
+        exportID=uuid.uuid4(),
+        status="queued",
+        filters=filters,
+        requestedBy=requested_by,
+        createdAt=datetime.now(timezone.utc),
+    )
+    save_export(job)
+    return job
+
+
+def export_filters(filters: AuditLogExportCreate) -> list:
+    return audit_log_filters(
+        filters.actorID,
+        filters.resourceType,
+        filters.resourceID,
+        filters.action,
+        filters.status,
+        filters.ip,
+        filters.since,
+        filters.until,
+    )
+
+
+def run_export(export_id: uuid.UUID) -> None:
+    """
+    Write every matching AuditLog row, oldest first, to gzip JSONL in object storage.
+    Rows are read in keyset batches over (timestamp, logID), each in its own short session, so no
+    connection is held across the upload and memory is bounded by one batch plus one part.
+    """
+    job = load_export(export_id)
+    if job is None:
+        logger.warning(f"Audit export {export_id} expired before it started")
+        return
+
+    job.status = "running"
+    job.objectKey = f"{settings.AUDIT_EXPORT_PREFIX}/{export_id}.jsonl.gz"
+    save_export(job)
+
+    writer = None
+    try:
+        filters = export_filters(job.filters)
+        writer = MultipartUploadWriter(job.objectKey)
+        after = None
+        with gzip.GzipFile(fileobj=writer, mode="wb") as archive:
+            while True:
+                statement = select(AuditLog).where(*filters)
+                if after:
+                    statement = statement.where(tuple_(AuditLog.timestamp, AuditLog.logID) > after)
+                statement = statement.order_by(AuditLog.timestamp, AuditLog.logID).limit(EXPORT_BATCH_SIZE)
+                with Session(engine) as session:
+                    logs = session.exec(statement).all()
+
+                for log in logs:
+                    archive.write((json.dumps(log.model_dump(mode="json")) + "\n").encode())
+                job.rows += len(logs)
+                if len(logs) < EXPORT_BATCH_SIZE:
+                    break
+                after = (logs[-1].timestamp, logs[-1].logID)
+                # progress for anyone polling the status endpoint
+                save_export(job)
+        writer.complete()
+
+        job.status = "completed"
+        job.bytes = writer.bytes_written
+        job.completedAt = datetime.now(timezone.utc)
+        logger.info(f"Audit export {export_id} completed: rows={job.rows}, bytes={job.bytes}, key={job.objectKey}")
+    except Exception as e:
+        logger.exception(f"Audit export {export_id} failed")
+        if writer is not None:
+            try:
+                writer.abort()
+            except Exception:
+                logger.exception(f"Failed to abort multipart upload for audit export {export_id}")
+        job.status = "failed"
+        job.error = str(e)
+    save_export(job)
+
+
+def get_export(export_id: uuid.UUID) -> Optional[AuditLogExportStatus]:
+    # Completed exports get a fresh presigned URL on every poll
+    job = load_export(export_id)
+    if job and job.status == "completed" and job.objectKey:
+        download = generate_presigned_download_url(job.objectKey, DOWNLOAD_URL_EXPIRATION)
+        job.downloadUrl = download["url"]
+        job.expiresAt = download["expiresAt"]
+    return job
@@ -0,0 +1,45 @@
+import uuid
+import ipaddress
+from typing import Optional
+from datetime import datetime
+from fastapi import HTTPException, status
+from sqlalchemy import cast
+from sqlalchemy.dialects.postgresql import INET
+from app.models import AuditLog
+
+
+def audit_log_filters(
+    actorID: Optional[uuid.UUID] = None,
+    resourceType: Optional[str] = None,
+    resourceID: Optional[uuid.UUID] = None,
+    action: Optional[str] = None,
+    status_filter: Optional[str] = None,
+    ip: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> list:
+    # WHERE clauses shared by the audit log query and export endpoints
+    filters = []
+    if actorID:
+        filters.append(AuditLog.actorID == actorID)
+    if resourceType:
+        filters.append(AuditLog.resourceType == resourceType)
+    if resourceID:
+        filters.append(AuditLog.resourceID == resourceID)
+    if action:
+        filters.append(AuditLog.action == action)
+    if status_filter:
+        filters.append(AuditLog.status == status_filter)
+    if ip:
+        # a single address or a CIDR block (e.g. 10.0.0.0/8)
+        try:
+            network = ipaddress.ip_network(ip, strict=False)
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid IP address or network")
+        filters.append(AuditLog.ipAddress.op("<<=")(cast(str(network), INET)))
+    # time bounds also let Postgres prune monthly partitions
+    if since:
+        filters.append(AuditLog.timestamp >= since)
+    if until:
+        filters.append(AuditLog.timestamp < until)
+    return filters
@@ -0,0 +1,205 @@
+import json
+import base64
+import hashlib
+import logging
+from typing import Optional
+from uuid import UUID
+from datetime import timezone
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from sqlalchemy import delete, insert, text, tuple_
+from sqlmodel import Session, select
+from app.core.config import settings
+from app.models import (
+    AuditLog,
+    AuditMerkleCheckpoint,
+    AuditMerkleCheckpointPublic,
+    AuditMerkleLeaf,
+    AuditMerkleNode,
+    AuditMerklePending,
+    AuditMerkleProofStep,
+    AuditInclusionProof,
+)
+
+logger = logging.getLogger(__name__)
+
+MERKLE_BATCH_SIZE = 65536
+SIGNATURE_ALGORITHM = "Ed25519"
+
+
+def leaf_hash(entry_hash: str) -> str:
+    # Domain-separated from interior nodes (RFC 6962 style) so a leaf can't pose as a subtree
+    return hashlib.sha256(b"\x00" + entry_hash.encode()).hexdigest()
+
+
+def node_hash(left: str, right: str) -> str:
+    return hashlib.sha256(b"\x01" + bytes.fromhex(left) + bytes.fromhex(right)).hexdigest()
+
+
+def build_levels(leaves: list[str]) -> list[list[str]]:
+    # Bottom-up tree; an unpaired last node is carried up to the next level unchanged
+    levels = [leaves]
+    while len(levels[-1]) > 1:
+        current = levels[-1]
+        levels.append([
+            node_hash(current[index], current[index + 1]) if index + 1 < len(current) else current[index]
+            for index in range(0, len(current), 2)
+        ])
+    return levels
+
+
+def proof_positions(leaf_index: int, leaf_count: int) -> list[tuple[int, int, str]]:
+    # (level, nodeIndex, side) of each sibling on the path from the leaf to the root
+    positions = []
+    index, width, level = leaf_index, leaf_count, 0
+    while width > 1:
+        sibling = index ^ 1
+        if sibling < width:
+            positions.append((level, sibling, "left" if sibling < index else "right"))
+        index, width, level = index // 2, (width + 1) // 2, level + 1
+    return positions
+
+
+def verify_proof(leaf: str, proof: list[AuditMerkleProofStep], root: str) -> bool:
+    current = leaf
+    for step in proof:
+        current = node_hash(step.hash, current) if step.position == "left" else node_hash(current, step.hash)
+    return current == root
+
+
+def checkpoint_payload(checkpoint: AuditMerkleCheckpoint) -> str:
+    return json.dumps({
+        "checkpointID": str(checkpoint.checkpointID),
+        "sequence": checkpoint.sequence,
+        "leafCount": checkpoint.leafCount,
+        "rootHash": checkpoint.rootHash,
+        "previousRoot": checkpoint.previousRoot,
+        "firstTimestamp": checkpoint.firstTimestamp.astimezone(timezone.utc).isoformat(),
+        "lastTimestamp": checkpoint.lastTimestamp.astimezone(timezone.utc).isoformat(),
+    }, sort_keys=True, separators=(",", ":"))
+
+
+def signing_key() -> Optional[Ed25519PrivateKey]:
+    if not settings.AUDIT_SIGNING_KEY:
+        return None
+    key = serialization.load_pem_private_key(settings.AUDIT_SIGNING_KEY.encode(), password=None)
+    if not isinstance(key, Ed25519PrivateKey):
+        raise ValueError("AUDIT_SIGNING_KEY must be an Ed25519 private key")
+    return key
+
+
+def public_key_pem() -> Optional[str]:
+    key = signing_key()
+    if key is None:
+        return None
+    return key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+
+
+def to_checkpoint_public(checkpoint: AuditMerkleCheckpoint) -> AuditMerkleCheckpointPublic:
+    return AuditMerkleCheckpointPublic(
+        **checkpoint.model_dump(exclude={"createdAt"}),
+        signedPayload=checkpoint_payload(checkpoint),
+    )
+
+
+def build_checkpoint(db: Session) -> Optional[AuditMerkleCheckpoint]:
+    """
+    Checkpoint the next batch (up to MERKLE_BATCH_SIZE) of entries queued in AuditMerklePending,
+    ordered by (timestamp, logID), and dequeue them. Entries are selected by membership in the queue,
+    not by timestamp, so ones inserted long after their timestamp are still covered. Returns None
+    when there is nothing to checkpoint.
+    """
+    # one builder at a time, so sequences and previousRoot links stay linear
+    db.exec(text("SELECT pg_advisory_xact_lock(hashtext('audit-merkle-checkpoint'))"))
+
+    last = db.exec(select(AuditMerkleCheckpoint).order_by(AuditMerkleCheckpoint.sequence.desc()).limit(1)).first()
+    rows = db.exec(
+        select(AuditMerklePending.logID, AuditMerklePending.timestamp, AuditMerklePending.hash)
+        .order_by(AuditMerklePending.timestamp, AuditMerklePending.logID)
+        .limit(MERKLE_BATCH_SIZE)
+    ).all()
+    if not rows:
+        db.rollback()
+        return None
+
+    levels = build_levels([leaf_hash(row.hash) for row in rows])
+    checkpoint = AuditMerkleCheckpoint(
+        sequence=last.sequence + 1 if last else 1,
+        leafCount=len(rows),
+        rootHash=levels[-1][0],
+        previousRoot=last.rootHash if last else None,
+        firstTimestamp=rows[0].timestamp,
+        lastTimestamp=rows[-1].timestamp,
+    )
+    key = signing_key()
+    if key is not None:
+        checkpoint.signature = base64.b64encode(key.sign(checkpoint_payload(checkpoint).encode())).decode()
+        checkpoint.signatureAlgorithm = SIGNATURE_ALGORITHM
+    else:
+        logger.warning("AUDIT_SIGNING_KEY is not set; storing an unsigned Merkle checkpoint")
+
+    db.add(checkpoint)
+    db.flush()
+    db.execute(
+        insert(AuditMerkleLeaf),
+        [{"logID": row.logID, "checkpointID": checkpoint.checkpointID, "leafIndex": index} for index, row in enumerate(rows)],
+    )
+    db.execute(delete(AuditMerklePending).where(AuditMerklePending.logID.in_([row.logID for row in rows])))
+    db.execute(
+        insert(AuditMerkleNode),
+        [
+            {"checkpointID": checkpoint.checkpointID, "level": level, "nodeIndex": index, "hash": node}
+            for level, nodes in enumerate(levels)
+            for index, node in enumerate(nodes)
+        ],
+    )
+    db.commit()
+    db.refresh(checkpoint)
+    logger.info(f"Merkle checkpoint {checkpoint.sequence}: leaves={checkpoint.leafCount}, root={checkpoint.rootHash}")
+    return checkpoint
+
+
+def queue_uncheckpointed(db: Session) -> int:
+    # One-off for databases that predate AuditMerklePending: queue every hashed entry not yet in a tree
+    result = db.execute(text("""
+        INSERT INTO ent."AuditMerklePending" ("logID", "timestamp", "hash")
+        SELECT l."logID", l."timestamp", l."hash"
+        FROM ent."AuditLog" l
+        WHERE l."hash" IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM ent."AuditMerkleLeaf" leaf WHERE leaf."logID" = l."logID")
+        ON CONFLICT ("logID") DO NOTHING
+    """))
+    db.commit()
+    return result.rowcount
+
+
+def inclusion_proof(db: Session, log_id: UUID) -> Optional[AuditInclusionProof]:
+    # Leaf plus one sibling per tree level, read in a single primary-key lookup
+    leaf = db.get(AuditMerkleLeaf, log_id)
+    if leaf is None:
+        return None
+    checkpoint = db.get(AuditMerkleCheckpoint, leaf.checkpointID)
+
+    positions = proof_positions(leaf.leafIndex, checkpoint.leafCount)
+    wanted = [(0, leaf.leafIndex)] + [(level, index) for level, index, _ in positions]
+    nodes = {
+        (node.level, node.nodeIndex): node.hash
+        for node in db.exec(
+            select(AuditMerkleNode)
+            .where(AuditMerkleNode.checkpointID == checkpoint.checkpointID)
+            .where(tuple_(AuditMerkleNode.level, AuditMerkleNode.nodeIndex).in_(wanted))
+        ).all()
+    }
+    entry_hash = db.exec(select(AuditLog.hash).where(AuditLog.logID == log_id)).first()
+
+    return AuditInclusionProof(
+        logID=log_id,
+        # None once the entry's partition has been archived; the leaf hash still stands
+        entryHash=entry_hash,
+        leafHash=nodes[(0, leaf.leafIndex)],
+        leafIndex=leaf.leafIndex,
+        proof=[AuditMerkleProofStep(position=side, hash=nodes[(level, index)]) for level, index, side in positions],
+        checkpoint=to_checkpoint_public(checkpoint),
+    )
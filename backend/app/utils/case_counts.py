@@ -0,0 +1,56 @@
+import logging
+from typing import Optional
+from sqlalchemy import text
+from sqlmodel import Session, func, select
+from app.models import TriageCase, TriageCaseStatusCount
+
+logger = logging.getLogger(__name__)
+
+
+def get_case_count(db: Session, status: Optional[str] = None) -> int:
+    # Read from the trigger-maintained counters table instead of COUNT(*) over TriageCase
+    if status is None:
+        statement = select(func.coalesce(func.sum(TriageCaseStatusCount.count), 0))
+        return int(db.exec(statement).one())
+
+    counter = db.get(TriageCaseStatusCount, status)
+    return counter.count if counter else 0
+
+
+def reconcile_case_counts(db: Session) -> dict[str, dict[str, int]]:
+    """
+    Recompute per-status counts from TriageCase and repair any counter rows that drifted.
+
+    Returns a mapping of status -> {"stored", "actual", "drift"} for every status that was corrected.
+    """
+    # block concurrent counter updates (held by in-flight case writes) until the repair commits
+    db.exec(text('LOCK TABLE ent."TriageCaseStatusCount" IN SHARE ROW EXCLUSIVE MODE'))
+
+    actual_statement = (
+        select(func.coalesce(TriageCase.status, ""), func.count())
+        .group_by(func.coalesce(TriageCase.status, ""))
+    )
+    actual = {status: count for status, count in db.exec(actual_statement).all()}
+    stored = {counter.status: counter for counter in db.exec(select(TriageCaseStatusCount)).all()}
+
+    drift = {}
+    for status in set(actual) | set(stored):
+        actual_count = actual.get(status, 0)
+        counter = stored.get(status)
+        stored_count = counter.count if counter else 0
+        if actual_count == stored_count:
+            continue
+
+        drift[status] = {"stored": stored_count, "actual": actual_count, "drift": stored_count - actual_count}
+        if counter is None:
+            counter = TriageCaseStatusCount(status=status)
+        counter.count = actual_count
+        db.add(counter)
+
+    db.commit()
+
+    if drift:
+        logger.warning(f"Case count reconciliation repaired drift: {drift}")
+    else:
+        logger.info("Case count reconciliation found no drift")
+    return drift
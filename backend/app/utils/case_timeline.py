@@ -0,0 +1,193 @@
+import heapq
+import uuid
+from itertools import islice
+from datetime import datetime
+from typing import Any, Callable, NamedTuple, Optional
+from sqlmodel import Session, select
+from app.models import (
+    AIFeedback,
+    AuditLog,
+    CaseTimelineEntry,
+    CaseTimelinePublic,
+    PatientChangelog,
+    TriageCaseChangelog,
+    User,
+)
+from app.models.appointments import Appointment
+from app.utils.pagination import encode_cursor, decode_cursor
+
+
+class TimelineSource(NamedTuple):
+    name: str
+    model: Any
+    timestamp: Any
+    id: Any
+    id_type: type
+    # (case_id, patient_id) -> WHERE clauses; each source is served by a (key, timestamp DESC, id DESC) index
+    filters: Callable[[uuid.UUID, uuid.UUID], list]
+    to_entry: Callable[[Any], CaseTimelineEntry]
+
+
+def changelog_entry(source: str) -> Callable[[Any], CaseTimelineEntry]:
+    def to_entry(row) -> CaseTimelineEntry:
+        return CaseTimelineEntry(
+            source=source,
+            id=str(row.id),
+            timestamp=row.changedAt,
+            actorID=row.changedBy,
+            details={"fieldName": row.fieldName, "oldValue": row.oldValue, "newValue": row.newValue},
+        )
+    return to_entry
+
+
+def appointment_entry(row: Appointment) -> CaseTimelineEntry:
+    return CaseTimelineEntry(
+        source="appointment",
+        id=str(row.appointmentID),
+        timestamp=row.createdAt,
+        actorID=row.scheduledBy,
+        details={
+            "status": row.status,
+            "physicianID": str(row.physicianID),
+            "scheduledAt": row.scheduledAt.isoformat(),
+            "scheduledEnd": row.scheduledEnd.isoformat(),
+            "cancelReason": row.cancelReason,
+            "cancelledAt": row.cancelledAt.isoformat() if row.cancelledAt else None,
+        },
+    )
+
+
+def feedback_entry(row: AIFeedback) -> CaseTimelineEntry:
+    return CaseTimelineEntry(
+        source="ai_feedback",
+        id=str(row.id),
+        timestamp=row.createdAt,
+        actorID=row.createdBy,
+        details={"rating": row.rating, "tags": row.tags, "comment": row.comment},
+    )
+
+
+def audit_entry(row: AuditLog) -> CaseTimelineEntry:
+    return CaseTimelineEntry(
+        source="audit",
+        id=str(row.logID),
+        timestamp=row.timestamp,
+        actorID=row.actorID,
+        details={"action": row.action, "status": row.status, "changeDetails": row.changeDetails},
+    )
+
+
+# Position in this list breaks timestamp ties, so the merged order (timestamp, rank, id) is total
+TIMELINE_SOURCES = [
+    TimelineSource(
+        "case_changelog",
+        TriageCaseChangelog,
+        TriageCaseChangelog.changedAt,
+        TriageCaseChangelog.id,
+        uuid.UUID,
+        lambda case_id, patient_id: [TriageCaseChangelog.caseID == case_id],
+        changelog_entry("case_changelog"),
+    ),
+    TimelineSource(
+        "patient_changelog",
+        PatientChangelog,
+        PatientChangelog.changedAt,
+        PatientChangelog.id,
+        uuid.UUID,
+        lambda case_id, patient_id: [PatientChangelog.patientID == patient_id],
+        changelog_entry("patient_changelog"),
+    ),
+    TimelineSource(
+        "appointment",
+        Appointment,
+        Appointment.createdAt,
+        Appointment.appointmentID,
+        str,
+        lambda case_id, patient_id: [Appointment.caseID == case_id],
+        appointment_entry,
+    ),
+    TimelineSource(
+        "ai_feedback",
+        AIFeedback,
+        AIFeedback.createdAt,
+        AIFeedback.id,
+        uuid.UUID,
+        lambda case_id, patient_id: [AIFeedback.caseID == case_id],
+        feedback_entry,
+    ),
+    TimelineSource(
+        "audit",
+        AuditLog,
+        AuditLog.timestamp,
+        AuditLog.logID,
+        uuid.UUID,
+        lambda case_id, patient_id: [AuditLog.resourceType == "TRIAGE_CASE", AuditLog.resourceID == case_id],
+        audit_entry,
+    ),
+]
+
+
+def source_after(source: TimelineSource, rank: int, after: tuple[datetime, int, str]) -> list:
+    # Rows that sort after the cursor in (timestamp, rank, id) DESC, as a predicate on this source alone
+    after_timestamp, after_rank, after_id = after
+    if rank < after_rank:
+        return [source.timestamp <= after_timestamp]
+    if rank > after_rank:
+        return [source.timestamp < after_timestamp]
+    after_key = source.id_type(after_id)
+    return [
+        (source.timestamp < after_timestamp)
+        | ((source.timestamp == after_timestamp) & (source.id < after_key))
+    ]
+
+
+def read_source(
+    db: Session,
+    source: TimelineSource,
+    rank: int,
+    case_id: uuid.UUID,
+    patient_id: uuid.UUID,
+    after: Optional[tuple],
+    limit: int,
+):
+    statement = select(source.model).where(*source.filters(case_id, patient_id))
+    if after:
+        statement = statement.where(*source_after(source, rank, after))
+    statement = statement.order_by(source.timestamp.desc(), source.id.desc()).limit(limit)
+    for row in db.exec(statement).all():
+        entry = source.to_entry(row)
+        yield entry.timestamp, rank, entry
+
+
+def case_timeline(
+    db: Session,
+    case_id: uuid.UUID,
+    patient_id: uuid.UUID,
+    limit: int,
+    cursor: Optional[str],
+) -> CaseTimelinePublic:
+    """
+    One page of a case's history, newest first. Every source is read with its own bounded,
+    index-ordered query (at most limit + 1 rows) and the sorted streams are k-way merged, so a page
+    costs one query per source no matter how long the history is.
+    """
+    after = decode_cursor(cursor, datetime, int, str)
+    streams = [
+        read_source(db, source, rank, case_id, patient_id, after, limit + 1)
+        for rank, source in enumerate(TIMELINE_SOURCES)
+    ]
+    merged = list(islice(heapq.merge(*streams, key=lambda item: item[:2], reverse=True), limit + 1))
+
+    next_cursor = None
+    if len(merged) > limit:
+        merged = merged[:limit]
+        timestamp, rank, entry = merged[-1]
+        next_cursor = encode_cursor(timestamp, rank, entry.id)
+
+    entries = [entry for _, _, entry in merged]
+    actor_ids = {entry.actorID for entry in entries if entry.actorID}
+    if actor_ids:
+        emails = dict(db.exec(select(User.userID, User.email).where(User.userID.in_(actor_ids))).all())
+        for entry in entries:
+            entry.actorEmail = emails.get(entry.actorID)
+    return CaseTimelinePublic(entries=entries, next_cursor=next_cursor)
@@ -1,10 +1,71 @@
 import uuid
 import logging
-from typing import Any, List, Type
-from sqlmodel import Session, SQLModel
+from datetime import datetime
+from typing import Any, Iterable, List, Optional, Type
+from sqlalchemy import insert, tuple_
+from sqlmodel import Session, SQLModel, select
+from app.models import User
+from app.utils.pagination import encode_cursor, decode_cursor
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_EXCLUDE_FIELDS = ['id', 'createdAt', 'updatedAt']
+
+def diff_fields(
+    old_record: Optional[SQLModel],
+    new_values: dict[str, Any],
+    exclude_fields: List[str] = None
+) -> list[tuple[str, Any, Any]]:
+    # (fieldName, oldValue, newValue) for each changed field; only the touched attributes are read,
+    # so large columns such as the transcript are never copied. A None old_record diffs against nothing.
+    if exclude_fields is None:
+        exclude_fields = DEFAULT_EXCLUDE_FIELDS
+
+    changes = []
+    for field_name, new_value in new_values.items():
+        if field_name in exclude_fields:
+            continue
+
+        old_value = getattr(old_record, field_name, None)
+
+        # if overrideUrgency has no previous value, fall back to AIUrgency as the "previous" for comparison purposes
+        if field_name == 'overrideUrgency' and old_value is None:
+            old_value = getattr(old_record, 'AIUrgency', None)
+
+        if old_value == new_value:
+            continue
+
+        changes.append((field_name, old_value, new_value))
+    return changes
+
+def changelog_rows(
+    old_record: Optional[SQLModel],
+    new_values: dict[str, Any],
+    foreign_key_field: str,
+    record_id: uuid.UUID,
+    user_id: uuid.UUID,
+    changed_at: datetime,
+    exclude_fields: List[str] = None
+) -> list[dict[str, Any]]:
+    return [
+        {
+            'id': uuid.uuid4(),
+            foreign_key_field: record_id,
+            'changedAt': changed_at,
+            'changedBy': user_id,
+            'fieldName': field_name,
+            'oldValue': str(old_value) if old_value is not None else None,
+            'newValue': str(new_value) if new_value is not None else None
+        }
+        for field_name, old_value, new_value in diff_fields(old_record, new_values, exclude_fields)
+    ]
+
+def insert_changelog(session: Session, changelog_model: Type[SQLModel], rows: list[dict[str, Any]]) -> int:
+    # one executemany, sent as multi-row INSERTs, in the caller's transaction
+    if rows:
+        session.execute(insert(changelog_model), rows)
+    return len(rows)
+
 def log_changes(
     session: Session,
     old_record: SQLModel,
@@ -16,44 +77,77 @@ def log_changes(
     exclude_fields: List[str] = None
 ) -> int:
     try:
-        if exclude_fields is None:
-            exclude_fields = ['id', 'createdAt', 'updatedAt']
-        
-        changelog_entries = []
-        old_dict = old_record.model_dump()
-        
-        for field_name, new_value in new_values.items():
-            if field_name in exclude_fields:
-                continue
-                
-            old_value = old_dict.get(field_name)
-            
-            # if overrideUrgency has no previous value, fall back to AIUrgency as the "previous" for comparison purposes
-            if field_name == 'overrideUrgency' and old_value is None:
-                old_value = old_dict.get('AIUrgency')
-            
-            if old_value == new_value:
-                continue
-                
-            if old_value is None and new_value is None:
-                continue
-            
-            changelog_data = {
-                foreign_key_field: record_id,
-                'changedBy': user_id,
-                'fieldName': field_name,
-                'oldValue': str(old_value) if old_value is not None else None,
-                'newValue': str(new_value) if new_value is not None else None
-            }
-            
-            changelog_entry = changelog_model(**changelog_data)
-            changelog_entries.append(changelog_entry)
-        
-        for entry in changelog_entries:
-            session.add(entry)
-        
-        return len(changelog_entries)
-        
+        rows = changelog_rows(
+            old_record, new_values, foreign_key_field, record_id, user_id, datetime.now(), exclude_fields
+        )
     except Exception as e:
         logger.error(f"Error logging changes: {str(e)}")
-        return 0
\ No newline at end of file
+        return 0
+    # a failed insert aborts the transaction, so it propagates to the caller's rollback
+    return insert_changelog(session, changelog_model, rows)
+
+def log_changes_bulk(
+    session: Session,
+    changes: Iterable[tuple[Optional[SQLModel], dict[str, Any], uuid.UUID]],
+    changelog_model: Type[SQLModel],
+    foreign_key_field: str,
+    user_id: uuid.UUID,
+    exclude_fields: List[str] = None
+) -> int:
+    """
+    Batch form of log_changes for bulk edits and imports: changes is (old_record, new_values, record_id)
+    per record, and the rows for every record go out in one insert. Returns the number of rows written.
+    """
+    try:
+        changed_at = datetime.now()
+        rows = [
+            row
+            for old_record, new_values, record_id in changes
+            for row in changelog_rows(
+                old_record, new_values, foreign_key_field, record_id, user_id, changed_at, exclude_fields
+            )
+        ]
+    except Exception as e:
+        logger.error(f"Error logging changes: {str(e)}")
+        return 0
+    return insert_changelog(session, changelog_model, rows)
+
+def changelog_page(
+    session: Session,
+    changelog_model: Type[SQLModel],
+    foreign_key_field: str,
+    record_id: uuid.UUID,
+    limit: int,
+    cursor: Optional[str] = None,
+    field_name: Optional[str] = None
+) -> tuple[list[dict[str, Any]], Optional[str]]:
+    # Keyset page over (changedAt, id), newest first; backed by the (key, [fieldName,] changedAt DESC, id DESC) indexes
+    statement = (
+        select(changelog_model, User.email.label('changedByEmail'))
+        .join(User, changelog_model.changedBy == User.userID)
+        .where(getattr(changelog_model, foreign_key_field) == record_id)
+    )
+    if field_name:
+        statement = statement.where(changelog_model.fieldName == field_name)
+    after = decode_cursor(cursor, datetime, uuid.UUID)
+    if after:
+        statement = statement.where(tuple_(changelog_model.changedAt, changelog_model.id) < after)
+    statement = statement.order_by(changelog_model.changedAt.desc(), changelog_model.id.desc()).limit(limit + 1)
+    results = session.exec(statement).all()
+
+    next_cursor = None
+    if len(results) > limit:
+        results = results[:limit]
+        next_cursor = encode_cursor(results[-1][0].changedAt, results[-1][0].id)
+
+    return [
+        {
+            "id": str(changelog.id),
+            "changedAt": changelog.changedAt.isoformat(),
+            "fieldName": changelog.fieldName,
+            "oldValue": changelog.oldValue,
+            "newValue": changelog.newValue,
+            "changedByEmail": changed_by_email
+        }
+        for changelog, changed_by_email in results
+    ], next_cursor
@@ -0,0 +1,56 @@
+import json
+import base64
+import uuid
+from datetime import datetime
+from typing import Any, Optional
+from fastapi import HTTPException, status
+from sqlmodel import Session
+
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(*values: Any) -> str:
+    # Opaque, URL-safe cursor for keyset pagination; datetimes and UUIDs are stored as strings
+    payload = [
+        value.isoformat() if isinstance(value, datetime) else str(value) if isinstance(value, uuid.UUID) else value
+        for value in values
+    ]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], *types: type) -> Optional[tuple]:
+    # Decode a cursor produced by encode_cursor, coercing each value back to the given type
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if len(payload) != len(types):
+            raise ValueError("cursor length mismatch")
+        values = []
+        for value, value_type in zip(payload, types):
+            if value_type is datetime:
+                values.append(datetime.fromisoformat(value))
+            elif value_type is uuid.UUID:
+                values.append(uuid.UUID(value))
+            else:
+                values.append(value_type(value))
+        return tuple(values)
+    except Exception:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def clamp_limit(limit: int) -> int:
+    if limit < 1:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Limit must be positive")
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def estimated_count(db: Session, statement) -> int:
+    # Row estimate from the planner's statistics (EXPLAIN, no execution) instead of an exact COUNT(*)
+    connection = db.connection()
+    compiled = statement.compile(dialect=connection.dialect)
+    plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -0,0 +1,65 @@
+# PATCH latency benchmark: python benchmarks/patch_latency.py --case-id <uuid> --token <jwt> [--requests 500]
+# Sends sequential PATCH /triage-cases/{id} requests that alternate a clinician note and reports
+# p50/p95/p99 latency. Run it against a build before and after a change to compare.
+# No results have been recorded: the lower PATCH p99 expected from the single-transaction UnitOfWork
+# path is unverified until this is run against a real database before and after that change.
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import urllib.request
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def send_patch(url: str, token: str, body: dict) -> float:
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(body).encode(),
+        method="PATCH",
+        headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
+    )
+    started = time.perf_counter()
+    with urllib.request.urlopen(request) as response:
+        response.read()
+    return (time.perf_counter() - started) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure PATCH /triage-cases/{id} latency")
+    parser.add_argument("--base-url", default=os.getenv("API_BASE_URL", "http://localhost:8000"))
+    parser.add_argument("--case-id", required=True)
+    parser.add_argument("--token", default=os.getenv("API_TOKEN"), help="bearer token (default: $API_TOKEN)")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=20)
+    args = parser.parse_args()
+    if not args.token:
+        parser.error("--token or API_TOKEN is required")
+
+    url = f"{args.base_url.rstrip('/')}/triage-cases/{args.case_id}"
+    for index in range(args.warmup):
+        send_patch(url, args.token, {"clinicianNotes": f"benchmark warmup {index}"})
+
+    samples = [
+        send_patch(url, args.token, {"clinicianNotes": f"benchmark {index}"})
+        for index in range(args.requests)
+    ]
+    print(json.dumps({
+        "requests": len(samples),
+        "mean_ms": round(statistics.fmean(samples), 2),
+        "p50_ms": round(percentile(samples, 50), 2),
+        "p95_ms": round(percentile(samples, 95), 2),
+        "p99_ms": round(percentile(samples, 99), 2),
+        "max_ms": round(max(samples), 2),
+    }))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
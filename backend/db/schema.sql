@@ -81,13 +81,31 @@ CREATE TABLE "TriageCase" (
     "overrideSummary"       TEXT,
     "AIUrgency"             urgency_level_enum,
     "overrideUrgency"       urgency_level_enum,
+    -- model version that produced AIUrgency / AIConfidence
+    "AIModelVersion"        TEXT,
     "clinicianNotes"        TEXT,
+    "leasedBy"              UUID,
+    "leaseExpiresAt"        TIMESTAMPTZ,
+    -- denormalized on write; backfilled by app.jobs.backfill_case_denorm
+    "previousUrgency"       TEXT,
+    "reviewedByEmail"       TEXT,
+    -- queue ordering key: overrideUrgency falling back to AIUrgency, ranked urgent > semi-urgent > routine
+    "effectiveUrgencyRank"  SMALLINT GENERATED ALWAYS AS (
+        CASE COALESCE("overrideUrgency", "AIUrgency")
+            WHEN 'urgent' THEN 3
+            WHEN 'semi-urgent' THEN 2
+            WHEN 'routine' THEN 1
+            ELSE 0
+        END
+    ) STORED,
     CONSTRAINT fk_triage_patient
         FOREIGN KEY ("patientID") REFERENCES "Patient"("patientID") ON DELETE CASCADE,
     CONSTRAINT fk_triage_created_by
         FOREIGN KEY ("createdBy") REFERENCES "User"("userID"),
     CONSTRAINT fk_triage_reviewed_by
-        FOREIGN KEY ("reviewedBy") REFERENCES "User"("userID")
+        FOREIGN KEY ("reviewedBy") REFERENCES "User"("userID"),
+    CONSTRAINT fk_triage_leased_by
+        FOREIGN KEY ("leasedBy") REFERENCES "User"("userID")
 );
 
 CREATE TABLE "TriageCaseFile" (
@@ -121,6 +139,16 @@ CREATE TABLE "TriageCaseChangelog" (
         FOREIGN KEY ("changedBy") REFERENCES "User"("userID")
 );
 
+-- ============================================================
+-- TRIAGE CASE STATUS COUNTS
+-- ============================================================
+-- maintained by trg_case_count_* below so list endpoints avoid COUNT(*)
+CREATE TABLE "TriageCaseStatusCount" (
+    "status"    TEXT PRIMARY KEY,
+    "count"     BIGINT NOT NULL DEFAULT 0,
+    "updatedAt" TIMESTAMPTZ DEFAULT NOW()
+);
+
 -- ============================================================
 -- APPOINTMENT
 -- ============================================================
@@ -198,22 +226,147 @@ CREATE TABLE "AIInference" (
 -- ============================================================
 -- AUDIT LOG
 -- ============================================================
+-- monthly range partitions ("AuditLog_YYYY_MM", UTC months) created by ent.ensure_audit_partition;
+-- old months are detached and archived by app.jobs.archive_audit_partitions
 CREATE TABLE "AuditLog" (
-    "logID"         UUID PRIMARY KEY,
+    "logID"         UUID NOT NULL,
     "actorID"       UUID,
     "actorType"     TEXT,
     "resourceID"    UUID,
     "resourceType"  TEXT,
     "action"        TEXT,
     "status"        TEXT,
-    "timestamp"     TIMESTAMPTZ DEFAULT NOW(),
+    "timestamp"     TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     "changeDetails" JSONB,
     "ipAddress"     INET,
     "hash"          TEXT,
     "previousHash"  TEXT,
     "locked"        BOOLEAN DEFAULT FALSE,
+    PRIMARY KEY ("logID", "timestamp"),
     CONSTRAINT fk_audit_user
         FOREIGN KEY ("actorID") REFERENCES "User"("userID")
+) PARTITION BY RANGE ("timestamp");
+
+-- catches rows outside every monthly range; ensure_audit_partition moves them out when their month is created
+CREATE TABLE "AuditLog_default" PARTITION OF "AuditLog" DEFAULT;
+
+CREATE OR REPLACE FUNCTION ent.ensure_audit_partition(month_start DATE)
+RETURNS TEXT AS $$
+DECLARE
+  range_start TIMESTAMPTZ := date_trunc('month', month_start::timestamp) AT TIME ZONE 'UTC';
+  range_end   TIMESTAMPTZ := (date_trunc('month', month_start::timestamp) + INTERVAL '1 month') AT TIME ZONE 'UTC';
+  partition_name TEXT := 'AuditLog_' || to_char(month_start, 'YYYY_MM');
+BEGIN
+  IF to_regclass(format('ent.%I', partition_name)) IS NOT NULL THEN
+    RETURN partition_name;
+  END IF;
+
+  -- attaching fails while the default partition holds rows in the range, so move them over first
+  EXECUTE format('CREATE TABLE ent.%I (LIKE ent."AuditLog" INCLUDING DEFAULTS)', partition_name);
+  EXECUTE format(
+    'WITH moved AS (DELETE FROM ent."AuditLog_default" WHERE "timestamp" >= %L AND "timestamp" < %L RETURNING *)
+     INSERT INTO ent.%I SELECT * FROM moved',
+    range_start, range_end, partition_name
+  );
+  EXECUTE format(
+    'ALTER TABLE ent."AuditLog" ATTACH PARTITION ent.%I FOR VALUES FROM (%L) TO (%L)',
+    partition_name, range_start, range_end
+  );
+  RETURN partition_name;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT ent.ensure_audit_partition((date_trunc('month', NOW() AT TIME ZONE 'UTC') + make_interval(months => m))::date)
+FROM generate_series(0, 2) AS m;
+
+-- one row per audited resource holding its latest hash; appenders lock it so the chain can't fork
+CREATE TABLE "AuditChainHead" (
+    "resourceType"  TEXT NOT NULL,
+    "resourceID"    UUID NOT NULL,
+    "hash"          TEXT,
+    "logID"         UUID,
+    "updatedAt"     TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY ("resourceType", "resourceID")
+);
+
+CREATE TABLE "AuditVerificationRun" (
+    "runID"             UUID PRIMARY KEY,
+    "mode"              TEXT NOT NULL CHECK ("mode" IN ('full', 'incremental')),
+    "status"            TEXT NOT NULL DEFAULT 'running'
+                        CHECK ("status" IN ('running', 'passed', 'failed', 'error')),
+    "startedAt"         TIMESTAMPTZ DEFAULT NOW(),
+    "finishedAt"        TIMESTAMPTZ,
+    "resourcesChecked"  INTEGER NOT NULL DEFAULT 0,
+    "rowsChecked"       BIGINT NOT NULL DEFAULT 0,
+    "brokenCount"       INTEGER NOT NULL DEFAULT 0,
+    "report"            JSONB
+);
+
+-- one row per archived AuditLog partition; "detached" until its files are in object storage
+CREATE TABLE "AuditArchive" (
+    "archiveID"     UUID PRIMARY KEY,
+    "partitionName" TEXT NOT NULL UNIQUE,
+    "rangeStart"    TIMESTAMPTZ NOT NULL,
+    "rangeEnd"      TIMESTAMPTZ NOT NULL,
+    "status"        TEXT NOT NULL DEFAULT 'detached' CHECK ("status" IN ('detached', 'archived')),
+    "objectKey"     TEXT,
+    "checkpointKey" TEXT,
+    "rowCount"      BIGINT,
+    "sha256"        TEXT,
+    "createdAt"     TIMESTAMPTZ DEFAULT NOW(),
+    "archivedAt"    TIMESTAMPTZ
+);
+
+-- last archived hash per chain; the first live entry of the chain links to it instead of a genesis entry
+CREATE TABLE "AuditChainAnchor" (
+    "resourceType"  TEXT NOT NULL,
+    "resourceID"    UUID NOT NULL,
+    "hash"          TEXT NOT NULL,
+    "archiveID"     UUID NOT NULL,
+    "rangeEnd"      TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY ("resourceType", "resourceID"),
+    CONSTRAINT fk_anchor_archive
+        FOREIGN KEY ("archiveID") REFERENCES "AuditArchive"("archiveID")
+);
+
+-- Merkle trees over batches of audit entry hashes, for O(log n) inclusion proofs
+CREATE TABLE "AuditMerkleCheckpoint" (
+    "checkpointID"       UUID PRIMARY KEY,
+    "sequence"           BIGINT NOT NULL UNIQUE,
+    "leafCount"          INTEGER NOT NULL,
+    "rootHash"           TEXT NOT NULL,
+    "previousRoot"       TEXT,
+    "firstTimestamp"     TIMESTAMPTZ NOT NULL,
+    "lastTimestamp"      TIMESTAMPTZ NOT NULL,
+    "signature"          TEXT,
+    "signatureAlgorithm" TEXT,
+    "createdAt"          TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE TABLE "AuditMerkleLeaf" (
+    "logID"         UUID PRIMARY KEY,
+    "checkpointID"  UUID NOT NULL,
+    "leafIndex"     INTEGER NOT NULL,
+    CONSTRAINT fk_merkle_leaf_checkpoint
+        FOREIGN KEY ("checkpointID") REFERENCES "AuditMerkleCheckpoint"("checkpointID")
+);
+
+-- hashed entries waiting for a checkpoint, filled by trg_queue_audit_merkle_leaf; the builder drains it,
+-- so an entry inserted late (e.g. replayed from the audit spool) is covered whatever its timestamp
+CREATE TABLE "AuditMerklePending" (
+    "logID"         UUID PRIMARY KEY,
+    "timestamp"     TIMESTAMPTZ NOT NULL,
+    "hash"          TEXT NOT NULL
+);
+
+CREATE TABLE "AuditMerkleNode" (
+    "checkpointID"  UUID NOT NULL,
+    "level"         SMALLINT NOT NULL,
+    "nodeIndex"     INTEGER NOT NULL,
+    "hash"          TEXT NOT NULL,
+    PRIMARY KEY ("checkpointID", "level", "nodeIndex"),
+    CONSTRAINT fk_merkle_node_checkpoint
+        FOREIGN KEY ("checkpointID") REFERENCES "AuditMerkleCheckpoint"("checkpointID")
 );
 
 CREATE TABLE "AIFeedback" (
@@ -239,21 +392,65 @@ CREATE TABLE "AIFeedback" (
         UNIQUE ("caseID", "createdBy")
 );
 
+-- daily AI analytics rollups (UTC days), maintained by app.jobs.rollup_ai_analytics
+CREATE TABLE "AIDailyRollup" (
+    "day"              DATE PRIMARY KEY,
+    "cases"            INTEGER NOT NULL DEFAULT 0,
+    "urgencyOverrides" INTEGER NOT NULL DEFAULT 0,
+    "summaryOverrides" INTEGER NOT NULL DEFAULT 0,
+    "feedbackUp"       INTEGER NOT NULL DEFAULT 0,
+    "feedbackDown"     INTEGER NOT NULL DEFAULT 0,
+    "updatedAt"        TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE TABLE "AIDailyTagCount" (
+    "day"   DATE NOT NULL,
+    "tag"   TEXT NOT NULL,
+    "count" INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY ("day", "tag")
+);
+
+-- everything before "position" is final in the rollups; each run recomputes from there
+CREATE TABLE "RollupWatermark" (
+    "name"      TEXT PRIMARY KEY,
+    "position"  TIMESTAMPTZ NOT NULL,
+    "updatedAt" TIMESTAMPTZ DEFAULT NOW()
+);
+
 -- ============================================================
 -- INDEXES
 -- ============================================================
 CREATE INDEX idx_triage_patient           ON "TriageCase"("patientID");
 CREATE INDEX idx_triage_active_appt       ON "TriageCase"("activeAppointmentID");
-CREATE INDEX idx_appointment_case         ON "Appointment"("caseID");
+CREATE INDEX idx_triage_created           ON "TriageCase"("dateCreated" DESC, "caseID" DESC);
+CREATE INDEX idx_triage_status_created    ON "TriageCase"("status", "dateCreated" DESC, "caseID" DESC);
+CREATE INDEX idx_triage_queue             ON "TriageCase"("effectiveUrgencyRank" DESC, "AIConfidence" DESC NULLS LAST, "dateCreated")
+    WHERE "status" = 'unreviewed';
+-- covers the calibration bulk load (index-only scan per model version)
+CREATE INDEX idx_triage_calibration       ON "TriageCase"("AIModelVersion") INCLUDE ("AIConfidence", "AIUrgency", "overrideUrgency");
+CREATE INDEX idx_appointment_case         ON "Appointment"("caseID", "createdAt" DESC, "appointmentID" DESC);
 CREATE INDEX idx_appointment_physician    ON "Appointment"("physicianID");
 CREATE INDEX idx_appointment_status       ON "Appointment"("status");
 CREATE INDEX idx_transcript_case          ON "Transcript"("caseID");
 CREATE INDEX idx_aiinference_case         ON "AIInference"("caseID");
+CREATE INDEX idx_feedback_case            ON "AIFeedback"("caseID", "createdAt" DESC, "id" DESC);
+CREATE INDEX idx_feedback_created         ON "AIFeedback"("createdAt");
 CREATE INDEX idx_audit_resource           ON "AuditLog"("resourceID");
-CREATE INDEX idx_audit_resource_type      ON "AuditLog"("resourceType", "resourceID");
-CREATE INDEX idx_audit_timestamp          ON "AuditLog"("timestamp");
-CREATE INDEX idx_patchangelog_patient     ON "PatientChangelog"("patientID");
-CREATE INDEX idx_casechangelog_case       ON "TriageCaseChangelog"("caseID");
+CREATE INDEX idx_audit_resource_type      ON "AuditLog"("resourceType", "resourceID", "timestamp" DESC, "logID" DESC);
+CREATE INDEX idx_audit_timestamp          ON "AuditLog"("timestamp" DESC, "logID" DESC);
+-- filtered audit log queries page newest-first on ("timestamp", "logID")
+CREATE INDEX idx_audit_actor_time         ON "AuditLog"("actorID", "timestamp" DESC, "logID" DESC);
+CREATE INDEX idx_audit_action_time        ON "AuditLog"("action", "timestamp" DESC, "logID" DESC);
+CREATE INDEX idx_audit_ip                 ON "AuditLog" USING gist ("ipAddress" inet_ops);
+CREATE INDEX idx_audit_chain_head_updated ON "AuditChainHead"("updatedAt");
+CREATE INDEX idx_audit_merkle_pending     ON "AuditMerklePending"("timestamp", "logID");
+CREATE INDEX idx_audit_verify_started     ON "AuditVerificationRun"("startedAt" DESC);
+CREATE INDEX idx_patchangelog_patient     ON "PatientChangelog"("patientID", "changedAt" DESC, "id" DESC);
+CREATE INDEX idx_casechangelog_case       ON "TriageCaseChangelog"("caseID", "changedAt" DESC, "id" DESC);
+CREATE INDEX idx_patchangelog_field       ON "PatientChangelog"("patientID", "fieldName", "changedAt" DESC, "id" DESC);
+CREATE INDEX idx_casechangelog_field      ON "TriageCaseChangelog"("caseID", "fieldName", "changedAt" DESC, "id" DESC);
+CREATE INDEX idx_casechangelog_override   ON "TriageCaseChangelog"("changedAt")
+    WHERE "fieldName" IN ('overrideUrgency', 'overrideSummary');
 
 -- ============================================================
 -- AUDIT TRIGGER
@@ -292,7 +489,96 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql SECURITY DEFINER;
 
+-- defined on the partitioned parent, so every current and future partition gets a clone of it
 CREATE TRIGGER trg_validate_audit_resource
 BEFORE INSERT OR UPDATE ON "AuditLog"
 FOR EACH ROW
-EXECUTE FUNCTION ent.validate_audit_resource();
\ No newline at end of file
+EXECUTE FUNCTION ent.validate_audit_resource();
+
+CREATE OR REPLACE FUNCTION ent.queue_audit_merkle_leaf()
+RETURNS TRIGGER AS $$
+BEGIN
+  -- rows moved between partitions by ensure_audit_partition are re-inserted; skip ones already in a tree
+  IF NOT EXISTS (SELECT 1 FROM ent."AuditMerkleLeaf" WHERE "logID" = NEW."logID") THEN
+    INSERT INTO ent."AuditMerklePending" ("logID", "timestamp", "hash")
+    VALUES (NEW."logID", NEW."timestamp", NEW."hash")
+    ON CONFLICT ("logID") DO NOTHING;
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_queue_audit_merkle_leaf
+AFTER INSERT ON "AuditLog"
+FOR EACH ROW
+WHEN (NEW."hash" IS NOT NULL)
+EXECUTE FUNCTION ent.queue_audit_merkle_leaf();
+
+-- ============================================================
+-- CASE COUNT TRIGGERS
+-- ============================================================
+-- statement-level so bulk inserts touch each counter row once per statement
+CREATE OR REPLACE FUNCTION ent.apply_case_count_delta(deltas_status TEXT[], deltas_count BIGINT[])
+RETURNS VOID AS $$
+BEGIN
+  INSERT INTO ent."TriageCaseStatusCount" ("status", "count", "updatedAt")
+  SELECT d.status, d.delta, NOW()
+  FROM unnest(deltas_status, deltas_count) AS d(status, delta)
+  WHERE d.delta <> 0
+  ON CONFLICT ("status") DO UPDATE
+    SET "count" = ent."TriageCaseStatusCount"."count" + EXCLUDED."count",
+        "updatedAt" = NOW();
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION ent.maintain_case_count_insert()
+RETURNS TRIGGER AS $$
+BEGIN
+  PERFORM ent.apply_case_count_delta(array_agg(s), array_agg(c))
+  FROM (SELECT COALESCE("status", '') AS s, COUNT(*) AS c FROM new_rows GROUP BY 1) t;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION ent.maintain_case_count_delete()
+RETURNS TRIGGER AS $$
+BEGIN
+  PERFORM ent.apply_case_count_delta(array_agg(s), array_agg(c))
+  FROM (SELECT COALESCE("status", '') AS s, -COUNT(*) AS c FROM old_rows GROUP BY 1) t;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION ent.maintain_case_count_update()
+RETURNS TRIGGER AS $$
+BEGIN
+  PERFORM ent.apply_case_count_delta(array_agg(s), array_agg(c))
+  FROM (
+    SELECT s, SUM(c)::BIGINT AS c FROM (
+      SELECT COALESCE("status", '') AS s, 1 AS c FROM new_rows
+      UNION ALL
+      SELECT COALESCE("status", '') AS s, -1 AS c FROM old_rows
+    ) changes
+    GROUP BY s
+  ) t;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_case_count_insert
+AFTER INSERT ON "TriageCase"
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION ent.maintain_case_count_insert();
+
+CREATE TRIGGER trg_case_count_delete
+AFTER DELETE ON "TriageCase"
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION ent.maintain_case_count_delete();
+
+CREATE TRIGGER trg_case_count_update
+AFTER UPDATE ON "TriageCase"
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION ent.maintain_case_count_update();
@@ -5,6 +5,20 @@ class AnalyticsService {
         const res = await apiClient.get("/analytics/ai");
         return res.data;
     }
+
+    async getAITimeseries({ start, end } = {}){
+        const res = await apiClient.get("/analytics/ai/timeseries", {
+            params: { start, end },
+        });
+        return res.data;
+    }
+
+    async getAICalibration({ modelVersion, bins } = {}){
+        const res = await apiClient.get("/analytics/ai/calibration", {
+            params: { model_version: modelVersion, bins },
+        });
+        return res.data;
+    }
 }
 
 export const analyticsService = new AnalyticsService();
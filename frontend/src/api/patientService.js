@@ -11,9 +11,12 @@ class PatientService {
     return res.data;
   }
 
-  async getPatientChangelog(id) {
-    const res = await apiClient.get(`/patients/${id}/changelog`);
-    return res.data;
+  async getPatientChangelog(id, { limit, cursor, field } = {}) {
+    const res = await apiClient.get(`/patients/${id}/changelog`, {
+      params: { limit, cursor, field },
+    });
+    // one page, newest first; nextCursor is null on the last page
+    return { entries: res.data, nextCursor: res.headers["x-next-cursor"] ?? null };
   }
 }
 
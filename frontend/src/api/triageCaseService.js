@@ -26,8 +26,18 @@ class TriageCaseService {
     return res.data;
   }
 
-  async getCaseChangelog(id) {
-    const res = await apiClient.get(`/triage-cases/${id}/changelog`);
+  async getCaseChangelog(id, { limit, cursor, field } = {}) {
+    const res = await apiClient.get(`/triage-cases/${id}/changelog`, {
+      params: { limit, cursor, field },
+    });
+    // one page, newest first; nextCursor is null on the last page
+    return { entries: res.data, nextCursor: res.headers["x-next-cursor"] ?? null };
+  }
+
+  async getCaseTimeline(id, { limit, cursor } = {}) {
+    const res = await apiClient.get(`/triage-cases/${id}/timeline`, {
+      params: { limit, cursor },
+    });
     return res.data;
   }
 
@@ -47,10 +47,24 @@ const HISTORY_VIEWS = {
   PATIENT: "patient",
 };
 
+const HISTORY_PAGE_SIZE = 100;
+const EMPTY_FEED = { entries: [], nextCursor: null };
+
+// entries older than this may still be missing from a feed that has more pages
+const feedHorizon = (feed) =>
+  feed.nextCursor && feed.entries.length > 0
+    ? new Date(feed.entries[feed.entries.length - 1].changedAt)
+    : null;
+
 export const CaseHistory = ({ caseId, patientId, handleClose }) => {
   const [historyView, setHistoryView] = useState(HISTORY_VIEWS.COMBINED);
-  const [history, setHistory] = useState([]);
+  // one keyset-paginated feed per changelog; each holds the pages loaded so far and its next cursor
+  const [feeds, setFeeds] = useState({
+    [HISTORY_VIEWS.CASE]: EMPTY_FEED,
+    [HISTORY_VIEWS.PATIENT]: EMPTY_FEED,
+  });
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [selectedUsers, setSelectedUsers] = useState([]);
   const [selectedFields, setSelectedFields] = useState([]);
   const [startDate, setStartDate] = useState(null);
@@ -81,40 +95,98 @@ export const CaseHistory = ({ caseId, patientId, handleClose }) => {
     setPage(1);
   };
 
+  const fetchFeedPage = async (source, cursor) => {
+    const page =
+      source === HISTORY_VIEWS.CASE
+        ? await triageCaseService.getCaseChangelog(caseId, {
+            limit: HISTORY_PAGE_SIZE,
+            cursor,
+          })
+        : await patientService.getPatientChangelog(patientId, {
+            limit: HISTORY_PAGE_SIZE,
+            cursor,
+          });
+    const entries = (page.entries || []).map((entry) => ({
+      ...entry,
+      source,
+      entityType: source === HISTORY_VIEWS.CASE ? "Case Details" : "Patient",
+    }));
+    return { entries, nextCursor: page.nextCursor };
+  };
+
   const loadHistory = async () => {
     if (!caseId || !patientId) return;
     setLoading(true);
     try {
-      const [caseHistory, patientHistory] = await Promise.all([
-        triageCaseService.getCaseChangelog(caseId),
-        patientService.getPatientChangelog(patientId),
+      const [caseFeed, patientFeed] = await Promise.all([
+        fetchFeedPage(HISTORY_VIEWS.CASE),
+        fetchFeedPage(HISTORY_VIEWS.PATIENT),
       ]);
+      setFeeds({
+        [HISTORY_VIEWS.CASE]: caseFeed,
+        [HISTORY_VIEWS.PATIENT]: patientFeed,
+      });
+    } catch (error) {
+      console.error("Failed to load history:", error);
+      setFeeds({
+        [HISTORY_VIEWS.CASE]: EMPTY_FEED,
+        [HISTORY_VIEWS.PATIENT]: EMPTY_FEED,
+      });
+    } finally {
+      setLoading(false);
+    }
+  };
 
-      const caseEntries = (caseHistory || []).map((entry) => ({
-        ...entry,
-        source: HISTORY_VIEWS.CASE,
-        entityType: "Case Details",
-      }));
-
-      const patientEntries = (patientHistory || []).map((entry) => ({
-        ...entry,
-        source: HISTORY_VIEWS.PATIENT,
-        entityType: "Patient",
-      }));
+  const visibleSources =
+    historyView === HISTORY_VIEWS.COMBINED
+      ? [HISTORY_VIEWS.CASE, HISTORY_VIEWS.PATIENT]
+      : [historyView];
+  const hasMore = visibleSources.some((source) => feeds[source].nextCursor);
 
-      const combined = [...caseEntries, ...patientEntries].sort(
-        (a, b) => new Date(b.changedAt) - new Date(a.changedAt),
+  const loadMore = async () => {
+    setLoadingMore(true);
+    try {
+      const sources = visibleSources.filter(
+        (source) => feeds[source].nextCursor,
       );
-
-      setHistory(combined);
+      const pages = await Promise.all(
+        sources.map((source) =>
+          fetchFeedPage(source, feeds[source].nextCursor),
+        ),
+      );
+      setFeeds((current) => {
+        const next = { ...current };
+        sources.forEach((source, index) => {
+          next[source] = {
+            entries: [...current[source].entries, ...pages[index].entries],
+            nextCursor: pages[index].nextCursor,
+          };
+        });
+        return next;
+      });
     } catch (error) {
-      console.error("Failed to load history:", error);
-      setHistory([]);
+      console.error("Failed to load more history:", error);
     } finally {
-      setLoading(false);
+      setLoadingMore(false);
     }
   };
 
+  // Merged newest first. While a feed has more pages, the other feed's older entries are held back
+  // so the combined timeline never skips over changes that haven't been fetched yet.
+  const history = useMemo(() => {
+    const horizons = visibleSources
+      .map((source) => feedHorizon(feeds[source]))
+      .filter(Boolean);
+    const cutoff =
+      horizons.length > 0 ? Math.max(...horizons.map(Number)) : null;
+    return visibleSources
+      .flatMap((source) => feeds[source].entries)
+      .filter(
+        (entry) => cutoff === null || new Date(entry.changedAt) >= cutoff,
+      )
+      .sort((a, b) => new Date(b.changedAt) - new Date(a.changedAt));
+  }, [feeds, historyView]);
+
   const handleHistoryViewChange = (event, newView) => {
     if (newView !== null) {
       setHistoryView(newView);
@@ -544,6 +616,18 @@ export const CaseHistory = ({ caseId, patientId, handleClose }) => {
           </Grid>
         </>
       )}
+      {hasMore && (
+        <Box display="flex" justifyContent="center" py={2}>
+          <Button
+            onClick={loadMore}
+            disabled={loadingMore}
+            variant="outlined"
+            size="small"
+          >
+            {loadingMore ? <CircularProgress size={20} /> : "Load older changes"}
+          </Button>
+        </Box>
+      )}
       <Divider />
       <Box display="flex" justifyContent="flex-end">
         <Button onClick={handleClose}>Close</Button>